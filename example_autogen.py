@@ -8,13 +8,30 @@ Usage:
 """
 
 import os
-import yaml
 import json
+import queue
+import atexit
 import logging
+import logging.handlers
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 from src.autogen_orchestrator import AutoGenOrchestrator
+from src.config_loader import load_yaml_config
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Visual separators
+_SEP70 = "=" * 70
+_DASH70 = "-" * 70
+_SEP80 = "=" * 80
+_DASH80 = "-" * 80
 
 
 def setup_logging():
@@ -22,12 +39,26 @@ def setup_logging():
     # Create logs directory if it doesn't exist
     os.makedirs("logs", exist_ok=True)
 
+    # File writes happen on a background listener thread; callers only enqueue records
+    file_handler = logging.FileHandler("logs/example.log", delay=True)
+    file_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    file_handler.stream = open("logs/example.log", "a", encoding="utf-8", buffering=1 << 16)
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # INFO by default; set LOG_LEVEL=DEBUG (e.g. in .env) for detailed tool call logging.
+    # Expensive debug payloads should be guarded with logger.isEnabledFor(logging.DEBUG).
+    load_environment()
+    level = getattr(logging, os.environ.get("LOG_LEVEL", "INFO").upper(), logging.INFO)
+
     logging.basicConfig(
-        level=logging.DEBUG,  # Changed to DEBUG for detailed tool call logging
+        level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler("logs/example.log")
+            logging.handlers.QueueHandler(log_queue)
         ]
     )
 
@@ -36,30 +67,156 @@ def setup_logging():
     logging.getLogger("httpx").setLevel(logging.WARNING)  # Reduce HTTP noise
 
 
+@lru_cache(maxsize=1)
+def load_environment():
+    """Load environment variables from .env (only once per process)."""
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.yaml."""
-    with open("config.yaml", "r") as f:
-        return yaml.safe_load(f)
+    """Load configuration from config.yaml (parsed once and shared by all examples)."""
+    return load_yaml_config("config.yaml")
 
 
 def print_separator(title: str = ""):
     """Print a visual separator."""
     if title:
-        print(f"\n{'=' * 70}")
-        print(f"{title:^70}")
-        print(f"{'=' * 70}\n")
+        print(f"\n{_SEP70}\n{title:^70}\n{_SEP70}\n")
+    else:
+        print(f"{_SEP70}\n")
+
+
+def _truncate_long_strings(root, max_string_length=50000):
+    """
+    Truncate very long strings anywhere in a nested dict/list structure.
+
+    The tree is scanned once with an explicit stack. In the common case where
+    nothing exceeds the limit the original object is returned untouched, so no
+    containers are copied; otherwise only the long strings are rewritten in a
+    copy, leaving the caller's result dict intact.
+    """
+    def truncate(obj):
+        if isinstance(obj, Mapping):
+            return {k: truncate(v) for k, v in obj.items()}
+        elif isinstance(obj, (list, tuple)):
+            return [truncate(item) for item in obj]
+        elif isinstance(obj, str) and len(obj) > max_string_length:
+            return obj[:max_string_length] + f"\n... [truncated, original length: {len(obj)} characters]"
+        return obj
+
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for child in (node.values() if isinstance(node, Mapping) else node):
+            if isinstance(child, str):
+                if len(child) > max_string_length:
+                    return truncate(root)
+            elif isinstance(child, (Mapping, list, tuple)):
+                stack.append(child)
+    return root
+
+
+def _force_serialize(obj):
+    """Convert everything that is not a JSON primitive to a string."""
+    if isinstance(obj, Mapping):
+        return {str(k): _force_serialize(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_force_serialize(item) for item in obj]
+    elif isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
     else:
-        print(f"{'=' * 70}\n")
+        return str(obj)
+
+
+def _json_default(obj):
+    """Encode read-only mappings (e.g. conversation history entries) as objects, anything else as a string."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def _to_json_bytes(obj, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_json_default).encode("utf-8")
+
 
+def _encode_truncated(obj, indent: bool = False, max_string_length=50000) -> bytes:
+    """
+    Encode an object, truncating over-long strings only when one can exist.
 
-def save_conversation_output(result: dict, query: str, output_dir: str = "outputs"):
+    A string longer than the limit encodes to more bytes than the limit, so if
+    the encoded payload fits within it the object is already clean and is
+    returned as-is without a Python-level walk.
+    """
+    payload = _to_json_bytes(obj, indent)
+    if len(payload) > max_string_length:
+        truncated = _truncate_long_strings(obj, max_string_length)
+        if truncated is not obj:
+            payload = _to_json_bytes(truncated, indent)
+    return payload
+
+
+def _jsonl_bytes(records) -> bytes:
+    """Encode records as a JSON Lines block (one object per line)."""
+    lines = []
+    for record in records:
+        try:
+            lines.append(_encode_truncated(record))
+        except (TypeError, ValueError):
+            lines.append(_encode_truncated(_force_serialize(record)))
+        lines.append(b"\n")
+    return b"".join(lines)
+
+
+def append_jsonl(history_file, records) -> None:
     """
-    Save the full conversation output to both text and JSON files.
+    Append records to an open binary file as JSON Lines (one object per line).
+
+    Args:
+        history_file: File object opened in binary append/write mode
+        records: Iterable of JSON-serializable records (e.g. conversation messages)
+    """
+    history_file.write(_jsonl_bytes(records))
+
+
+def load_jsonl(path) -> list:
+    """
+    Load a JSON Lines file (e.g. a saved conversation history).
+
+    Args:
+        path: Path to the .jsonl file
+
+    Returns:
+        List of records, one per non-empty line
+    """
+    with open(path, "rb") as f:
+        if ORJSON_AVAILABLE:
+            return [orjson.loads(line) for line in f if line.strip()]
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_conversation_output(result: dict, query: str, output_dir: str = "outputs", history_file=None,
+                             pretty: bool = False):
+    """
+    Save the conversation output as a text summary, a small metadata JSON file,
+    and the conversation history as JSON Lines.
 
     Args:
         result: The result dictionary from orchestrator.process_query()
         query: The original query
         output_dir: Directory to save the output files
+        history_file: Optional open binary file to append the history to instead of
+            creating a new .jsonl file (lets callers stream several runs into one file)
+        pretty: Indent the metadata JSON for human reading (compact by default)
+
+    Returns:
+        Tuple of (text file path, metadata JSON path, history JSONL path)
     """
     # Create outputs directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
@@ -68,113 +225,73 @@ def save_conversation_output(result: dict, query: str, output_dir: str = "output
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     timestamp_readable = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-    # Save as JSON
-    json_filename = f"conversation_{timestamp}.json"
-    json_filepath = os.path.join(output_dir, json_filename)
-
-    # Prepare JSON data - convert conversation history to serializable format
-    def make_serializable(obj, max_string_length=50000):
-        """Recursively convert objects to JSON-serializable format."""
-        if isinstance(obj, dict):
-            return {k: make_serializable(v, max_string_length) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [make_serializable(item, max_string_length) for item in obj]
-        elif isinstance(obj, str):
-            # Truncate very long strings to prevent JSON serialization issues
-            if len(obj) > max_string_length:
-                return obj[:max_string_length] + f"\n... [truncated, original length: {len(obj)} characters]"
-            return obj
-        elif isinstance(obj, (int, float, bool, type(None))):
-            return obj
-        else:
-            # Convert non-serializable objects to string representation
-            return str(obj)
-
-    # Convert all data to serializable format, including metadata
-    conversation_history = result.get("conversation_history", [])
-    metadata = result.get("metadata", {})
-
-    # Make everything serializable
-    serializable_history = make_serializable(conversation_history)
-    serializable_metadata = make_serializable(metadata)
-    serializable_response = make_serializable(result.get("response", ""))
+    meta_filepath = os.path.join(output_dir, f"conversation_{timestamp}.meta.json")
 
+    # Prepare JSON data - only long strings need rewriting (done while encoding);
+    # everything else (datetimes, UUIDs, tool-call objects) is handled by the
+    # encoder's default hook
     json_data = {
         "timestamp": timestamp_readable,
         "query": query,
-        "metadata": serializable_metadata,
-        "response": serializable_response,
+        "metadata": result.get("metadata", {}),
+        "response": result.get("response", ""),
         "error": result.get("error"),
-        "conversation_history": serializable_history
     }
+    conversation_history = result.get("conversation_history", [])
 
-    # Write JSON file with error handling
+    # Write metadata file with error handling
     try:
-        with open(json_filepath, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+        payload = _encode_truncated(json_data, indent=pretty)
     except (TypeError, ValueError) as e:
         # If serialization fails, try with more aggressive conversion
         print(f"Warning: JSON serialization issue: {e}")
         print("Attempting fallback serialization...")
+        payload = _encode_truncated(_force_serialize(json_data), indent=pretty)
+    Path(meta_filepath).write_bytes(payload)
 
-        # Fallback: convert everything to strings if needed
-        def force_serialize(obj):
-            if isinstance(obj, dict):
-                return {str(k): force_serialize(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [force_serialize(item) for item in obj]
-            elif isinstance(obj, (str, int, float, bool, type(None))):
-                return obj
-            else:
-                return str(obj)
-
-        json_data_fallback = force_serialize(json_data)
-        with open(json_filepath, 'w', encoding='utf-8') as f:
-            json.dump(json_data_fallback, f, indent=2, ensure_ascii=False)
+    # Write conversation history as JSON Lines, one message per line
+    if history_file is not None:
+        append_jsonl(history_file, conversation_history)
+        jsonl_filepath = getattr(history_file, "name", None)
+    else:
+        jsonl_filepath = os.path.join(output_dir, f"conversation_{timestamp}.jsonl")
+        Path(jsonl_filepath).write_bytes(_jsonl_bytes(conversation_history))
 
     # Save as text
     txt_filename = f"conversation_{timestamp}.txt"
     txt_filepath = os.path.join(output_dir, txt_filename)
 
     # Format the output
-    output_lines = []
-    output_lines.append("=" * 80)
-    output_lines.append("CONVERSATION OUTPUT")
-    output_lines.append("=" * 80)
-    output_lines.append(f"Timestamp: {timestamp_readable}")
-    output_lines.append(f"Query: {query}")
-    output_lines.append("")
+    text = f"{_SEP80}\nCONVERSATION OUTPUT\n{_SEP80}\nTimestamp: {timestamp_readable}\nQuery: {query}\n\n"
 
     # Add metadata
     if "metadata" in result:
-        output_lines.append("METADATA")
-        output_lines.append("-" * 80)
         metadata = result["metadata"]
-        output_lines.append(f"Messages exchanged: {metadata.get('num_messages', 'N/A')}")
-        output_lines.append(f"Sources gathered: {metadata.get('num_sources', 'N/A')}")
-        output_lines.append(f"Agents involved: {', '.join(metadata.get('agents_involved', []))}")
-        output_lines.append("")
+        text += (
+            f"METADATA\n{_DASH80}\n"
+            f"Messages exchanged: {metadata.get('num_messages', 'N/A')}\n"
+            f"Sources gathered: {metadata.get('num_sources', 'N/A')}\n"
+            f"Agents involved: {', '.join(metadata.get('agents_involved', []))}\n\n"
+        )
 
     # Add final response
-    output_lines.append("FINAL RESPONSE")
-    output_lines.append("-" * 80)
     if "error" in result:
-        output_lines.append(f"ERROR: {result['error']}")
+        final_response = f"ERROR: {result['error']}"
     else:
-        output_lines.append(result.get('response', 'No response generated'))
-    output_lines.append("")
+        final_response = result.get('response', 'No response generated')
+    text += f"FINAL RESPONSE\n{_DASH80}\n{final_response}\n"
 
-    # Note: Full conversation history is available in the JSON file
+    # Note: Full conversation history is available in the JSONL file
     # We only include query, response, and metadata in the text/markdown file
 
-    # Write text file
-    with open(txt_filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(output_lines))
+    # Write text file in a single write
+    Path(txt_filepath).write_text(text, encoding='utf-8')
 
     print(f"\n✓ Full conversation saved to:")
     print(f"  - Text: {txt_filepath}")
-    print(f"  - JSON: {json_filepath}")
-    return txt_filepath, json_filepath
+    print(f"  - Metadata: {meta_filepath}")
+    print(f"  - History: {jsonl_filepath}")
+    return txt_filepath, meta_filepath, jsonl_filepath
 
 
 def run_single_query():
@@ -186,7 +303,7 @@ def run_single_query():
     print_separator("Example 1: Single Research Query")
 
     # Load environment and config
-    load_dotenv()
+    load_environment()
     config = load_config()
 
     # Create orchestrator
@@ -224,11 +341,13 @@ def run_multiple_queries():
     """
     Example 2: Process multiple queries in sequence.
 
-    Shows how to reuse the orchestrator for multiple queries.
+    Shows how to reuse the orchestrator for multiple queries. Each result is
+    saved to disk as soon as it completes and only a light summary is kept in
+    memory; load the full history back with load_jsonl(summary["path"]).
     """
     print_separator("Example 2: Multiple Research Queries")
 
-    load_dotenv()
+    load_environment()
     config = load_config()
 
     # Create orchestrator once
@@ -241,24 +360,33 @@ def run_multiple_queries():
         "What are key factors to keep in mind when designing AI-driven personalized learning systems?",
     ]
 
-    results = []
+    summaries = []
 
     for i, query in enumerate(queries, 1):
         print(f"\n[Query {i}/{len(queries)}] {query}")
-        print("-" * 70)
+        print(_DASH70)
 
         result = orchestrator.process_query(query, max_turns=None)  # Uses config value (8)
-        results.append(result)
 
         # Print brief summary
         if "error" not in result:
             response_preview = result['response'][:200] + "..."
             print(f"Response preview: {response_preview}\n")
 
+        # Persist the full transcript now and keep only a summary resident
+        paths = save_conversation_output(result, query)
+        summaries.append({
+            "query": query,
+            "error": result.get("error"),
+            "num_messages": result.get("metadata", {}).get("num_messages"),
+            "path": paths[2],
+        })
+        del result
+
     print_separator("Summary")
     print(f"Processed {len(queries)} queries successfully")
 
-    return results
+    return summaries
 
 
 def inspect_conversation():
@@ -269,7 +397,7 @@ def inspect_conversation():
     """
     print_separator("Example 3: Inspecting Conversation History")
 
-    load_dotenv()
+    load_environment()
     config = load_config()
 
     orchestrator = AutoGenOrchestrator(config)
@@ -306,7 +434,7 @@ def view_workflow():
     """
     print_separator("Example 4: Workflow Visualization")
 
-    load_dotenv()
+    load_environment()
     config = load_config()
 
     orchestrator = AutoGenOrchestrator(config)
@@ -328,15 +456,20 @@ def check_setup():
     """
     print_separator("Setup Check")
 
-    load_dotenv()
+    load_environment()
+
+    # One directory listing instead of a stat() per file
+    with os.scandir(".") as it:
+        entries = {entry.name for entry in it}
+    env = os.environ
 
     checks = {
-        "Environment file (.env)": os.path.exists(".env"),
-        "Config file (config.yaml)": os.path.exists("config.yaml"),
-        "Logs directory": os.path.exists("logs"),
-        "GROQ_API_KEY": bool(os.getenv("GROQ_API_KEY")),
-        "OPENAI_API_KEY": bool(os.getenv("OPENAI_API_KEY")),
-        "TAVILY_API_KEY": bool(os.getenv("TAVILY_API_KEY")),
+        "Environment file (.env)": ".env" in entries,
+        "Config file (config.yaml)": "config.yaml" in entries,
+        "Logs directory": "logs" in entries,
+        "GROQ_API_KEY": bool(env.get("GROQ_API_KEY")),
+        "OPENAI_API_KEY": bool(env.get("OPENAI_API_KEY")),
+        "TAVILY_API_KEY": bool(env.get("TAVILY_API_KEY")),
     }
 
     print("Configuration Status:\n")
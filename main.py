@@ -9,9 +9,7 @@ Usage:
 """
 
 import argparse
-import asyncio
 import sys
-from pathlib import Path
 
 
 def run_cli():
@@ -29,8 +27,8 @@ def run_web():
 
 async def run_evaluation():
     """Run system evaluation using LLM-as-a-Judge."""
-    import yaml
     from dotenv import load_dotenv
+    from src.config_loader import load_yaml_config
     from src.autogen_orchestrator import AutoGenOrchestrator
     from src.evaluation.evaluator import SystemEvaluator
 
@@ -38,8 +36,7 @@ async def run_evaluation():
     load_dotenv()
 
     # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_config("config.yaml")
 
     # Check if evaluation is enabled
     eval_config = config.get("evaluation", {})
@@ -70,8 +67,11 @@ async def run_evaluation():
         print(f"  - {criterion.get('name')} (weight: {criterion.get('weight', 0)})")
     print("\nStarting evaluation...\n")
 
-    # Run evaluation
-    report = await evaluator.evaluate_system(test_queries_path)
+    # Run evaluation (closing the judge's connection pool afterwards)
+    try:
+        report = await evaluator.evaluate_system(test_queries_path)
+    finally:
+        await evaluator.aclose()
 
     # Display results
     print("\n" + "=" * 70)
@@ -145,6 +145,7 @@ def main():
     elif args.mode == "web":
         run_web()
     elif args.mode == "evaluate":
+        import asyncio
         asyncio.run(run_evaluation())
     elif args.mode == "autogen":
         run_autogen()
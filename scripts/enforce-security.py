@@ -5,22 +5,45 @@ This can be used as a server-side hook or in CI/CD for strict enforcement.
 """
 
 import os
+import re
 import sys
+import mmap
+import shutil
+import threading
 import subprocess  # nosec B404 - Security script, subprocess needed
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import StringIO
 from pathlib import Path
 
 
+# Common API key patterns, compiled once into a single alternation
+API_KEY_PATTERNS = [
+    r"api[_-]?key\s*=\s*['\"][^'\"]{20,}['\"]",
+    r"GROQ_API_KEY\s*=\s*['\"]gsk_[^'\"]+['\"]",
+    r"OPENAI_API_KEY\s*=\s*['\"]sk-[^'\"]+['\"]",
+    r"TAVILY_API_KEY\s*=\s*['\"][^'\"]{30,}['\"]",
+]
+API_KEY_RE = re.compile(b"|".join(b"(?:" + p.encode() + b")" for p in API_KEY_PATTERNS))
+SCANNED_EXTENSIONS = (".py", ".js", ".ts")
+
+
+LARGE_FILE_THRESHOLD = 1 << 20  # 1 MiB
+
+
 def run_command(cmd, check=True):
-    """Run a command and return the result."""
-    result = subprocess.run(
-        cmd,
-        shell=True,  # nosec B602 - Security script, shell=True needed for command execution
-        capture_output=True,
-        text=True
-    )
+    """Run a command (argv list, no shell) and return the result."""
+    try:
+        result = subprocess.run(  # nosec B603 - Fixed argv, no user input
+            cmd,
+            capture_output=True,
+            text=True
+        )
+    except FileNotFoundError as e:
+        result = subprocess.CompletedProcess(cmd, 127, stdout="", stderr=str(e))
     if check and result.returncode != 0:
-        print(f"❌ Command failed: {cmd}")
+        print(f"❌ Command failed: {' '.join(cmd)}")
         print(f"Error: {result.stderr}")
         return False
     return result
@@ -30,7 +53,7 @@ def check_for_secrets():
     """Run detect-secrets to find hardcoded secrets."""
     print("🔍 Scanning for hardcoded secrets...")
 
-    result = run_command("detect-secrets scan --baseline .secrets.baseline", check=False)
+    result = run_command(["detect-secrets", "scan", "--baseline", ".secrets.baseline"], check=False)
 
     if result.returncode != 0:
         print("⚠️  Potential secrets detected!")
@@ -41,28 +64,78 @@ def check_for_secrets():
     return True
 
 
-def check_for_api_keys_in_code():
+def iter_source_files(root):
+    """Yield paths of scannable source files under root (single os.scandir walk)."""
+    if not os.path.isdir(root):
+        return
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(SCANNED_EXTENSIONS):
+                    yield entry.path
+
+
+def list_tracked_files():
+    """
+    List tracked files with a single `git ls-files -z` call.
+
+    Returns:
+        List of repository-relative paths, or None when git is unavailable
+    """
+    result = run_command(["git", "ls-files", "-z"], check=False)
+    if result.returncode != 0:
+        return None
+    return [path for path in result.stdout.split("\0") if path]
+
+
+def list_untracked_files(root):
+    """
+    List untracked, non-ignored files under root with `git ls-files -z --others`.
+
+    Returns:
+        List of repository-relative paths (empty when git is unavailable)
+    """
+    result = run_command(["git", "ls-files", "-z", "--others", "--exclude-standard", "--", root], check=False)
+    if result.returncode != 0:
+        return []
+    return [path for path in result.stdout.split("\0") if path]
+
+
+def check_for_api_keys_in_code(tracked_files=None):
     """Additional check for common API key patterns."""
     print("🔍 Checking for API key patterns...")
 
-    patterns = [
-        r"api[_-]?key\s*=\s*['\"][^'\"]{20,}['\"]",
-        r"GROQ_API_KEY\s*=\s*['\"]gsk_[^'\"]+['\"]",
-        r"OPENAI_API_KEY\s*=\s*['\"]sk-[^'\"]+['\"]",
-        r"TAVILY_API_KEY\s*=\s*['\"][^'\"]{30,}['\"]",
-    ]
-
     issues_found = False
 
-    for pattern in patterns:
-        result = run_command(
-            f"grep -rE '{pattern}' --include='*.py' --include='*.js' --include='*.ts' src/ 2>/dev/null || true",
-            check=False
-        )
-        if result and result.stdout:
-            print(f"⚠️  Found potential API key pattern:")
-            print(result.stdout)
-            issues_found = True
+    if tracked_files is None:
+        source_files = iter_source_files("src")
+    else:
+        # New files that haven't been added yet can hold keys too
+        source_files = [
+            path for path in tracked_files + list_untracked_files("src")
+            if path.startswith("src/") and path.endswith(SCANNED_EXTENSIONS)
+        ]
+
+    for path in source_files:
+        try:
+            f = open(path, "rb")
+        except OSError:
+            # Tracked but deleted from the working tree
+            continue
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                continue
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in API_KEY_RE.finditer(mm):
+                    line_start = mm.rfind(b"\n", 0, match.start()) + 1
+                    line_end = mm.find(b"\n", match.end())
+                    line = mm[line_start:line_end if line_end != -1 else len(mm)]
+                    print(f"⚠️  Found potential API key pattern:")
+                    print(f"{path}:{line.decode('utf-8', errors='replace')}")
+                    issues_found = True
 
     if not issues_found:
         print("✅ No API key patterns found in code")
@@ -71,13 +144,11 @@ def check_for_api_keys_in_code():
     return False
 
 
-def check_env_file_not_committed():
+def check_env_file_not_committed(tracked_files=None):
     """Ensure .env file is not in git."""
     print("🔍 Checking if .env is properly ignored...")
 
-    result = run_command("git ls-files | grep -E '^\\.env$' || true", check=False)
-
-    if result and result.stdout.strip():
+    if tracked_files is not None and ".env" in set(tracked_files):
         print("❌ ERROR: .env file is tracked by git!")
         print("   Run: git rm --cached .env")
         return False
@@ -86,14 +157,29 @@ def check_env_file_not_committed():
     return True
 
 
-def check_large_files():
+def _walk_working_tree():
+    """Yield every file path in the working tree, skipping the .git directory."""
+    for dirpath, dirnames, filenames in os.walk("."):
+        # Never descend into git's object store
+        if ".git" in dirnames:
+            dirnames.remove(".git")
+        for name in filenames:
+            yield os.path.join(dirpath, name)
+
+
+def check_large_files(tracked_files=None):
     """Check for accidentally committed large files."""
     print("🔍 Checking for large files...")
 
-    result = run_command("find . -type f -size +1M | grep -v '.git' || true", check=False)
+    files = []
+    for path in (_walk_working_tree() if tracked_files is None else tracked_files):
+        try:
+            if os.stat(path, follow_symlinks=False).st_size > LARGE_FILE_THRESHOLD:
+                files.append(path)
+        except OSError:
+            continue
 
-    if result and result.stdout.strip():
-        files = result.stdout.strip().split('\n')
+    if files:
         print(f"⚠️  Found {len(files)} large file(s):")
         for f in files[:5]:  # Show first 5
             print(f"   - {f}")
@@ -110,12 +196,11 @@ def run_gitleaks():
     print("🔍 Running gitleaks scan...")
 
     # Check if gitleaks is installed
-    result = run_command("which gitleaks || true", check=False)
-    if not result or not result.stdout.strip():
+    if shutil.which("gitleaks") is None:
         print("⚠️  Gitleaks not installed, skipping...")
         return True
 
-    result = run_command("gitleaks detect --no-git -v", check=False)
+    result = run_command(["gitleaks", "detect", "--no-git", "-v"], check=False)
 
     if result.returncode != 0:
         print("❌ Gitleaks found potential secrets!")
@@ -126,24 +211,74 @@ def run_gitleaks():
     return True
 
 
+class _ThreadRoutedStdout:
+    """
+    Stand-in for sys.stdout that sends each worker thread's output to its own
+    buffer, so checks running in parallel don't interleave their messages.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer):
+        self._local.buffer = buffer
+
+    def write(self, text):
+        return getattr(self._local, "buffer", self._stream).write(text)
+
+    def flush(self):
+        getattr(self._local, "buffer", self._stream).flush()
+
+
+def run_checks_parallel(checks):
+    """
+    Run independent checks concurrently and return [(name, passed, output)] in
+    the original order. Checks are IO-bound (subprocesses, file walks), so
+    threads overlap their waits.
+    """
+    router = _ThreadRoutedStdout(sys.stdout)
+
+    def run_one(check_func):
+        buffer = StringIO()
+        router.capture(buffer)
+        try:
+            return check_func(), buffer.getvalue()
+        except Exception as e:
+            buffer.write(f"❌ Check raised an error: {e}\n")
+            return False, buffer.getvalue()
+
+    original_stdout = sys.stdout
+    sys.stdout = router
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [(name, executor.submit(run_one, check_func)) for name, check_func in checks]
+            return [(name, *future.result()) for name, future in futures]
+    finally:
+        sys.stdout = original_stdout
+
+
 def main():
     """Run all security checks."""
     print("\n" + "="*60)
     print("🛡️  SECURITY ENFORCEMENT CHECK")
     print("="*60 + "\n")
 
+    # Enumerate tracked files once and share the list with the file-based checks
+    tracked_files = list_tracked_files()
+
     checks = [
         ("Secret Detection", check_for_secrets),
-        ("API Key Patterns", check_for_api_keys_in_code),
-        (".env File Check", check_env_file_not_committed),
-        ("Large Files Check", check_large_files),
+        ("API Key Patterns", partial(check_for_api_keys_in_code, tracked_files)),
+        (".env File Check", partial(check_env_file_not_committed, tracked_files)),
+        ("Large Files Check", partial(check_large_files, tracked_files)),
         ("GitLeaks Scan", run_gitleaks),
     ]
 
     results = []
-    for name, check_func in checks:
+    for name, passed, output in run_checks_parallel(checks):
         print(f"\n--- {name} ---")
-        passed = check_func()
+        print(output, end="")
         results.append((name, passed))
         print()
 
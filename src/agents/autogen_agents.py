@@ -9,17 +9,35 @@ https://microsoft.github.io/autogen/stable/user-guide/agentchat-user-guide/examp
 """
 
 import os
+import re
+import json
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache, partial, wraps
+from types import MappingProxyType
+from typing import Dict, Any, Final, List, Optional, Sequence
+import httpx
+from openai import DefaultAsyncHttpxClient
 from autogen_agentchat.agents import AssistantAgent
-from autogen_agentchat.teams import RoundRobinGroupChat
-from autogen_agentchat.conditions import TextMentionTermination
+from autogen_agentchat.teams import SelectorGroupChat
+from autogen_agentchat.base import TerminationCondition
+from autogen_agentchat.messages import StopMessage
 from autogen_core.tools import FunctionTool
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_core.models import ModelFamily
+
+try:
+    import h2  # noqa: F401 - enables httpx's HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Import our research tools
 from src.tools.web_search import web_search
 from src.tools.paper_search import paper_search
+from src.tools.multi_search import multi_search
 from src.tools.citation_tool import (
     format_citation,
     add_citation,
@@ -32,13 +50,296 @@ from src.tools.citation_tool import (
 # Set up logger for autogen agents
 logger = logging.getLogger("agents.autogen")
 
+# Model clients and their HTTP connection pool are bound to the event loop that first
+# uses them, so they are kept per running loop (entries disappear when the loop is
+# garbage collected)
+_LOOP_STATE: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_NO_LOOP_STATE: Dict[str, Any] = {}
+
+# Keep-alive pool shared by every agent's model client on a loop (multiplexed over
+# HTTP/2 when h2 is installed)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=60)
+
+# Fixed hand-off order for the research team. The Planner only speaks first; after a
+# Critic review the Writer revises directly (approval ends the run via termination).
+_NEXT_SPEAKER = {
+    "Planner": "Researcher",
+    "Researcher": "Writer",
+    "Writer": "Critic",
+    "Critic": "Writer",
+}
+
+# Per-provider client settings. model_info templates are read-only and copied per
+# client with the configured max_tokens added; base_url None means OPENAI_BASE_URL.
+# key_field names the _AgentEnv attribute holding the provider's API key.
+_PROVIDER_TEMPLATES = MappingProxyType({
+    # Groq (uses OpenAI-compatible API)
+    "groq": MappingProxyType({
+        "env": "GROQ_API_KEY",
+        "key_field": "groq_api_key",
+        "base_url": "https://api.groq.com/openai/v1",
+        "default_model": "openai/gpt-oss-20b",
+        "model_info": MappingProxyType({
+            "json_output": True,
+            "vision": False,
+            "function_calling": True,
+            "structured_output": True,
+            "family": ModelFamily.GPT_4O,
+        }),
+    }),
+    "openai": MappingProxyType({
+        "env": "OPENAI_API_KEY",
+        "key_field": "openai_api_key",
+        "base_url": None,
+        "default_model": "gpt-4o-mini",
+        "model_info": MappingProxyType({
+            "vision": False,
+            "function_calling": True,
+            "json_output": True,
+            "structured_output": True,
+        }),
+    }),
+    "vllm": MappingProxyType({
+        "env": "OPENAI_API_KEY",
+        "key_field": "openai_api_key",
+        "base_url": None,
+        "default_model": "gpt-4o-mini",
+        "model_info": MappingProxyType({
+            "vision": False,
+            "function_calling": True,
+            "json_output": True,
+            "family": ModelFamily.GPT_4O,
+            "structured_output": True,
+        }),
+    }),
+})
+
+# Phrase the Critic ends its review with when the response is accepted
+_APPROVED = "APPROVED - RESEARCH COMPLETE"
+
+# Structured Critic verdict (agents.critic.json_verdict). "decision" is the last
+# property, so approval can still be detected by scanning the message tail; the
+# quoted token cannot appear unescaped inside the feedback string.
+_APPROVED_DECISION = '"APPROVED"'
+_CRITIC_VERDICT_MAX_TOKENS = 250
+_RESPONSE_FORMATS = MappingProxyType({
+    "critic_verdict": {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "critic_verdict",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "feedback": {"type": "string"},
+                    "decision": {"type": "string", "enum": ["APPROVED", "NEEDS_REVISION"]},
+                },
+                "required": ["feedback", "decision"],
+                "additionalProperties": False,
+            },
+        },
+    },
+})
+
+# Default system prompts, used when config.yaml leaves an agent's prompt empty
+# or at its placeholder value
+_DEFAULT_PLANNER_PROMPT: Final[str] = """Research planner. Break down queries into actionable steps (150-200 words max). You have NO tools - only create plans. Steps: 1) Analyze concepts, 2) Determine source types, 3) Suggest search queries, 4) Outline synthesis. Provide numbered steps. End with "PLAN COMPLETE"."""
+_DEFAULT_RESEARCHER_PROMPT: Final[str] = """Researcher. Gather credible info from papers and web (200-300 words max). Tools work automatically - describe needs in natural language. Select ONLY top 8 sources: prioritize by relevance score (web) or citations/recency (papers). Process: 1) Review plan, 2) State info needs, 3) Select 8 most relevant, 4) Extract findings, 5) Note citations. End with "RESEARCH COMPLETE"."""
+_DEFAULT_WRITER_PROMPT: Final[str] = """Writer for Ethical AI in Education. Synthesize Researcher's findings (400-600 words max). Structure: Brief intro → logical sections → APA citations → References. Paraphrase, don't copy. Citation tools work automatically - reference sources naturally. If Critic says "NEEDS REVISION", address feedback. If "APPROVED - RESEARCH COMPLETE", done."""
+_DEFAULT_CRITIC_PROMPT: Final[str] = """Peer reviewer. Evaluate for relevance, credible/well-cited sources, completeness, accuracy, clarity, synthesis, appropriate length (400-600 words). Provide specific constructive feedback. End with "APPROVED - RESEARCH COMPLETE" (if quality) OR "NEEDS REVISION" (if issues)."""
+_PLACEHOLDER_PLANNER_PROMPT: Final[str] = "You are a task planner. Break down research queries into actionable steps."
+_PLACEHOLDER_RESEARCHER_PROMPT: Final[str] = "You are a researcher. Find and collect relevant information from various sources."
+_PLACEHOLDER_WRITER_PROMPT: Final[str] = "You are a writer. Synthesize research findings into a coherent report."
+_PLACEHOLDER_CRITIC_PROMPT: Final[str] = "You are a critic. Evaluate the quality and accuracy of research findings."
+
+# Instructions appended to system prompts
+_PLANNER_NO_TOOLS_NOTE: Final[str] = "\n\nCRITICAL: You do NOT have access to any tools, search functions, or browsing capabilities. You only create plans - the Researcher agent will handle all searching and information gathering."
+_RESEARCHER_SYNTAX_NOTE: Final[str] = "\n\nCRITICAL: Never write function calls, XML tags like <function>, or any function syntax in your responses. The tools work automatically when you describe what you need. Just use natural language like 'I need to find articles about X' - the system handles the rest."
+_RESEARCHER_PLAN_FIRST_NOTE: Final[str] = "\n\nThere is no separate planner: begin your first message with a short numbered research plan (3-5 steps: key concepts, source types, search queries), then immediately gather evidence following it."
+_RESEARCHER_MULTI_SEARCH_NOTE: Final[str] = "\n\nWhen you need several searches, request them together with the multi search tool so they run in parallel."
+_WRITER_SYNTAX_NOTE: Final[str] = "\n\nCRITICAL: Never write function calls, XML tags like <function>, or any function syntax. The citation tools work automatically - just use natural language."
+_CRITIC_JSON_VERDICT_NOTE: Final[str] = """\n\nRespond ONLY with a JSON object {"feedback": "<at most 3 short, specific revision points, or empty if approved>", "decision": "APPROVED" or "NEEDS_REVISION"}. This replaces any closing phrase requested above."""
+
+# Function-call syntax stripped from custom prompts so models don't imitate it
+_PROMPT_SANITIZE_REPLACEMENTS = {
+    "web_search()": "web search",
+    "paper_search()": "paper search",
+    "add_citation()": "add citation",
+    "generate_bibliography()": "generate bibliography",
+    "</function>": "",
+    "<function": "",
+    "function=": "",
+}
+_PROMPT_SANITIZE_RE = re.compile(
+    "|".join(re.escape(token) for token in sorted(_PROMPT_SANITIZE_REPLACEMENTS, key=len, reverse=True))
+)
+
+
+def _inline_tool(func):
+    """
+    Wrap a fast synchronous tool so AutoGen awaits it on the event loop.
+
+    FunctionTool runs synchronous functions in a thread pool without the caller's
+    context variables; the citation tools need them to find the running query's
+    citation list, and their in-memory work is too small to be worth a thread.
+    """
+    @wraps(func)
+    async def run_inline(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return run_inline
+
+
+# Tool signatures are fixed, so each FunctionTool (and its JSON schema) is built once at import
+_WEB_SEARCH_TOOL = FunctionTool(
+    web_search,
+    description="Web search for articles and information. Params: query (string), max_results (int, default=5)."
+)
+_PAPER_SEARCH_TOOL = FunctionTool(
+    paper_search,
+    description="Search academic papers on Semantic Scholar. Params: query (string), max_results (int, default=10), year_from (int, optional). Returns papers with authors, abstracts, citations, URLs."
+)
+_MULTI_SEARCH_TOOL = FunctionTool(
+    multi_search,
+    description="Run several searches in parallel. Params: web_queries (list of strings, optional), paper_queries (list of strings, optional). Prefer this over separate calls when more than one search is needed."
+)
+_FORMAT_CITATION_TOOL = FunctionTool(
+    _inline_tool(format_citation),
+    description="Format source as APA citation. Param 'source': dict with type, authors (list of {'name': str}), year, title (required); venue, url, doi, site_name (optional)."
+)
+_ADD_CITATION_TOOL = FunctionTool(
+    _inline_tool(add_citation),
+    name="add_citation",
+    description="Add source to citations. Param 'source': type ('paper'|'article'|'webpage'|'book'), authors ([{'name': str}]), year (int), title (str) - required; url, venue, doi, site_name (optional). Returns citation number."
+)
+_GET_CITATION_NUMBER_TOOL = FunctionTool(
+    _inline_tool(get_citation_number),
+    description="Get citation number for existing source. Param 'source': dict with 'title' (required) and optional fields. Returns citation number or 'not found'."
+)
+_GENERATE_BIBLIOGRAPHY_TOOL = FunctionTool(
+    _inline_tool(generate_bibliography),
+    description="Generate APA bibliography from all added citations. Returns numbered list sorted alphabetically. Use for References section."
+)
+_CLEAR_CITATIONS_TOOL = FunctionTool(
+    _inline_tool(clear_citations),
+    description="Clear all citations. Use to reset for new task."
+)
+
+_RESEARCHER_TOOLS = (_WEB_SEARCH_TOOL, _PAPER_SEARCH_TOOL, _MULTI_SEARCH_TOOL)
+_WRITER_TOOLS = (
+    _FORMAT_CITATION_TOOL,
+    _ADD_CITATION_TOOL,
+    _GET_CITATION_NUMBER_TOOL,
+    _GENERATE_BIBLIOGRAPHY_TOOL,
+    _CLEAR_CITATIONS_TOOL,
+)
+
+
+@dataclass(frozen=True)
+class _AgentEnv:
+    """Provider credentials and endpoints read from the environment."""
+    groq_api_key: Optional[str]
+    openai_api_key: Optional[str]
+    openai_base_url: Optional[str]
+    max_inflight: int
 
-def create_model_client(config: Dict[str, Any]) -> OpenAIChatCompletionClient:
+
+@lru_cache(maxsize=1)
+def _agent_env() -> _AgentEnv:
+    """
+    Snapshot the provider environment variables once per process.
+
+    Taken on first use rather than at import, since callers load .env after
+    importing this module.
+    """
+    return _AgentEnv(
+        groq_api_key=os.getenv("GROQ_API_KEY"),
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+        openai_base_url=os.getenv("OPENAI_BASE_URL"),
+        max_inflight=max(1, int(os.getenv("MAX_INFLIGHT", "50"))),
+    )
+
+
+def _loop_state() -> Dict[str, Any]:
+    """Return the storage for loop-bound objects of the currently running event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _NO_LOOP_STATE
+    state = _LOOP_STATE.get(loop)
+    if state is None:
+        state = _LOOP_STATE[loop] = {}
+    return state
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client shared by all model clients on this loop."""
+    state = _loop_state()
+    http_client = state.get("http_client")
+    if http_client is None:
+        http_client = state["http_client"] = DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+    return http_client
+
+
+def _request_gate() -> asyncio.Semaphore:
+    """Return the semaphore bounding in-flight model requests on this loop (MAX_INFLIGHT)."""
+    state = _loop_state()
+    gate = state.get("request_gate")
+    if gate is None:
+        gate = state["request_gate"] = asyncio.Semaphore(_agent_env().max_inflight)
+    return gate
+
+
+class _GatedChatCompletionClient(OpenAIChatCompletionClient):
+    """
+    OpenAIChatCompletionClient whose requests pass through the loop's shared request gate.
+
+    Concurrent teams then queue on one semaphore sized to the provider's rate limit
+    instead of all firing at once and tripping 429 retries.
+    """
+
+    async def create(self, *args, **kwargs):
+        gate = _request_gate()
+        if gate.locked():
+            logger.debug("Model request queued: in-flight limit reached")
+        async with gate:
+            return await super().create(*args, **kwargs)
+
+    async def create_stream(self, *args, **kwargs):
+        gate = _request_gate()
+        if gate.locked():
+            logger.debug("Streaming model request queued: in-flight limit reached")
+        async with gate:
+            async for chunk in super().create_stream(*args, **kwargs):
+                yield chunk
+
+
+@lru_cache(maxsize=32)
+def _sanitize_prompt(prompt: str) -> str:
+    """Replace function-call syntax in a custom prompt with natural language (single regex pass)."""
+    return _PROMPT_SANITIZE_RE.sub(lambda m: _PROMPT_SANITIZE_REPLACEMENTS[m.group(0)], prompt)
+
+
+def _stream_enabled(config: Dict[str, Any]) -> bool:
+    """Whether agents should stream model output tokens (system.stream_model_output)."""
+    return bool(config.get("system", {}).get("stream_model_output", False))
+
+
+def create_model_client(
+    config: Dict[str, Any],
+    max_tokens: Optional[int] = None,
+    response_format: Optional[str] = None,
+) -> OpenAIChatCompletionClient:
     """
     Create model client for AutoGen agents.
 
+    Clients are cached per event loop and keyed by provider settings, so
+    repeated team creations reuse the same client and its open connections.
+
     Args:
         config: Configuration dictionary from config.yaml
+        max_tokens: Hard cap on generated tokens per request (optional)
+        response_format: Name of a structured output format in _RESPONSE_FORMATS (optional)
 
     Returns:
         OpenAIChatCompletionClient configured for the specified provider
@@ -46,199 +347,216 @@ def create_model_client(config: Dict[str, Any]) -> OpenAIChatCompletionClient:
     model_config = config.get("models", {}).get("default", {})
     provider = model_config.get("provider", "groq")
 
-    # Groq configuration (uses OpenAI-compatible API)
-    if provider == "groq":
-        api_key = os.getenv("GROQ_API_KEY")
-        if not api_key:
-            raise ValueError("GROQ_API_KEY not found in environment")
-
-        # Get max_tokens from config to limit response length
-        max_tokens = model_config.get("max_tokens", 1500)
-
-        return OpenAIChatCompletionClient(
-            model=model_config.get("name", "openai/gpt-oss-20b"),
-            api_key=api_key,
-            base_url="https://api.groq.com/openai/v1",
-            model_info={
-                "json_output": True,
-                "vision": False,
-                "function_calling": True,
-                "structured_output": True,
-                "family": ModelFamily.GPT_4O,
-                "max_tokens": max_tokens  # Limit response length
-            }
-        )
-
-    # OpenAI configuration
-    elif provider == "openai":
-        api_key = os.getenv("OPENAI_API_KEY")
-        base_url = os.getenv("OPENAI_BASE_URL")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY not found in environment")
-
-        # Get max_tokens from config to limit response length
-        max_tokens = model_config.get("max_tokens", 1500)
-
-        return OpenAIChatCompletionClient(
-            model=model_config.get("name", "gpt-4o-mini"),
-            api_key=api_key,
-            base_url=base_url,
-            model_info={
-                "vision": False,
-                "function_calling": True,
-                "json_output": True,
-                "structured_output": True,
-                "max_tokens": max_tokens  # Limit response length
-            },
-        )
+    # Reuse an existing client (and its warm connections) for the same settings
+    cache_key = (
+        provider,
+        model_config.get("name"),
+        _agent_env().openai_base_url if provider in ("openai", "vllm") else None,
+        model_config.get("max_tokens", 1500),
+        max_tokens,
+        response_format,
+    )
+    clients = _loop_state().setdefault("model_clients", {})
+    client = clients.get(cache_key)
+    if client is None:
+        client = clients[cache_key] = _build_model_client(provider, model_config, max_tokens, response_format)
+    return client
+
+
+def _build_model_client(
+    provider: str,
+    model_config: Dict[str, Any],
+    max_tokens: Optional[int] = None,
+    response_format: Optional[str] = None,
+) -> OpenAIChatCompletionClient:
+    """Construct a new model client for the given provider settings."""
+    try:
+        spec = _PROVIDER_TEMPLATES[provider]
+    except KeyError:
+        raise ValueError(f"Unsupported provider: {provider}") from None
+
+    env = _agent_env()
+    api_key = getattr(env, spec["key_field"])
+    if not api_key:
+        raise ValueError(f"{spec['env']} not found in environment")
+
+    # Get max_tokens from config to limit response length
+    model_info = {**spec["model_info"], "max_tokens": model_config.get("max_tokens", 1500)}
+
+    # Optional per-request arguments (generation cap, structured output)
+    create_args: Dict[str, Any] = {}
+    if max_tokens is not None:
+        create_args["max_tokens"] = max_tokens
+    if response_format is not None:
+        create_args["response_format"] = _RESPONSE_FORMATS[response_format]
+
+    return _GatedChatCompletionClient(
+        model=model_config.get("name", spec["default_model"]),
+        api_key=api_key,
+        # OpenAI-compatible endpoints (OpenAI, vLLM) take their URL from the environment
+        base_url=spec["base_url"] or env.openai_base_url,
+        http_client=_shared_http_client(),
+        model_info=model_info,
+        **create_args,
+    )
 
-    elif provider == "vllm":
-        api_key = os.getenv("OPENAI_API_KEY")
-        base_url = os.getenv("OPENAI_BASE_URL")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY not found in environment")
-
-        # Get max_tokens from config to limit response length
-        max_tokens = model_config.get("max_tokens", 1500)
-
-        return OpenAIChatCompletionClient(
-            model=model_config.get("name", "gpt-4o-mini"),
-            api_key=api_key,
-            base_url=base_url,
-            model_info={
-                "vision": False,
-                "function_calling": True,
-                "json_output": True,
-                "family": ModelFamily.GPT_4O,
-                "structured_output": True,
-                "max_tokens": max_tokens  # Limit response length
-            },
-        )
 
-    else:
-        raise ValueError(f"Unsupported provider: {provider}")
+@dataclass(frozen=True)
+class AgentSpec:
+    """Static description of one research team role."""
+    name: str
+    config_key: str
+    description: str
+    default_prompt: str
+    placeholder_prompt: str
+    tools: tuple = ()
+    # Strip function-call syntax from custom prompts
+    sanitize: bool = False
+    # Appended to custom prompts unless one of note_markers is already present
+    custom_note: Optional[str] = None
+    note_markers: tuple = ()
+    # Stream model output when system.stream_model_output is set
+    streams: bool = False
+
+
+_PLANNER_SPEC = AgentSpec(
+    name="Planner",
+    config_key="planner",
+    description="Breaks down research queries into actionable steps",
+    default_prompt=_DEFAULT_PLANNER_PROMPT,
+    placeholder_prompt=_PLACEHOLDER_PLANNER_PROMPT,
+    custom_note=_PLANNER_NO_TOOLS_NOTE,
+    note_markers=("do NOT have access to any tools", "CRITICAL: Do NOT attempt to use any tools"),
+)
+_RESEARCHER_SPEC = AgentSpec(
+    name="Researcher",
+    config_key="researcher",
+    description="Gathers evidence from web and academic sources using search tools",
+    default_prompt=_DEFAULT_RESEARCHER_PROMPT,
+    placeholder_prompt=_PLACEHOLDER_RESEARCHER_PROMPT,
+    tools=_RESEARCHER_TOOLS,
+    sanitize=True,
+    custom_note=_RESEARCHER_SYNTAX_NOTE,
+    streams=True,
+)
+_WRITER_SPEC = AgentSpec(
+    name="Writer",
+    config_key="writer",
+    description="Synthesizes research findings into coherent, well-cited responses",
+    default_prompt=_DEFAULT_WRITER_PROMPT,
+    placeholder_prompt=_PLACEHOLDER_WRITER_PROMPT,
+    tools=_WRITER_TOOLS,
+    sanitize=True,
+    custom_note=_WRITER_SYNTAX_NOTE,
+    note_markers=("CRITICAL", "Never write function"),
+    streams=True,
+)
+_CRITIC_SPEC = AgentSpec(
+    name="Critic",
+    config_key="critic",
+    description="Evaluates research quality and provides feedback",
+    default_prompt=_DEFAULT_CRITIC_PROMPT,
+    placeholder_prompt=_PLACEHOLDER_CRITIC_PROMPT,
+)
 
 
-def create_planner_agent(config: Dict[str, Any], model_client: OpenAIChatCompletionClient) -> AssistantAgent:
+def _build_agent(
+    spec: AgentSpec,
+    config: Dict[str, Any],
+    model_client: OpenAIChatCompletionClient,
+    extra_instructions: Sequence[str] = (),
+) -> AssistantAgent:
     """
-    Create a Planner Agent using AutoGen.
-
-    The planner breaks down research queries into actionable steps.
-    It doesn't use tools, but provides strategic direction.
+    Build an AssistantAgent for a role from its spec and config.
 
     Args:
+        spec: Role description
         config: Configuration dictionary
         model_client: Model client for the agent
+        extra_instructions: Text appended to the system prompt, in order
 
     Returns:
-        AutoGen AssistantAgent configured as a planner
+        AutoGen AssistantAgent for the role
     """
-    agent_config = config.get("agents", {}).get("planner", {})
-
-    # Use the shared model client - tools=[] will prevent tool calls
-    # We keep function_calling enabled in model_info because AutoGen validates this,
-    # but passing tools=[] ensures no tools are available to the Planner
-    planner_model_client = model_client
-
-    # Load system prompt from config or use default
-    default_system_message = """Research planner. Break down queries into actionable steps (150-200 words max). You have NO tools - only create plans. Steps: 1) Analyze concepts, 2) Determine source types, 3) Suggest search queries, 4) Outline synthesis. Provide numbered steps. End with "PLAN COMPLETE"."""
+    agent_config = config.get("agents", {}).get(spec.config_key, {})
 
     # Use custom prompt from config if available, otherwise use default
     custom_prompt = agent_config.get("system_prompt", "")
-    if custom_prompt and custom_prompt != "You are a task planner. Break down research queries into actionable steps.":
-        system_message = custom_prompt
-        # Always add reminder about no tools if not already present
-        if "do NOT have access to any tools" not in system_message and "CRITICAL: Do NOT attempt to use any tools" not in system_message:
-            system_message += "\n\nCRITICAL: You do NOT have access to any tools, search functions, or browsing capabilities. You only create plans - the Researcher agent will handle all searching and information gathering."
+    if custom_prompt and custom_prompt != spec.placeholder_prompt:
+        # Clean up custom prompt to remove function call syntax that might confuse the model
+        system_message = _sanitize_prompt(custom_prompt) if spec.sanitize else custom_prompt
+        if spec.custom_note and not any(marker in system_message for marker in spec.note_markers):
+            system_message += spec.custom_note
     else:
-        system_message = default_system_message
-
-    # Debug: Log model_info to verify function_calling is set
-    if hasattr(planner_model_client, 'model_info'):
-        model_info = planner_model_client.model_info
-        logger.debug(f"Planner model_info: function_calling={model_info.get('function_calling', 'NOT SET')}")
-        logger.debug(f"Planner model_info keys: {list(model_info.keys()) if isinstance(model_info, dict) else 'N/A'}")
+        system_message = spec.default_prompt
+    system_message += "".join(extra_instructions)
 
     try:
-        planner = AssistantAgent(
-            name="Planner",
-            model_client=planner_model_client,
-            tools=[],  # Explicitly no tools - Planner only creates plans
-            description="Breaks down research queries into actionable steps",
+        agent = AssistantAgent(
+            name=spec.name,
+            model_client=model_client,
+            tools=list(spec.tools),  # Prebuilt at import; the Planner and Critic get none
+            description=spec.description,
             system_message=system_message,
+            # Streamed chunks surface in team.run_stream() while the turn is still generating
+            model_client_stream=spec.streams and _stream_enabled(config),
         )
-        logger.info("Planner agent created successfully")
     except ValueError as e:
         if "function calling" in str(e).lower():
-            logger.error(f"Planner agent creation failed: {e}")
+            logger.error(f"{spec.name} agent creation failed: {e}")
             logger.error("This may be due to AutoGen's function calling validation. Model info:")
-            if hasattr(planner_model_client, 'model_info'):
-                logger.error(f"  {planner_model_client.model_info}")
+            if hasattr(model_client, 'model_info'):
+                logger.error(f"  {model_client.model_info}")
         raise
     except Exception as e:
-        logger.error(f"Unexpected error creating Planner agent: {e}")
+        logger.error(f"Unexpected error creating {spec.name} agent: {e}")
         raise
 
-    return planner
+    logger.info(f"{spec.name} agent created with {len(spec.tools)} tools")
+    return agent
 
 
-def create_researcher_agent(config: Dict[str, Any], model_client: OpenAIChatCompletionClient) -> AssistantAgent:
+def create_planner_agent(config: Dict[str, Any], model_client: OpenAIChatCompletionClient) -> AssistantAgent:
     """
-    Create a Researcher Agent using AutoGen.
+    Create a Planner Agent using AutoGen.
 
-    The researcher has access to web search and paper search tools.
-    It gathers evidence based on the planner's guidance.
+    The planner breaks down research queries into actionable steps.
+    It doesn't use tools, but provides strategic direction.
 
     Args:
         config: Configuration dictionary
         model_client: Model client for the agent
 
     Returns:
-        AutoGen AssistantAgent configured as a researcher with tool access
+        AutoGen AssistantAgent configured as a planner
     """
-    agent_config = config.get("agents", {}).get("researcher", {})
-
-    # Load system prompt from config or use default
-    default_system_message = """Researcher. Gather credible info from papers and web (200-300 words max). Tools work automatically - describe needs in natural language. Select ONLY top 8 sources: prioritize by relevance score (web) or citations/recency (papers). Process: 1) Review plan, 2) State info needs, 3) Select 8 most relevant, 4) Extract findings, 5) Note citations. End with "RESEARCH COMPLETE"."""
+    return _build_agent(_PLANNER_SPEC, config, model_client)
 
-    # Use custom prompt from config if available
-    custom_prompt = agent_config.get("system_prompt", "")
-    if custom_prompt and custom_prompt != "You are a researcher. Find and collect relevant information from various sources.":
-        # Clean up custom prompt to remove function call syntax that might confuse the model
-        system_message = custom_prompt.replace("web_search()", "web search").replace("paper_search()", "paper search")
-        system_message = system_message.replace("<function", "").replace("</function>", "").replace("function=", "")
-        # Always add strong clarification about not using function call syntax
-        system_message += "\n\nCRITICAL: Never write function calls, XML tags like <function>, or any function syntax in your responses. The tools work automatically when you describe what you need. Just use natural language like 'I need to find articles about X' - the system handles the rest."
-    else:
-        system_message = default_system_message
 
-    # Wrap tools in FunctionTool
-    logger.info("Creating web_search_tool for Researcher agent")
-    web_search_tool = FunctionTool(
-        web_search,
-        description="Web search for articles and information. Params: query (string), max_results (int, default=5)."
-    )
-    logger.debug(f"web_search_tool created: {web_search_tool}")
+def create_researcher_agent(
+    config: Dict[str, Any],
+    model_client: OpenAIChatCompletionClient,
+    plan_first: bool = False,
+) -> AssistantAgent:
+    """
+    Create a Researcher Agent using AutoGen.
 
-    logger.info("Creating paper_search_tool for Researcher agent")
-    paper_search_tool = FunctionTool(
-        paper_search,
-        description="Search academic papers on Semantic Scholar. Params: query (string), max_results (int, default=10), year_from (int, optional). Returns papers with authors, abstracts, citations, URLs."
-    )
-    logger.debug(f"paper_search_tool created: {paper_search_tool}")
+    The researcher has access to web search and paper search tools.
+    It gathers evidence based on the planner's guidance.
 
-    # Create the researcher with tool access
-    logger.info("Creating Researcher agent with tools")
-    researcher = AssistantAgent(
-        name="Researcher",
-        model_client=model_client,
-        tools=[web_search_tool, paper_search_tool],
-        description="Gathers evidence from web and academic sources using search tools",
-        system_message=system_message,
-    )
-    logger.info(f"Researcher agent created with {len([web_search_tool, paper_search_tool])} tools")
+    Args:
+        config: Configuration dictionary
+        model_client: Model client for the agent
+        plan_first: Have the researcher open with its own short research plan
+            (used when the Planner agent is disabled)
 
-    return researcher
+    Returns:
+        AutoGen AssistantAgent configured as a researcher with tool access
+    """
+    extra = [_RESEARCHER_PLAN_FIRST_NOTE] if plan_first else []
+    # Batched lookups run concurrently, so steer the model towards them
+    extra.append(_RESEARCHER_MULTI_SEARCH_NOTE)
+    return _build_agent(_RESEARCHER_SPEC, config, model_client, extra)
 
 
 def create_writer_agent(config: Dict[str, Any], model_client: OpenAIChatCompletionClient) -> AssistantAgent:
@@ -254,78 +572,7 @@ def create_writer_agent(config: Dict[str, Any], model_client: OpenAIChatCompleti
     Returns:
         AutoGen AssistantAgent configured as a writer
     """
-    agent_config = config.get("agents", {}).get("writer", {})
-
-    # Load system prompt from config or use default
-    default_system_message = """Writer for Ethical AI in Education. Synthesize Researcher's findings (400-600 words max). Structure: Brief intro → logical sections → APA citations → References. Paraphrase, don't copy. Citation tools work automatically - reference sources naturally. If Critic says "NEEDS REVISION", address feedback. If "APPROVED - RESEARCH COMPLETE", done."""
-
-    # Use custom prompt from config if available
-    custom_prompt = agent_config.get("system_prompt", "")
-    if custom_prompt and custom_prompt != "You are a writer. Synthesize research findings into a coherent report.":
-        # Clean up custom prompt to remove function call syntax
-        system_message = custom_prompt.replace("add_citation()", "add citation").replace("generate_bibliography()", "generate bibliography")
-        system_message = system_message.replace("<function", "").replace("</function>", "").replace("function=", "")
-        # Always add strong clarification about not using function call syntax
-        if "CRITICAL" not in system_message and "Never write function" not in system_message:
-            system_message += "\n\nCRITICAL: Never write function calls, XML tags like <function>, or any function syntax. The citation tools work automatically - just use natural language."
-    else:
-        system_message = default_system_message
-
-    # Wrap citation tools in FunctionTool
-    logger.info("Creating citation tools for Writer agent")
-
-    format_citation_tool = FunctionTool(
-        format_citation,
-        description="Format source as APA citation. Param 'source': dict with type, authors (list of {'name': str}), year, title (required); venue, url, doi, site_name (optional)."
-    )
-    logger.debug("format_citation_tool created")
-
-    add_citation_tool = FunctionTool(
-        add_citation,
-        name="add_citation",
-        description="Add source to citations. Param 'source': type ('paper'|'article'|'webpage'|'book'), authors ([{'name': str}]), year (int), title (str) - required; url, venue, doi, site_name (optional). Returns citation number."
-    )
-    logger.debug("add_citation_tool created")
-
-    get_citation_number_tool = FunctionTool(
-        get_citation_number,
-        description="Get citation number for existing source. Param 'source': dict with 'title' (required) and optional fields. Returns citation number or 'not found'."
-    )
-    logger.debug("get_citation_number_tool created")
-
-    generate_bibliography_tool = FunctionTool(
-        generate_bibliography,
-        description="Generate APA bibliography from all added citations. Returns numbered list sorted alphabetically. Use for References section."
-    )
-    logger.debug("generate_bibliography_tool created")
-
-    clear_citations_tool = FunctionTool(
-        clear_citations,
-        description="Clear all citations. Use to reset for new task."
-    )
-    logger.debug("clear_citations_tool created")
-
-    logger.info(f"Created {5} citation tools for Writer agent")
-
-    # Create the writer with citation tool access
-    writer_tools = [
-        format_citation_tool,
-        add_citation_tool,
-        get_citation_number_tool,
-        generate_bibliography_tool,
-        clear_citations_tool,
-    ]
-    logger.info(f"Creating Writer agent with {len(writer_tools)} citation tools")
-    writer = AssistantAgent(
-        name="Writer",
-        model_client=model_client,
-        tools=writer_tools,
-        description="Synthesizes research findings into coherent, well-cited responses",
-        system_message=system_message,
-    )
-    logger.info("Writer agent created successfully")
-
-    return writer
+    return _build_agent(_WRITER_SPEC, config, model_client)
 
 
 def create_critic_agent(config: Dict[str, Any], model_client: OpenAIChatCompletionClient) -> AssistantAgent:
@@ -342,60 +589,195 @@ def create_critic_agent(config: Dict[str, Any], model_client: OpenAIChatCompleti
     Returns:
         AutoGen AssistantAgent configured as a critic
     """
-    agent_config = config.get("agents", {}).get("critic", {})
+    # Structured verdict: a short JSON classification instead of a free-text review
+    json_verdict = config.get("agents", {}).get("critic", {}).get("json_verdict", False)
+    extra = [_CRITIC_JSON_VERDICT_NOTE] if json_verdict else []
+    return _build_agent(_CRITIC_SPEC, config, model_client, extra)
 
-    # Load system prompt from config or use default
-    default_system_message = """Peer reviewer. Evaluate for relevance, credible/well-cited sources, completeness, accuracy, clarity, synthesis, appropriate length (400-600 words). Provide specific constructive feedback. End with "APPROVED - RESEARCH COMPLETE" (if quality) OR "NEEDS REVISION" (if issues)."""
 
-    # Use custom prompt from config if available
-    custom_prompt = agent_config.get("system_prompt", "")
-    if custom_prompt and custom_prompt != "You are a critic. Evaluate the quality and accuracy of research findings.":
-        system_message = custom_prompt
-    else:
-        system_message = default_system_message
+class TailMentionTermination(TerminationCondition):
+    """
+    Stop the conversation when a message ends with the given text.
 
-    critic = AssistantAgent(
-        name="Critic",
-        model_client=model_client,
-        description="Evaluates research quality and provides feedback",
-        system_message=system_message,
-    )
+    Agents are prompted to put the signal phrase at the end of their message, so only
+    the last `tail` characters of each new message are searched instead of the full
+    content (which for long reviews can be many kilobytes).
+    """
 
-    return critic
+    def __init__(self, text: str, tail: int = 128, sources: Optional[Sequence[str]] = None):
+        self._text = text
+        self._tail = max(tail, len(text))
+        self._sources = set(sources) if sources else None
+        self._terminated = False
+
+    @property
+    def terminated(self) -> bool:
+        return self._terminated
+
+    async def __call__(self, messages: Sequence[Any]) -> Optional[StopMessage]:
+        if self._terminated:
+            return None
+        text, tail, sources = self._text, self._tail, self._sources
+        for message in messages:
+            content = getattr(message, "content", None)
+            if not isinstance(content, str):
+                continue
+            if sources is not None and getattr(message, "source", None) not in sources:
+                continue
+            if content.find(text, len(content) - tail) != -1:
+                self._terminated = True
+                return StopMessage(content=f"Text '{text}' mentioned", source="TailMentionTermination")
+        return None
+
+    async def reset(self) -> None:
+        self._terminated = False
+
+
+def select_next_speaker(messages: Sequence[Any], first_speaker: str = "Planner") -> Optional[str]:
+    """
+    Pick the next speaker from the conversation so far.
 
+    Used as the SelectorGroupChat selector_func: the Planner runs once at the start,
+    then Researcher → Writer → Critic, and a "NEEDS REVISION" review goes straight
+    back to the Writer instead of re-running the Planner and Researcher.
 
-def create_research_team(config: Dict[str, Any], max_turns: int = None) -> RoundRobinGroupChat:
+    Args:
+        messages: Messages and events exchanged so far (task message first)
+        first_speaker: Agent that opens the conversation ("Researcher" when the
+            Planner is disabled)
+
+    Returns:
+        Name of the next agent
     """
-    Create the research team as a RoundRobinGroupChat.
+    for message in reversed(messages):
+        next_speaker = _NEXT_SPEAKER.get(getattr(message, "source", None))
+        if next_speaker is not None:
+            return next_speaker
+    return first_speaker
+
+
+def _role_model_client(
+    config: Dict[str, Any],
+    role: str,
+    shared_client: OpenAIChatCompletionClient,
+    default_max_tokens: Optional[int] = None,
+    response_format: Optional[str] = None,
+) -> OpenAIChatCompletionClient:
+    """
+    Return the model client for one role.
+
+    Roles with agents.<role>.max_tokens (or a structured output format) get their
+    own capped client; it shares the loop's HTTP pool with the other clients.
+    Everyone else uses the shared client.
+    """
+    max_tokens = config.get("agents", {}).get(role, {}).get("max_tokens", default_max_tokens)
+    if max_tokens is None and response_format is None:
+        return shared_client
+    return create_model_client(config, max_tokens=max_tokens, response_format=response_format)
+
+
+def _team_key(config: Dict[str, Any], max_turns: Optional[int]) -> tuple:
+    """Cache key for a research team: the config's contents plus the turn limit."""
+    if max_turns is None:
+        max_turns = config.get("system", {}).get("max_turns", 8)
+    return json.dumps(config, sort_keys=True, default=str), max_turns
+
+
+async def create_research_team(config: Dict[str, Any], max_turns: int = None) -> SelectorGroupChat:
+    """
+    Create the research team as a SelectorGroupChat with a deterministic speaker order.
+
+    Teams handed back with release_research_team are reused: an idle team built
+    for the same config and max_turns on this event loop is reset and returned
+    instead of building a new one. Otherwise model clients are resolved on the
+    running loop (they are cached per loop) and the agents are built
+    concurrently in worker threads.
 
     Args:
         config: Configuration dictionary
         max_turns: Maximum number of turns (if None, uses max_turns from config)
 
     Returns:
-        RoundRobinGroupChat with all agents configured
+        SelectorGroupChat with all agents configured
     """
+    idle_teams = _loop_state().get("idle_teams", {}).get(_team_key(config, max_turns))
+    while idle_teams:
+        team = idle_teams.pop()
+        try:
+            await team.reset()
+            return team
+        except Exception as e:
+            logger.warning(f"Discarding cached research team that failed to reset: {e}")
+
     # Create model client (shared by all agents)
     model_client = create_model_client(config)
 
+    # With the Planner disabled, the Researcher writes the plan in its first turn,
+    # saving one full LLM round-trip per query
+    planner_enabled = config.get("agents", {}).get("planner", {}).get("enabled", True)
+
+    json_verdict = config.get("agents", {}).get("critic", {}).get("json_verdict", False)
+    if json_verdict:
+        # The verdict is a short JSON object, so the Critic gets a capped, schema-constrained client
+        critic_client = _role_model_client(
+            config, "critic", model_client,
+            default_max_tokens=_CRITIC_VERDICT_MAX_TOKENS,
+            response_format="critic_verdict",
+        )
+    else:
+        critic_client = _role_model_client(config, "critic", model_client)
+
     # Create all agents
-    planner = create_planner_agent(config, model_client)
-    researcher = create_researcher_agent(config, model_client)
-    writer = create_writer_agent(config, model_client)
-    critic = create_critic_agent(config, model_client)
+    builds = []
+    if planner_enabled:
+        builds.append(asyncio.to_thread(
+            create_planner_agent, config, _role_model_client(config, "planner", model_client)
+        ))
+    builds += [
+        asyncio.to_thread(
+            create_researcher_agent, config, _role_model_client(config, "researcher", model_client),
+            plan_first=not planner_enabled,
+        ),
+        asyncio.to_thread(create_writer_agent, config, _role_model_client(config, "writer", model_client)),
+        asyncio.to_thread(create_critic_agent, config, critic_client),
+    ]
+    participants = list(await asyncio.gather(*builds))
 
-    # Create termination condition
-    termination = TextMentionTermination("APPROVED - RESEARCH COMPLETE")
+    # Create termination condition (only the Critic's approval ends the run)
+    approval = _APPROVED_DECISION if json_verdict else _APPROVED
+    termination = TailMentionTermination(approval, sources=["Critic"])
 
     # Get max_turns from parameter or config
     if max_turns is None:
         max_turns = config.get("system", {}).get("max_turns", 8)
 
-    # Create team with round-robin ordering and max_turns limit
-    team = RoundRobinGroupChat(
-        participants=[planner, researcher, writer, critic],
+    # Speaker order comes from select_next_speaker, so the model client is never asked
+    # to pick a speaker; it is only required by SelectorGroupChat's constructor
+    team = SelectorGroupChat(
+        participants=participants,
+        model_client=model_client,
+        selector_func=partial(select_next_speaker, first_speaker=participants[0].name),
         termination_condition=termination,
         max_turns=max_turns,  # Enforce turn limit to prevent context length errors
     )
 
     return team
+
+
+def release_research_team(team: SelectorGroupChat, config: Dict[str, Any], max_turns: int = None) -> None:
+    """
+    Return a team whose run has finished so create_research_team can reuse it.
+
+    Teams are kept per event loop, since their queues are bound to the loop they
+    ran on. Releasing a team for a changed config evicts teams built for the old one.
+
+    Args:
+        team: Team previously returned by create_research_team
+        config: Configuration dictionary the team was created with
+        max_turns: Maximum number of turns the team was created with
+    """
+    key = _team_key(config, max_turns)
+    pools = _loop_state().setdefault("idle_teams", {})
+    for stale in [k for k in pools if k[0] != key[0]]:
+        del pools[stale]
+    pools.setdefault(key, []).append(team)
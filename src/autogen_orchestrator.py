@@ -1,28 +1,157 @@
 """
 AutoGen-Based Orchestrator
 
-This orchestrator uses AutoGen's RoundRobinGroupChat to coordinate multiple agents
-in a research workflow.
+This orchestrator uses an AutoGen SelectorGroupChat with a fixed speaker order to
+coordinate multiple agents in a research workflow.
 
 Workflow:
 1. Planner: Breaks down the query into research steps
 2. Researcher: Gathers evidence using web and paper search tools
 3. Writer: Synthesizes findings into a coherent response
-4. Critic: Evaluates quality and provides feedback
+4. Critic: Evaluates quality and provides feedback (revisions go back to the Writer)
 """
 
+import re
+import hashlib
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional
-from autogen_agentchat.teams import RoundRobinGroupChat
+import threading
+import concurrent.futures
+import contextvars
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from autogen_agentchat.messages import TextMessage
 
-from src.agents.autogen_agents import create_research_team
+from src.agents.autogen_agents import create_research_team, release_research_team
+from src.tools.citation_tool import CitationTool, use_citation_tool, reset_citation_tool
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from autogen_core import FunctionCall
+except ImportError:
+    FunctionCall = None
+
+
+# Numbered list items ("\n1.", "\n12.", ...) in research findings, used to estimate source counts
+_SOURCE_ITEM_RE = re.compile(r"\n\d+\.")
+
+# (loop, queue) receiving status updates of the query running in the current context (see _drain_status)
+_STATUS_QUEUE: contextvars.ContextVar[Optional[tuple]] = contextvars.ContextVar("status_queue", default=None)
+_STATUS_COALESCE_SECONDS = 0.05
+
+# Number of query results kept by each orchestrator's response cache
+_RESPONSE_CACHE_SIZE = 128
+
+# Marks messages without a content attribute in the extraction loop
+_NO_CONTENT = object()
+
+# Known failure markers in error messages: function-calling validation and context overflow
+_ERR_PATTERNS = re.compile(
+    r"(?P<fn>function calling)|(?P<ctx>context_length_exceeded|please reduce the length)", re.I
+)
+
+# Task given to the research team for each query
+_TASK_TEMPLATE = """Research Query: {query}
+
+Please work together to answer this query comprehensively:
+1. Planner: Create a research plan
+2. Researcher: Gather evidence from web and academic sources using the search tools
+3. Writer: Review the Researcher's findings from the conversation and synthesize them into a well-cited response. Use ALL the sources and information the Researcher has gathered.
+4. Critic: Evaluate the quality and provide feedback"""
+
+# Static descriptions returned by get_agent_descriptions / visualize_workflow
+_AGENT_DESCRIPTIONS = MappingProxyType({
+    "Planner": "Breaks down research queries into actionable steps",
+    "Researcher": "Gathers evidence from web and academic sources",
+    "Writer": "Synthesizes findings into coherent responses",
+    "Critic": "Evaluates quality and provides feedback",
+})
+
+_WORKFLOW_VIZ = """
+AutoGen Research Workflow:
+
+1. User Query
+   ↓
+2. Planner
+   - Analyzes query
+   - Creates research plan
+   - Identifies key topics
+   ↓
+3. Researcher (with tools)
+   - Uses web_search() tool
+   - Uses paper_search() tool
+   - Gathers evidence
+   - Collects citations
+   ↓
+4. Writer
+   - Synthesizes findings
+   - Creates structured response
+   - Adds citations
+   ↓
+5. Critic
+   - Evaluates quality
+   - Checks completeness
+   - Provides feedback
+   ↓
+6. Decision Point
+   - If APPROVED → Final Response
+   - If NEEDS REVISION → Back to Writer
+        """
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a query result for the response cache.
+
+    The result dict, its metadata and the metadata lists are copied; the
+    conversation history is a read-only view and is shared.
+    """
+    copied = dict(result)
+    if isinstance(result.get("metadata"), dict):
+        copied["metadata"] = {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in result["metadata"].items()
+        }
+    return copied
+
+
+class _LoopRunner:
+    """
+    One background thread running a long-lived event loop for synchronous callers.
+
+    Reusing a single loop avoids starting a thread and loop per query and keeps
+    loop-bound caches (model clients, HTTP pool, idle teams) warm between calls.
+    """
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runner's event loop, started on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="autogen-orchestrator-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+
+_loop_runner = _LoopRunner()
 
 
 class AutoGenOrchestrator:
     """
-    Orchestrates multi-agent research using AutoGen's RoundRobinGroupChat.
+    Orchestrates multi-agent research using an AutoGen group chat team.
 
     This orchestrator manages a team of specialized agents that work together
     to answer research queries. It uses AutoGen's built-in conversation
@@ -44,9 +173,16 @@ class AutoGenOrchestrator:
         # Get max_turns from config with sensible default
         self.max_turns = config.get("system", {}).get("max_turns", 8)
 
-        # Don't create team here - create it fresh for each query to avoid event loop binding issues
-        # The team object has internal queues that get bound to event loops
-        self.logger.info("Orchestrator initialized (team will be created per query)")
+        # Wall-clock limit for one team run
+        self.timeout_seconds = config.get("system", {}).get("timeout_seconds", 300)
+
+        # Results of successful queries, most recently used last
+        self.enable_response_cache = config.get("system", {}).get("enable_response_cache", True)
+        self._response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # Don't create team here - the team object has internal queues that get bound to
+        # event loops, so teams are checked out per query from a pool kept for each loop
+        self.logger.info("Orchestrator initialized (teams are reused per event loop)")
 
         # Workflow trace for debugging and UI display
         self.workflow_trace: List[Dict[str, Any]] = []
@@ -67,11 +203,54 @@ class AutoGenOrchestrator:
             'progress': progress,
             'output': output
         }
-        if self.status_callback:
-            try:
-                self.status_callback(status)
-            except Exception as e:
-                self.logger.warning(f"Status callback error: {e}")
+        if not self.status_callback:
+            return
+
+        # While a query runs, updates are coalesced by its status drainer
+        target = _STATUS_QUEUE.get()
+        if target is None:
+            self._fire_status(status)
+            return
+        loop, queue = target
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            queue.put_nowait(status)
+        else:
+            # Called from a worker thread: asyncio queues are not thread-safe
+            loop.call_soon_threadsafe(queue.put_nowait, status)
+
+    def _fire_status(self, status: Dict[str, Any]):
+        """Invoke the status callback, logging (not raising) its errors."""
+        try:
+            self.status_callback(status)
+        except Exception as e:
+            self.logger.warning(f"Status callback error: {e}")
+
+    async def _drain_status(self, queue: asyncio.Queue):
+        """
+        Deliver queued status updates, at most one callback per coalescing window.
+
+        Updates that arrive within the window are collapsed to the newest one. A
+        None sentinel flushes the pending update and stops the drainer.
+        """
+        while True:
+            status = await queue.get()
+            if status is None:
+                return
+            await asyncio.sleep(_STATUS_COALESCE_SECONDS)
+            stop = False
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item is None:
+                    stop = True
+                else:
+                    status = item
+            self._fire_status(status)
+            if stop:
+                return
 
     async def process_query_async(self, query: str, max_turns: int = None) -> Dict[str, Any]:
         """
@@ -135,25 +314,17 @@ class AutoGenOrchestrator:
             if max_turns is None:
                 max_turns = self.max_turns
 
-            # For Streamlit and other environments where event loops can conflict,
-            # always use a fresh event loop in a new thread to avoid queue binding issues
-            import concurrent.futures
-            import threading
-
-            def run_in_new_loop():
-                """Run the async function in a completely new event loop."""
-                # Create a new event loop for this thread
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    return new_loop.run_until_complete(self._process_query_async(query, max_turns))
-                finally:
-                    new_loop.close()
-
-            # Run in a separate thread with a fresh event loop
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_in_new_loop)
-                result = future.result(timeout=300)  # 5 minute timeout
+            # For Streamlit and other environments where event loops can conflict, run on
+            # the orchestrator's own long-lived loop thread (never the caller's loop)
+            future = asyncio.run_coroutine_threadsafe(
+                self._process_query_async(query, max_turns), _loop_runner.loop
+            )
+            try:
+                # The run enforces timeout_seconds itself; this only guards a stuck loop
+                result = future.result(timeout=self.timeout_seconds + 30)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                raise
 
             self.logger.info("Query processing complete (sync)")
             return result
@@ -172,6 +343,12 @@ class AutoGenOrchestrator:
         """
         Async implementation of query processing.
 
+        Repeated queries (same text up to case and whitespace, same max_turns) are
+        answered from an in-memory LRU cache of successful results. Status updates
+        issued during a run are batched through a per-query queue so a slow
+        callback (e.g. a Streamlit rerun) runs at most once per coalescing window
+        instead of once per update.
+
         Args:
             query: The research question to answer
             max_turns: Maximum number of conversation turns
@@ -179,28 +356,75 @@ class AutoGenOrchestrator:
         Returns:
             Dictionary containing results
         """
-        # Create a fresh team for each query to avoid event loop binding issues
-        # AutoGen's RoundRobinGroupChat has internal queues that get bound to event loops
-        # Creating a new team ensures clean state for each query
-        self.logger.info("Creating fresh research team for this query...")
-
-        # Clear citation tool state to ensure clean start for each query
-        from src.tools.citation_tool import clear_citations
+        cache_key = self._response_cache_key(query, max_turns)
+        if cache_key is not None and cache_key in self._response_cache:
+            self._response_cache.move_to_end(cache_key)
+            self.logger.info("Returning cached response for repeated query")
+            return _copy_result(self._response_cache[cache_key])
+
+        result = await self._process_query_uncached(query, max_turns)
+
+        # Only successful runs are cached
+        if cache_key is not None and not result.get("metadata", {}).get("error"):
+            self._response_cache[cache_key] = _copy_result(result)
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return result
+
+    def _response_cache_key(self, query: str, max_turns: int) -> Optional[str]:
+        """Key for the response cache (normalized query + max_turns), or None when caching is off."""
+        if not self.enable_response_cache:
+            return None
+        normalized = " ".join(query.lower().split())
+        return hashlib.blake2b(f"{max_turns}:{normalized}".encode(), digest_size=16).hexdigest()
+
+    async def _process_query_uncached(self, query: str, max_turns: int) -> Dict[str, Any]:
+        """Run a query with its own citation list, batching its status updates when a status callback is set."""
+        # A fresh citation list per query (instead of clearing a shared one) keeps
+        # queries running concurrently on this loop from mixing their citations
+        citation_token = use_citation_tool(CitationTool(style="apa"))
         try:
-            clear_citations()
-            self.logger.debug("Citation tool cleared for new query")
-        except Exception as e:
-            self.logger.warning(f"Could not clear citations: {e}")
+            if not self.status_callback:
+                return await self._run_query(query, max_turns)
+
+            queue: asyncio.Queue = asyncio.Queue()
+            token = _STATUS_QUEUE.set((asyncio.get_running_loop(), queue))
+            drainer = asyncio.create_task(self._drain_status(queue))
+            try:
+                return await self._run_query(query, max_turns)
+            finally:
+                _STATUS_QUEUE.reset(token)
+                # Flush the last pending update before returning
+                queue.put_nowait(None)
+                await drainer
+        finally:
+            reset_citation_tool(citation_token)
+
+    async def _run_query(self, query: str, max_turns: int) -> Dict[str, Any]:
+        """
+        Run one query through the research team and extract the results.
+
+        Args:
+            query: The research question to answer
+            max_turns: Maximum number of conversation turns
+
+        Returns:
+            Dictionary containing results
+        """
+        # AutoGen's group chat teams have internal queues that get bound to event loops,
+        # so teams are reused only on the loop they were built on and reset before each query
+        self.logger.info("Getting research team for this query...")
 
         try:
-            # Pass max_turns to create_research_team so it can set max_turns on RoundRobinGroupChat
-            team = create_research_team(self.config, max_turns=max_turns)
-            self.logger.info(f"Research team created successfully (max_turns={max_turns})")
+            # Pass max_turns to create_research_team so it can set max_turns on the team
+            team = await create_research_team(self.config, max_turns=max_turns)
+            self.logger.info(f"Research team ready (max_turns={max_turns})")
         except Exception as e:
             self.logger.error(f"Error creating research team: {e}", exc_info=True)
             # Return structured error instead of raising to allow evaluation to continue
             error_msg = str(e)
-            if "function calling" in error_msg.lower():
+            match = _ERR_PATTERNS.search(error_msg)
+            if match and match.group("fn"):
                 self.logger.error("Planner agent creation failed - model function calling validation issue")
                 return {
                     "query": query,
@@ -217,35 +441,45 @@ class AutoGenOrchestrator:
             raise
 
         # Create task message
-        task_message = f"""Research Query: {query}
-
-Please work together to answer this query comprehensively:
-1. Planner: Create a research plan
-2. Researcher: Gather evidence from web and academic sources using the search tools
-3. Writer: Review the Researcher's findings from the conversation and synthesize them into a well-cited response. Use ALL the sources and information the Researcher has gathered.
-4. Critic: Evaluate the quality and provide feedback"""
+        task_message = _TASK_TEMPLATE.format(query=query)
 
         # Run the team
         self.logger.info(f"Starting team execution (max_turns: {max_turns})")
-        self.logger.debug(f"Task message: {task_message[:200]}...")
+        self.logger.debug("Task message: %.200s...", task_message)
 
         # Update status: Starting
         self._update_status(agent=None, stage="initializing", progress=0.1)
 
+        reusable = True
         try:
-            # RoundRobinGroupChat has max_turns set in team creation
+            # The team has max_turns set in team creation
             # The termination condition and max_turns are handled by the team configuration
             self._update_status(agent=None, stage="running_agents", progress=0.2)
-            result = await team.run(task=task_message)
+            # Bound the whole run inside the loop so a timeout cancels the agents and
+            # releases their connections instead of leaving them running
+            result = await asyncio.wait_for(team.run(task=task_message), timeout=self.timeout_seconds)
             self.logger.info("Team execution completed")
             self._update_status(agent=None, stage="extracting_results", progress=0.9)
+        except asyncio.TimeoutError:
+            # A cancelled run may leave the team mid-turn, so it is not reused
+            reusable = False
+            self.logger.error(f"Team execution timed out after {self.timeout_seconds}s")
+            self._update_status(agent=None, stage="timeout", progress=0.0)
+            error_msg = f"Research team did not finish within {self.timeout_seconds} seconds"
+            return {
+                "query": query,
+                "error": error_msg,
+                "response": f"An error occurred while processing your query: {error_msg}",
+                "conversation_history": [],
+                "metadata": {"error": True, "error_type": "timeout"}
+            }
         except Exception as e:
             self.logger.error(f"Error during team execution: {e}", exc_info=True)
             self._update_status(agent=None, stage="error", progress=0.0)
 
             # Check if it's a context length error
-            error_str = str(e)
-            if "context_length_exceeded" in error_str or "Please reduce the length" in error_str:
+            match = _ERR_PATTERNS.search(str(e))
+            if match and match.group("ctx"):
                 self.logger.warning("Context length exceeded - conversation history too long")
                 raise ValueError(
                     "The conversation history has exceeded the model's context limit. "
@@ -254,11 +488,18 @@ Please work together to answer this query comprehensively:
                 ) from e
 
             raise
+        finally:
+            # Hand the team back for reuse; it is reset when next checked out
+            if reusable:
+                release_research_team(team, self.config, max_turns=max_turns)
 
         # Extract conversation history
-        messages = []
-        full_message_contents = {}  # Store full content for final response extraction and agent traces
-        message_counts = {}  # Track message counts per agent for debugging
+        latest_content = {}  # Last full message per agent, for final response extraction
+        message_counts = Counter()  # Track message counts per agent for debugging
+        last_status_source = None
+        plan = ""
+        research_findings = []
+        agents_involved = set()
 
         # Log total messages from AutoGen
         total_messages = len(result.messages) if hasattr(result, 'messages') else 0
@@ -266,67 +507,79 @@ Please work together to answer this query comprehensively:
 
         # result.messages is a list, not an async iterator
         total_msgs = len(result.messages)
+        messages = [None] * total_msgs  # Filled by index; the size is known up front
+        add_finding = research_findings.append
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         for idx, message in enumerate(result.messages):
             msg_source = getattr(message, 'source', 'Unknown')
+            msg_content = getattr(message, 'content', _NO_CONTENT)
+            tool_calls = getattr(message, 'tool_calls', None)
 
             # Handle FunctionCall and other non-string content types
-            if hasattr(message, 'content'):
-                msg_content = message.content
-                # Convert FunctionCall, lists, and other objects to string
-                if isinstance(msg_content, list):
-                    # Join list items into a string
-                    msg_content = "\n".join(str(item) for item in msg_content) if msg_content else ""
-                elif not isinstance(msg_content, str):
-                    # Check if it's a FunctionCall or similar object
-                    content_type = str(type(msg_content))
-                    if 'FunctionCall' in content_type or hasattr(msg_content, 'name'):
-                        # Format FunctionCall as readable string
-                        tool_name = getattr(msg_content, 'name', 'unknown_tool')
-                        args = getattr(msg_content, 'arguments', {})
-                        if isinstance(args, dict):
-                            args_str = ', '.join(f"{k}={v}" for k, v in args.items())
-                        else:
-                            args_str = str(args)
-                        msg_content = f"[Tool Call: {tool_name}({args_str})]"
-                    else:
-                        msg_content = str(msg_content)
-            else:
+            if msg_content is _NO_CONTENT:
                 msg_content = str(message)
-
-            # Update status for UI display
-            progress = (idx + 1) / total_msgs if total_msgs > 0 else 0.0
-            self._update_status(
-                agent=msg_source,
-                stage="processing",
-                progress=min(progress * 0.8, 0.8),  # Reserve 20% for final processing
-                output=msg_content[:500] if len(msg_content) > 500 else msg_content  # Preview
-            )
+            elif isinstance(msg_content, list):
+                # Join list items into a string
+                msg_content = "\n".join(str(item) for item in msg_content) if msg_content else ""
+            elif not isinstance(msg_content, str):
+                # Check if it's a FunctionCall or similar object
+                if (FunctionCall is not None and isinstance(msg_content, FunctionCall)) or hasattr(msg_content, 'name'):
+                    # Format FunctionCall as readable string
+                    tool_name = getattr(msg_content, 'name', 'unknown_tool')
+                    args = getattr(msg_content, 'arguments', {})
+                    if isinstance(args, dict) and ORJSON_AVAILABLE:
+                        args_str = orjson.dumps(args, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+                    elif isinstance(args, dict):
+                        args_str = ', '.join(f"{k}={v}" for k, v in args.items())
+                    else:
+                        args_str = str(args)
+                    msg_content = f"[Tool Call: {tool_name}({args_str})]"
+                else:
+                    msg_content = str(msg_content)
+
+            # Update status for UI display when the speaking agent changes (and on the last message)
+            if msg_source != last_status_source or idx == total_msgs - 1:
+                last_status_source = msg_source
+                progress = (idx + 1) / total_msgs
+                self._update_status(
+                    agent=msg_source,
+                    stage="processing",
+                    progress=min(progress * 0.8, 0.8),  # Reserve 20% for final processing
+                    output=msg_content[:500]  # Preview
+                )
 
             # Track message counts per agent
-            message_counts[msg_source] = message_counts.get(msg_source, 0) + 1
+            message_counts[msg_source] += 1
 
-            # Store full content for all agents (needed for agent traces and final response)
-            if msg_source not in full_message_contents:
-                full_message_contents[msg_source] = []
-            full_message_contents[msg_source].append(msg_content)
+            # Keep each agent's latest message (the Writer's and Critic's become the results)
+            latest_content[msg_source] = msg_content
+
+            # Collect result components in the same pass
+            agents_involved.add(msg_source)
+            if msg_source == "Planner" and not plan:
+                plan = msg_content
+            elif msg_source == "Researcher":
+                add_finding(msg_content)
 
             # Log tool calls if present
-            if hasattr(message, 'tool_calls') and message.tool_calls:
-                self.logger.info(f"Tool call detected from {msg_source}: {len(message.tool_calls)} tool(s)")
-                for tool_call in message.tool_calls:
-                    self.logger.debug(f"  Tool: {getattr(tool_call, 'name', 'Unknown')}, "
-                                    f"Args: {getattr(tool_call, 'arguments', {})}")
+            if tool_calls:
+                self.logger.info("Tool call detected from %s: %d tool(s)", msg_source, len(tool_calls))
+                if debug_enabled:
+                    for tool_call in tool_calls:
+                        self.logger.debug("  Tool: %s, Args: %s",
+                                          getattr(tool_call, 'name', 'Unknown'),
+                                          getattr(tool_call, 'arguments', {}))
 
             # Store full content in messages (not truncated) for agent traces
             msg_dict = {
                 "source": msg_source,
                 "content": msg_content,  # Store full content, not truncated
             }
-            messages.append(msg_dict)
-            self.logger.debug(f"Message from {msg_source}: {len(msg_content)} chars")
+            messages[idx] = msg_dict
+            self.logger.debug("Message from %s: %d chars", msg_source, len(msg_content))
 
         # Log message counts per agent
-        self.logger.info(f"Messages extracted per agent: {message_counts}")
+        self.logger.info(f"Messages extracted per agent: {dict(message_counts)}")
         self.logger.info(f"Total messages in conversation_history: {len(messages)}")
 
         # Extract final response - use full content, not truncated
@@ -336,13 +589,13 @@ Please work together to answer this query comprehensively:
         critic_feedback = ""
 
         # Get Writer's last response (this is the actual output)
-        if "Writer" in full_message_contents and full_message_contents["Writer"]:
-            writer_response = full_message_contents["Writer"][-1]
+        if latest_content.get("Writer"):
+            writer_response = latest_content["Writer"]
             final_response = writer_response
 
         # Get Critic's feedback (for metadata, not as the main response)
-        if "Critic" in full_message_contents and full_message_contents["Critic"]:
-            critic_feedback = full_message_contents["Critic"][-1]
+        if latest_content.get("Critic"):
+            critic_feedback = latest_content["Critic"]
             # Only use Critic's response as fallback if Writer hasn't produced anything
             if not final_response:
                 final_response = critic_feedback
@@ -351,45 +604,44 @@ Please work together to answer this query comprehensively:
         if not final_response and messages:
             final_response = messages[-1].get("content", "")
 
-        return self._extract_results(query, messages, final_response, critic_feedback)
-
-    def _extract_results(self, query: str, messages: List[Dict[str, Any]], final_response: str = "", critic_feedback: str = "") -> Dict[str, Any]:
+        return self._extract_results(
+            query, messages, final_response, critic_feedback,
+            plan=plan, research_findings=research_findings, agents_involved=agents_involved,
+        )
+
+    def _extract_results(
+        self,
+        query: str,
+        messages: List[Dict[str, Any]],
+        final_response: str = "",
+        critic_feedback: str = "",
+        plan: str = "",
+        research_findings: Optional[List[str]] = None,
+        agents_involved: Optional[set] = None,
+    ) -> Dict[str, Any]:
         """
-        Extract structured results from the conversation history.
+        Assemble the structured result from values gathered while reading the conversation.
 
         Args:
             query: Original query
-            messages: List of conversation messages
+            messages: List of conversation messages (returned as a tuple of read-only mappings)
             final_response: Final response from the team (Writer's output)
             critic_feedback: Critic's evaluation/feedback
+            plan: First Planner message
+            research_findings: All Researcher messages, in order
+            agents_involved: Names of every agent that produced a message
 
         Returns:
             Structured result dictionary
         """
-        # Extract components from conversation
-        research_findings = []
-        plan = ""
-        critique = critic_feedback  # Use the passed critic_feedback
-
-        for msg in messages:
-            source = msg.get("source", "")
-            content = msg.get("content", "")
-
-            if source == "Planner" and not plan:
-                plan = content
-
-            elif source == "Researcher":
-                research_findings.append(content)
-
-            elif source == "Critic" and not critique:
-                # Only use this if critic_feedback wasn't passed
-                critique = content
+        research_findings = research_findings or []
+        agents_involved = agents_involved or set()
 
         # Count sources mentioned in research
         num_sources = 0
         for finding in research_findings:
             # Rough count of sources based on numbered results
-            num_sources += finding.count("\n1.") + finding.count("\n2.") + finding.count("\n3.")
+            num_sources += sum(1 for _ in _SOURCE_ITEM_RE.finditer(finding))
 
         # Clean up final response
         if final_response:
@@ -398,69 +650,35 @@ Please work together to answer this query comprehensively:
         return {
             "query": query,
             "response": final_response,
-            "conversation_history": messages,
+            # Read-only view: cached results share it without deep copies
+            "conversation_history": tuple(MappingProxyType(msg) for msg in messages),
             "metadata": {
                 "num_messages": len(messages),
                 "num_sources": max(num_sources, 1),  # At least 1
                 "plan": plan,
                 "research_findings": research_findings,
-                "critique": critique,
-                "agents_involved": list(set([msg.get("source", "") for msg in messages])),
+                "critique": critic_feedback,
+                "agents_involved": sorted(agents_involved),  # Deterministic order
             }
         }
 
-    def get_agent_descriptions(self) -> Dict[str, str]:
+    def get_agent_descriptions(self) -> Mapping[str, str]:
         """
         Get descriptions of all agents.
 
         Returns:
-            Dictionary mapping agent names to their descriptions
+            Read-only mapping of agent names to their descriptions (copy before modifying)
         """
-        return {
-            "Planner": "Breaks down research queries into actionable steps",
-            "Researcher": "Gathers evidence from web and academic sources",
-            "Writer": "Synthesizes findings into coherent responses",
-            "Critic": "Evaluates quality and provides feedback",
-        }
+        return _AGENT_DESCRIPTIONS
 
     def visualize_workflow(self) -> str:
         """
-        Generate a text visualization of the workflow.
+        Get a text visualization of the workflow.
 
         Returns:
             String representation of the workflow
         """
-        workflow = """
-AutoGen Research Workflow:
-
-1. User Query
-   ↓
-2. Planner
-   - Analyzes query
-   - Creates research plan
-   - Identifies key topics
-   ↓
-3. Researcher (with tools)
-   - Uses web_search() tool
-   - Uses paper_search() tool
-   - Gathers evidence
-   - Collects citations
-   ↓
-4. Writer
-   - Synthesizes findings
-   - Creates structured response
-   - Adds citations
-   ↓
-5. Critic
-   - Evaluates quality
-   - Checks completeness
-   - Provides feedback
-   ↓
-6. Decision Point
-   - If APPROVED → Final Response
-   - If NEEDS REVISION → Back to Writer
-        """
-        return workflow
+        return _WORKFLOW_VIZ
 
 
 def demonstrate_usage():
@@ -469,15 +687,14 @@ def demonstrate_usage():
 
     This function shows a simple example of using the orchestrator.
     """
-    import yaml
     from dotenv import load_dotenv
+    from src.config_loader import load_yaml_config
 
     # Load environment variables
     load_dotenv()
 
     # Load configuration
-    with open("config.yaml", "r") as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_config("config.yaml")
 
     # Create orchestrator
     orchestrator = AutoGenOrchestrator(config)
@@ -0,0 +1,26 @@
+"""
+Config Loader
+Parses the YAML configuration file (config.yaml).
+"""
+
+from typing import Any, Dict
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+def load_yaml_config(path: str = "config.yaml") -> Dict[str, Any]:
+    """
+    Parse a YAML configuration file with the LibYAML-backed safe loader when available.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=YamlLoader)  # nosec B506 - SafeLoader variant
@@ -4,8 +4,7 @@ Runs batch evaluations and generates reports.
 
 Example usage:
     # Load config
-    with open("config.yaml") as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_config("config.yaml")
 
     # Initialize evaluator with orchestrator
     evaluator = SystemEvaluator(config, orchestrator=my_orchestrator)
@@ -17,13 +16,199 @@ Example usage:
 """
 
 from typing import Dict, Any, List, Optional
+import re
 import json
+import hashlib
 import logging
+import itertools
 from pathlib import Path
 from datetime import datetime
 import asyncio
+from collections import Counter, defaultdict
+from collections.abc import Mapping
 
-from .judge import LLMJudge
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from .judge import LLMJudge, CachedJudge, BlockHashCache
+from .report_generator import EvaluationReportGenerator
+
+# Longest string kept verbatim in saved results
+_MAX_STRING_LENGTH = 50000
+
+# Repeated strings at least this long are stored once in saved results
+_MIN_INTERNED_LENGTH = 200
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _json_default(obj):
+    """Encode read-only mappings as objects and anything else (e.g. FunctionCall) as a string."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+def _to_json_bytes(obj) -> bytes:
+    """Serialize an object to indented UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def _truncate_text(text: str, max_string_length: int = _MAX_STRING_LENGTH) -> str:
+    """Cut a string to max_string_length characters, noting its original length."""
+    if len(text) <= max_string_length:
+        return text
+    return text[:max_string_length] + f"\n... [truncated, original length: {len(text)} characters]"
+
+
+def _shallow_copy(container):
+    return dict(container) if isinstance(container, Mapping) else list(container)
+
+
+def _iter_strings(root):
+    """Yield (path, text) for every string in a nested dict/list structure, iteratively."""
+    stack = [((), root)]
+    while stack:
+        path, node = stack.pop()
+        for key, child in (node.items() if isinstance(node, Mapping) else enumerate(node)):
+            if isinstance(child, str):
+                yield path + (key,), child
+            elif isinstance(child, (Mapping, list, tuple)):
+                stack.append((path + (key,), child))
+
+
+def _rewrite_strings(root, rewrite):
+    """
+    Replace strings anywhere in a nested structure.
+
+    rewrite(text) returns the replacement, or None to keep the string. Only the
+    containers on the paths to replaced strings are copied, so the caller's
+    data is untouched and everything else is shared. Returns root itself when
+    nothing is replaced.
+    """
+    replacements = []
+    for path, text in _iter_strings(root):
+        new_value = rewrite(text)
+        if new_value is not None:
+            replacements.append((path, new_value))
+
+    if not replacements:
+        return root
+
+    new_root = _shallow_copy(root)
+    copies = {(): new_root}
+    for path, new_value in replacements:
+        parent = new_root
+        for depth in range(1, len(path)):
+            child = copies.get(path[:depth])
+            if child is None:
+                child = copies[path[:depth]] = _shallow_copy(parent[path[depth - 1]])
+                parent[path[depth - 1]] = child
+            parent = child
+        parent[path[-1]] = new_value
+    return new_root
+
+
+def _truncate_long_strings(root, max_string_length: int = _MAX_STRING_LENGTH):
+    """Truncate strings longer than max_string_length anywhere in a nested structure."""
+    return _rewrite_strings(
+        root,
+        lambda text: _truncate_text(text, max_string_length) if len(text) > max_string_length else None
+    )
+
+
+def _intern_repeated_strings(root, min_length: int = _MIN_INTERNED_LENGTH):
+    """
+    Replace long strings that occur more than once with {"$ref": key} pointers.
+
+    Args:
+        root: Nested dict/list structure (e.g. detailed results)
+        min_length: Shortest string worth interning
+
+    Returns:
+        (structure with pointers, {key: text} table); root itself and an empty
+        table when nothing repeats
+    """
+    counts = Counter(text for _, text in _iter_strings(root) if len(text) >= min_length)
+    table = {}
+    keys = {}
+    for text, count in counts.items():
+        if count > 1:
+            key = hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+            keys[text] = key
+            table[key] = text
+
+    if not keys:
+        return root, table
+    return _rewrite_strings(root, lambda text: {"$ref": keys[text]} if text in keys else None), table
+
+
+def _make_overall_aggregator(judge_weights: Dict[str, float], total_weight: float):
+    """
+    Build the weighted overall-score function for a fixed set of judges.
+
+    Each call is a single weighted sum over the judges that responded, divided
+    by those judges' weights, so a failed perspective is left out rather than
+    counted as a zero score.
+
+    Args:
+        judge_weights: Judge perspective name -> weight, in configured order
+        total_weight: Sum of all configured weights
+
+    Returns:
+        Function mapping evaluations_by_judge to the weighted overall score
+    """
+    if total_weight <= 0:
+        return lambda evaluations_by_judge: 0.0
+
+    weights = tuple(judge_weights.items())
+
+    def aggregate_overall(evaluations_by_judge: Dict[str, Dict[str, Any]]) -> float:
+        weighted_sum = 0.0
+        present_weight = 0.0
+        for judge_name, weight in weights:
+            evaluation = evaluations_by_judge.get(judge_name)
+            if evaluation is not None:
+                weighted_sum += evaluation.get("overall_score", 0.0) * weight
+                present_weight += weight
+        return weighted_sum / present_weight if present_weight > 0 else 0.0
+
+    return aggregate_overall
+
+
+def _normalize_tokens(text: str) -> List[str]:
+    """Lowercase text and split it into words, dropping punctuation."""
+    return _WORD_RE.findall(text.lower())
+
+
+def _encode_report(obj) -> bytes:
+    """
+    Encode a report, truncating over-long strings only when one can exist.
+
+    A string over the limit encodes to more bytes than the limit, so payloads
+    that fit are written as-is without a Python-level walk of the tree.
+    """
+    payload = _to_json_bytes(obj)
+    if len(payload) > _MAX_STRING_LENGTH:
+        truncated = _truncate_long_strings(obj)
+        if truncated is not obj:
+            payload = _to_json_bytes(truncated)
+    return payload
 
 
 class SystemEvaluator:
@@ -38,13 +223,15 @@ class SystemEvaluator:
     - Perform error analysis
     """
 
-    def __init__(self, config: Dict[str, Any], orchestrator=None):
+    def __init__(self, config: Dict[str, Any], orchestrator=None, judge: Optional[LLMJudge] = None):
         """
         Initialize evaluator.
 
         Args:
             config: Configuration dictionary (from config.yaml)
             orchestrator: The orchestrator to evaluate
+            judge: Existing LLMJudge to reuse (keeps its API client and connection
+                pool across evaluators); a new one is created if omitted
         """
         self.config = config
         self.orchestrator = orchestrator
@@ -54,9 +241,23 @@ class SystemEvaluator:
         eval_config = config.get("evaluation", {})
         self.enabled = eval_config.get("enabled", True)
         self.max_test_queries = eval_config.get("num_test_queries", None)
-
-        # Initialize judge (passes config to load judge model settings and criteria)
-        self.judge = LLMJudge(config)
+        self.max_concurrency = max(1, int(eval_config.get("max_concurrency", 8)))
+        self.judge_concurrency = max(1, int(eval_config.get("judge_concurrency", self.max_concurrency)))
+        self.judge_batch_size = max(1, int(eval_config.get("judge_batch_size", 1)))
+
+        # Initialize judge (passes config to load judge model settings and criteria);
+        # a judge built here is closed by aclose(), a passed-in one belongs to the caller
+        self._owns_judge = judge is None
+        self.judge = judge or LLMJudge(config)
+        if eval_config.get("judge_cache", {}).get("enabled", False):
+            self.judge = CachedJudge(self.judge, config)
+
+        # Optional delta judging of responses that extend an earlier one
+        delta_config = eval_config.get("delta_judging", {})
+        self.block_cache = BlockHashCache(
+            threshold=delta_config.get("threshold", 0.8),
+            prefix_chars=delta_config.get("query_prefix_chars", 64)
+        ) if delta_config.get("enabled", False) else None
 
         # Load judge perspectives from config
         eval_config = config.get("evaluation", {})
@@ -65,11 +266,31 @@ class SystemEvaluator:
             # Default: use single judge if no perspectives configured
             self.judge_perspectives = [{"name": "default", "weight": 1.0}]
 
+        # Perspectives and weights are fixed for the evaluator's lifetime, so
+        # resolve them once instead of on every aggregation
+        self._judge_weights: Dict[str, float] = {
+            judge_config.get("name", "default"): judge_config.get("weight", 1.0)
+            for judge_config in self.judge_perspectives
+        }
+        self._total_judge_weight = sum(judge.get("weight", 1.0) for judge in self.judge_perspectives)
+        self._aggregate_overall = _make_overall_aggregator(self._judge_weights, self._total_judge_weight)
+
         # Evaluation results
         self.results: List[Dict[str, Any]] = []
 
         self.logger.info(f"SystemEvaluator initialized (enabled={self.enabled})")
 
+    async def aclose(self):
+        """Close the judge's HTTP connection pool if this evaluator created the judge."""
+        if self._owns_judge:
+            await self.judge.close()
+
+    async def __aenter__(self) -> "SystemEvaluator":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
     async def evaluate_system(
         self,
         test_queries_path: str = "data/test_queries.json"
@@ -98,31 +319,95 @@ class SystemEvaluator:
         self.logger.info("Starting system evaluation")
 
         # Load test queries
-        test_queries = self._load_test_queries(test_queries_path)
+        test_queries = await asyncio.to_thread(self._load_test_queries, test_queries_path)
         self.logger.info(f"Loaded {len(test_queries)} test queries")
 
-        # Evaluate each query
-        for i, test_case in enumerate(test_queries, 1):
-            self.logger.info(f"Evaluating query {i}/{len(test_queries)}")
-
+        if self.judge_batch_size > 1:
+            self.results.extend(await self._evaluate_batched(test_queries))
+            return await self._finish_evaluation()
+
+        if len(test_queries) < 2:
+            # A single query has nothing to overlap, so skip the task/queue set-up
+            for i, test_case in enumerate(test_queries, 1):
+                self.logger.info(f"Evaluating query {i}/{len(test_queries)}")
+                try:
+                    self.results.append(await self._evaluate_query(test_case))
+                except Exception as e:
+                    self.logger.error(f"Error evaluating query {i}: {e}")
+                    self.results.append({"query": test_case.get("query", ""), "error": str(e)})
+            return await self._finish_evaluation()
+
+        # Two-stage pipeline: up to max_concurrency orchestrator runs feed a queue
+        # drained by judge_concurrency judge workers, so a slow judge never holds
+        # an orchestrator slot. The bounded queue stalls producers (inside their
+        # slot) when judging falls behind, which keeps pending responses bounded.
+        orchestrator_slots = asyncio.Semaphore(self.max_concurrency)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self.judge_concurrency)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(test_queries)
+
+        async def produce(i: int, test_case: Dict[str, Any]):
+            # The caller acquired this producer's orchestrator slot
             try:
-                result = await self._evaluate_query(test_case)
-                self.results.append(result)
-            except Exception as e:
-                self.logger.error(f"Error evaluating query {i}: {e}")
-                self.results.append({
-                    "query": test_case.get("query", ""),
-                    "error": str(e)
-                })
-
+                self.logger.info(f"Evaluating query {i + 1}/{len(test_queries)}")
+                try:
+                    response_data = await self._run_system(test_case.get("query", ""))
+                except Exception as e:
+                    self.logger.error(f"Error evaluating query {i + 1}: {e}")
+                    results[i] = {"query": test_case.get("query", ""), "error": str(e)}
+                    return
+                await queue.put((i, test_case, response_data))
+            finally:
+                orchestrator_slots.release()
+
+        async def consume():
+            while (item := await queue.get()) is not None:
+                i, test_case, response_data = item
+                try:
+                    results[i] = await self._judge_all(test_case, response_data)
+                except Exception as e:
+                    self.logger.error(f"Error evaluating query {i + 1}: {e}")
+                    results[i] = {"query": test_case.get("query", ""), "error": str(e)}
+
+        consumers = [asyncio.create_task(consume()) for _ in range(self.judge_concurrency)]
+        producers = set()
+        try:
+            # Take a slot before creating each producer task, so at most
+            # max_concurrency producers exist at once however large the test set
+            for i, test_case in enumerate(test_queries):
+                await orchestrator_slots.acquire()
+                producer = asyncio.create_task(produce(i, test_case))
+                producers.add(producer)
+                producer.add_done_callback(producers.discard)
+            if producers:
+                await asyncio.gather(*producers)
+            for _ in consumers:
+                await queue.put(None)
+            await asyncio.gather(*consumers)
+        finally:
+            for task in (*producers, *consumers):
+                task.cancel()
+
+        # Results are stored by index, so reports keep test query order
+        self.results.extend(results)
+
+        return await self._finish_evaluation()
+
+    async def _finish_evaluation(self) -> Dict[str, Any]:
+        """Aggregate self.results into a report and save it."""
         # Aggregate results
         report = self._generate_report()
 
-        # Save results
-        self._save_results(report)
+        # One timestamp and directory for every output file of this run
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_dir = Path("outputs")
+
+        # Saving (encoding + disk writes) and report formatting are blocking,
+        # so they run in worker threads and keep the event loop responsive
+        await asyncio.to_thread(output_dir.mkdir, exist_ok=True)
+        await asyncio.to_thread(self._save_results, report, output_dir, timestamp)
 
-        # Generate markdown report for write-up
-        self._generate_markdown_report(report)
+        # Text summary and markdown report for write-up
+        await asyncio.to_thread(self._write_reports, report, output_dir, timestamp)
 
         return report
 
@@ -135,67 +420,302 @@ class SystemEvaluator:
 
         Returns:
             Evaluation result for this query
+        """
+        response_data = await self._run_system(test_case.get("query", ""))
+        return await self._judge_all(test_case, response_data)
 
-        This shows how to integrate with the orchestrator.
+    async def _run_system(self, query: str) -> Dict[str, Any]:
         """
-        query = test_case.get("query", "")
-        ground_truth = test_case.get("ground_truth")
-        expected_sources = test_case.get("expected_sources", [])
+        Get the system's response to a query.
+
+        Args:
+            query: The query to run
+
+        Returns:
+            Orchestrator result (or an error/placeholder result in the same shape)
 
+        This shows how to integrate with the orchestrator.
+        """
         # Run through orchestrator if available
         if self.orchestrator:
             try:
                 # Use async version to avoid blocking the event loop
                 # This allows proper async/await flow and prevents event loop conflicts
-                response_data = await self.orchestrator.process_query_async(query)
+                return await self.orchestrator.process_query_async(query)
 
             except Exception as e:
                 self.logger.error(f"Error processing query through orchestrator: {e}")
-                response_data = {
+                return {
                     "query": query,
                     "response": f"Error: {str(e)}",
                     "citations": [],
                     "metadata": {"error": str(e)}
                 }
-        else:
-            # Placeholder for testing without orchestrator
-            self.logger.warning("No orchestrator provided, using placeholder response")
-            response_data = {
-                "query": query,
-                "response": "Placeholder response - orchestrator not connected",
-                "citations": [],
-                "metadata": {"num_sources": 0}
-            }
 
-        # Evaluate response using multiple judge perspectives
-        evaluations_by_judge = {}
+        # Placeholder for testing without orchestrator
+        self.logger.warning("No orchestrator provided, using placeholder response")
+        return {
+            "query": query,
+            "response": "Placeholder response - orchestrator not connected",
+            "citations": [],
+            "metadata": {"num_sources": 0}
+        }
 
-        for judge_config in self.judge_perspectives:
-            judge_name = judge_config.get("name", "default")
-            self.logger.info(f"Evaluating with judge perspective: {judge_name}")
+    async def _judge_all(self, test_case: Dict[str, Any], response_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Judge a system response from every configured perspective.
 
-            evaluation = await self.judge.evaluate(
-                query=query,
-                response=response_data.get("response", ""),
-                sources=response_data.get("metadata", {}).get("sources", []),
-                ground_truth=ground_truth,
-                judge_perspective=judge_name
+        Args:
+            test_case: Test case with query and optional ground truth
+            response_data: The system's result for the test case's query
+
+        Returns:
+            Evaluation result for this query
+        """
+        deterministic = self._deterministic_result(test_case, response_data)
+        if deterministic is not None:
+            return deterministic
+
+        query = test_case.get("query", "")
+        ground_truth = test_case.get("ground_truth")
+
+        # Evaluate response using multiple judge perspectives; the judges share
+        # no state, so all of them run at once
+        response = response_data.get("response", "")
+        sources = response_data.get("metadata", {}).get("sources", [])
+        judge_names = list(self._judge_weights)
+        self.logger.info(f"Evaluating with judge perspectives: {', '.join(judge_names)}")
+
+        if len(judge_names) == 1:
+            # gather wraps every coroutine in a Task, which costs an extra event
+            # loop iteration; with nothing to overlap, await the judge directly
+            try:
+                evaluations = [await self._judge_response(query, response, sources, ground_truth, judge_names[0])]
+            except Exception as e:
+                evaluations = [e]
+        else:
+            evaluations = await asyncio.gather(
+                *(
+                    self._judge_response(query, response, sources, ground_truth, judge_name)
+                    for judge_name in judge_names
+                ),
+                return_exceptions=True
             )
 
+        evaluations_by_judge = {}
+        for judge_name, evaluation in zip(judge_names, evaluations):
+            if isinstance(evaluation, Exception):
+                self.logger.error(f"Judge perspective {judge_name} failed: {evaluation}")
+                continue
             evaluations_by_judge[judge_name] = evaluation
 
+        return self._build_result(test_case, response_data, evaluations_by_judge)
+
+    def _deterministic_result(
+        self,
+        test_case: Dict[str, Any],
+        response_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Score a response without the judge when the ground truth settles it.
+
+        Applies to test cases with a ground truth and no expected sources. Cases
+        marked exact_match score 1.0 or 0.0 on a normalized string comparison;
+        other cases score 1.0 when the response's tokens match the ground truth's
+        (Jaccard overlap above 0.95) and otherwise go to the judge. The evaluation's
+        "cached" key records which path scored it ("exact_match" or "token_overlap").
+
+        Args:
+            test_case: Test case with query and optional ground truth
+            response_data: The system's result for the test case's query
+
+        Returns:
+            A result entry, or None if the response needs judging
+        """
+        ground_truth = test_case.get("ground_truth")
+        if not ground_truth or test_case.get("expected_sources"):
+            return None
+
+        response_tokens = _normalize_tokens(response_data.get("response", ""))
+        truth_tokens = _normalize_tokens(ground_truth)
+
+        if test_case.get("exact_match"):
+            match_type = "exact_match"
+            score = 1.0 if response_tokens == truth_tokens else 0.0
+        else:
+            match_type = "token_overlap"
+            response_set, truth_set = set(response_tokens), set(truth_tokens)
+            union = response_set | truth_set
+            if not union or len(response_set & truth_set) / len(union) <= 0.95:
+                return None
+            score = 1.0
+
+        self.logger.info(f"Deterministic ground-truth {match_type} (score {score:.1f}), skipping judges")
+        return {
+            "query": test_case.get("query", ""),
+            "response": response_data.get("response", ""),
+            "evaluation": {
+                "overall_score": score,
+                "criterion_scores": {},
+                "cached": match_type,
+            },
+            "evaluations_by_judge": {},
+            "metadata": response_data.get("metadata", {}),
+            "ground_truth": ground_truth
+        }
+
+    def _build_result(
+        self,
+        test_case: Dict[str, Any],
+        response_data: Dict[str, Any],
+        evaluations_by_judge: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Combine a system response and its judge evaluations into a result entry.
+
+        Args:
+            test_case: Test case with query and optional ground truth
+            response_data: The system's result for the test case's query
+            evaluations_by_judge: Dictionary mapping judge names to their evaluations
+
+        Returns:
+            Evaluation result for this query, or an error entry (left out of the
+            statistics) when no judge perspective produced an evaluation
+        """
+        if not evaluations_by_judge:
+            return {"query": test_case.get("query", ""), "error": "All judge perspectives failed"}
+
         # Aggregate evaluations from multiple judges
         aggregated_evaluation = self._aggregate_judge_evaluations(evaluations_by_judge)
 
         return {
-            "query": query,
+            "query": test_case.get("query", ""),
             "response": response_data.get("response", ""),
             "evaluation": aggregated_evaluation,
             "evaluations_by_judge": evaluations_by_judge,  # Keep individual judge scores
             "metadata": response_data.get("metadata", {}),
-            "ground_truth": ground_truth
+            "ground_truth": test_case.get("ground_truth")
         }
 
+    async def _evaluate_batched(self, test_queries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate test queries with batched judge calls.
+
+        System responses are collected first (concurrently), then each chunk of
+        judge_batch_size responses is scored with one judge call per criterion
+        and perspective instead of one per response.
+
+        Args:
+            test_queries: Test cases to evaluate
+
+        Returns:
+            Evaluation results, in test query order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(test_queries)
+
+        async def run_bounded(i: int, test_case: Dict[str, Any]):
+            # The caller acquired this task's slot
+            try:
+                responses[i] = await self._run_system(test_case.get("query", ""))
+            finally:
+                semaphore.release()
+
+        # Acquire before create_task so in-flight tasks stay bounded on huge test sets
+        tasks = []
+        for i, test_case in enumerate(test_queries):
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(run_bounded(i, test_case)))
+        await asyncio.gather(*tasks)
+
+        # Responses the ground truth settles never reach the judge
+        results: List[Optional[Dict[str, Any]]] = []
+        pending = []
+        for i, (test_case, response_data) in enumerate(zip(test_queries, responses)):
+            results.append(self._deterministic_result(test_case, response_data))
+            if results[-1] is None:
+                pending.append(i)
+
+        judge_names = list(self._judge_weights)
+        for start in range(0, len(pending), self.judge_batch_size):
+            indices = pending[start:start + self.judge_batch_size]
+            examples = [
+                {
+                    "query": test_queries[i].get("query", ""),
+                    "response": responses[i].get("response", ""),
+                    "sources": responses[i].get("metadata", {}).get("sources", []),
+                    "ground_truth": test_queries[i].get("ground_truth"),
+                }
+                for i in indices
+            ]
+            self.logger.info(f"Judging {len(indices)} responses in one batch per perspective")
+
+            batches = await asyncio.gather(
+                *(self.judge.evaluate_batch(examples, judge_perspective=judge_name) for judge_name in judge_names),
+                return_exceptions=True
+            )
+
+            for position, i in enumerate(indices):
+                evaluations_by_judge = {}
+                for judge_name, batch in zip(judge_names, batches):
+                    if isinstance(batch, Exception):
+                        self.logger.error(f"Judge perspective {judge_name} failed: {batch}")
+                        continue
+                    evaluations_by_judge[judge_name] = batch[position]
+                results[i] = self._build_result(test_queries[i], responses[i], evaluations_by_judge)
+
+        return results
+
+    async def _judge_response(
+        self,
+        query: str,
+        response: str,
+        sources: List[Dict[str, Any]],
+        ground_truth: Optional[str],
+        judge_name: str
+    ) -> Dict[str, Any]:
+        """
+        Judge a response from one perspective, delta-judging it when it extends
+        a response already judged for a similar query.
+
+        Args:
+            query: The original query
+            response: The system's response
+            sources: Sources used in the response
+            ground_truth: Optional ground truth/expected response
+            judge_name: Judge perspective name
+
+        Returns:
+            The judge's evaluation
+        """
+        prior = self.block_cache.lookup(judge_name, query, response) if self.block_cache else None
+
+        if prior is None:
+            evaluation = await self.judge.evaluate(
+                query=query,
+                response=response,
+                sources=sources,
+                ground_truth=ground_truth,
+                judge_perspective=judge_name
+            )
+        else:
+            delta, previous_verdict = prior
+            if not delta:
+                self.logger.info(f"Reusing {judge_name} verdict for an unchanged response")
+                return previous_verdict
+            self.logger.info(f"Delta-judging {len(delta)} new characters with {judge_name}")
+            evaluation = await self.judge.evaluate_delta(
+                query=query,
+                delta=delta,
+                previous_verdict=previous_verdict,
+                ground_truth=ground_truth,
+                judge_perspective=judge_name
+            )
+
+        if self.block_cache:
+            self.block_cache.store(judge_name, query, response, evaluation)
+        return evaluation
+
     def _load_test_queries(self, path: str) -> List[Dict[str, Any]]:
         """
         Load test queries from JSON file.
@@ -209,8 +729,17 @@ class SystemEvaluator:
             self.logger.warning(f"Test queries file not found: {path}")
             return []
 
-        with open(path_obj, 'r') as f:
-            queries = json.load(f)
+        if IJSON_AVAILABLE:
+            # Stream the top-level array so parsing stops once the limit is reached
+            with open(path_obj, 'rb') as f:
+                items = ijson.items(f, 'item', use_float=True)
+                if self.max_test_queries:
+                    queries = list(itertools.islice(items, self.max_test_queries + 1))
+                else:
+                    queries = list(items)
+        else:
+            with open(path_obj, 'r') as f:
+                queries = json.load(f)
 
         # Limit number of queries if configured in config.yaml
         if self.max_test_queries and len(queries) > self.max_test_queries:
@@ -232,56 +761,58 @@ class SystemEvaluator:
         if not self.results:
             return {"error": "No results to report"}
 
-        # Calculate statistics
+        # Aggregate everything in a single pass with running [sum, count] totals
         total_queries = len(self.results)
-        successful = [r for r in self.results if "error" not in r]
-        failed = [r for r in self.results if "error" in r]
-
-        # Aggregate scores
-        criterion_scores = {}
-        overall_scores = []
-        judge_scores = {}  # Track scores by individual judge
+        num_successful = 0
+        deterministic_hits = 0
+        overall_sum = 0.0
+        best_score = worst_score = 0.0
+        best_result = worst_result = None
+        criterion_totals = defaultdict(lambda: [0.0, 0])
+        judge_totals = defaultdict(lambda: [0.0, 0])  # Track scores by individual judge
+
+        for result in self.results:
+            if "error" in result:
+                continue
+            num_successful += 1
 
-        for result in successful:
             evaluation = result.get("evaluation", {})
-            overall_scores.append(evaluation.get("overall_score", 0.0))
-
-            # Collect scores by criterion (aggregated)
+            overall_score = evaluation.get("overall_score", 0.0)
+            overall_sum += overall_score
+            if evaluation.get("cached"):
+                deterministic_hits += 1
+
+            # Strict comparisons keep the first result on ties
+            if best_result is None or overall_score > best_score:
+                best_score, best_result = overall_score, result
+            if worst_result is None or overall_score < worst_score:
+                worst_score, worst_result = overall_score, result
+
+            # Scores by criterion (aggregated)
             for criterion, score_data in evaluation.get("criterion_scores", {}).items():
-                if criterion not in criterion_scores:
-                    criterion_scores[criterion] = []
-                criterion_scores[criterion].append(score_data.get("score", 0.0))
+                totals = criterion_totals[criterion]
+                totals[0] += score_data.get("score", 0.0)
+                totals[1] += 1
 
-            # Collect scores by individual judge
-            evaluations_by_judge = result.get("evaluations_by_judge", {})
-            for judge_name, judge_eval in evaluations_by_judge.items():
-                if judge_name not in judge_scores:
-                    judge_scores[judge_name] = []
-                judge_scores[judge_name].append(judge_eval.get("overall_score", 0.0))
+            # Scores by individual judge
+            for judge_name, judge_eval in result.get("evaluations_by_judge", {}).items():
+                totals = judge_totals[judge_name]
+                totals[0] += judge_eval.get("overall_score", 0.0)
+                totals[1] += 1
 
         # Calculate averages
-        avg_overall = sum(overall_scores) / len(overall_scores) if overall_scores else 0.0
-
-        avg_criterion_scores = {}
-        for criterion, scores in criterion_scores.items():
-            avg_criterion_scores[criterion] = sum(scores) / len(scores) if scores else 0.0
-
-        # Calculate averages by judge
-        avg_by_judge = {}
-        for judge_name, scores in judge_scores.items():
-            avg_by_judge[judge_name] = sum(scores) / len(scores) if scores else 0.0
-
-        # Find best and worst
-        best_result = max(successful, key=lambda r: r.get("evaluation", {}).get("overall_score", 0.0)) if successful else None
-        worst_result = min(successful, key=lambda r: r.get("evaluation", {}).get("overall_score", 0.0)) if successful else None
+        avg_overall = overall_sum / num_successful if num_successful else 0.0
+        avg_criterion_scores = {criterion: total / count for criterion, (total, count) in criterion_totals.items()}
+        avg_by_judge = {judge_name: total / count for judge_name, (total, count) in judge_totals.items()}
 
         report = {
             "timestamp": datetime.now().isoformat(),
             "summary": {
                 "total_queries": total_queries,
-                "successful": len(successful),
-                "failed": len(failed),
-                "success_rate": len(successful) / total_queries if total_queries > 0 else 0.0,
+                "successful": num_successful,
+                "failed": total_queries - num_successful,
+                "success_rate": num_successful / total_queries if total_queries > 0 else 0.0,
+                "deterministic_hits": deterministic_hits,  # Scored from ground truth without a judge call
                 "num_judges": len(self.judge_perspectives),
                 "judge_perspectives": [j.get("name") for j in self.judge_perspectives]
             },
@@ -291,12 +822,12 @@ class SystemEvaluator:
                 "by_judge": avg_by_judge  # Average scores from each judge perspective
             },
             "best_result": {
-                "query": best_result.get("query", "") if best_result else "",
-                "score": best_result.get("evaluation", {}).get("overall_score", 0.0) if best_result else 0.0
+                "query": best_result.get("query", ""),
+                "score": best_score
             } if best_result else None,
             "worst_result": {
-                "query": worst_result.get("query", "") if worst_result else "",
-                "score": worst_result.get("evaluation", {}).get("overall_score", 0.0) if worst_result else 0.0
+                "query": worst_result.get("query", ""),
+                "score": worst_score
             } if worst_result else None,
             "detailed_results": self.results
         }
@@ -316,59 +847,41 @@ class SystemEvaluator:
         if not evaluations_by_judge:
             return {"overall_score": 0.0, "criterion_scores": {}}
 
-        # Get weights for each judge
-        total_weight = sum(judge.get("weight", 1.0) for judge in self.judge_perspectives)
+        # Judges that returned an evaluation, in configured order, with their weights
+        present = [
+            (judge_name, weight, evaluations_by_judge[judge_name])
+            for judge_name, weight in self._judge_weights.items()
+            if judge_name in evaluations_by_judge
+        ]
 
         # Aggregate overall scores
-        weighted_overall = 0.0
-        for judge_config in self.judge_perspectives:
-            judge_name = judge_config.get("name", "default")
-            weight = judge_config.get("weight", 1.0)
-            if judge_name in evaluations_by_judge:
-                overall_score = evaluations_by_judge[judge_name].get("overall_score", 0.0)
-                weighted_overall += overall_score * weight
-
-        aggregated_overall = weighted_overall / total_weight if total_weight > 0 else 0.0
-
-        # Aggregate criterion scores
-        aggregated_criteria = {}
-        all_criteria = set()
-        for eval_data in evaluations_by_judge.values():
-            all_criteria.update(eval_data.get("criterion_scores", {}).keys())
-
-        for criterion_name in all_criteria:
-            weighted_score = 0.0
-            criterion_weight_sum = 0.0
-
-            for judge_config in self.judge_perspectives:
-                judge_name = judge_config.get("name", "default")
-                weight = judge_config.get("weight", 1.0)
-
-                if judge_name in evaluations_by_judge:
-                    criterion_scores = evaluations_by_judge[judge_name].get("criterion_scores", {})
-                    if criterion_name in criterion_scores:
-                        score_value = criterion_scores[criterion_name].get("score", 0.0)
-                        weighted_score += score_value * weight
-                        criterion_weight_sum += weight
-
-            avg_score = weighted_score / criterion_weight_sum if criterion_weight_sum > 0 else 0.0
-
-            # Collect reasoning from all judges
-            reasoning_list = []
-            for judge_config in self.judge_perspectives:
-                judge_name = judge_config.get("name", "default")
-                if judge_name in evaluations_by_judge:
-                    criterion_scores = evaluations_by_judge[judge_name].get("criterion_scores", {})
-                    if criterion_name in criterion_scores:
-                        reasoning = criterion_scores[criterion_name].get("reasoning", "")
-                        if reasoning:
-                            reasoning_list.append(f"[{judge_name}]: {reasoning}")
-
-            aggregated_criteria[criterion_name] = {
-                "score": avg_score,
-                "reasoning": " | ".join(reasoning_list) if reasoning_list else "No reasoning provided",
-                "num_judges": len([j for j in self.judge_perspectives if j.get("name") in evaluations_by_judge])
+        aggregated_overall = self._aggregate_overall(evaluations_by_judge)
+
+        # Aggregate criterion scores in one pass over the (judge, criterion) grid,
+        # accumulating [weighted score, weight sum, reasoning] per criterion
+        criterion_totals: Dict[str, list] = {}
+        for judge_name, weight, eval_data in present:
+            for criterion_name, score_data in eval_data.get("criterion_scores", {}).items():
+                totals = criterion_totals.get(criterion_name)
+                if totals is None:
+                    totals = criterion_totals[criterion_name] = [0.0, 0.0, []]
+                totals[0] += score_data.get("score", 0.0) * weight
+                totals[1] += weight
+
+                # Collect reasoning from all judges
+                reasoning = score_data.get("reasoning", "")
+                if reasoning:
+                    totals[2].append(f"[{judge_name}]: {reasoning}")
+
+        num_judges = len(present)
+        aggregated_criteria = {
+            criterion_name: {
+                "score": weighted_score / weight_sum if weight_sum > 0 else 0.0,
+                "reasoning": _truncate_text(" | ".join(reasoning_list)) if reasoning_list else "No reasoning provided",
+                "num_judges": num_judges
             }
+            for criterion_name, (weighted_score, weight_sum, reasoning_list) in criterion_totals.items()
+        }
 
         return {
             "overall_score": aggregated_overall,
@@ -377,104 +890,77 @@ class SystemEvaluator:
             "judge_names": list(evaluations_by_judge.keys())
         }
 
-    def _save_results(self, report: Dict[str, Any]):
+    def _save_results(self, report: Dict[str, Any], output_dir: Path, timestamp: str):
         """
         Save evaluation results to file.
 
-        TODO: YOUR CODE HERE
-        - Save detailed results
-        - Generate visualizations
-        - Create summary report
+        Args:
+            report: Report from _generate_report
+            output_dir: Existing directory to write into
+            timestamp: Suffix shared by all output files of this run
         """
-        output_dir = Path("outputs")
-        output_dir.mkdir(exist_ok=True)
-
         # Save detailed results
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         results_file = output_dir / f"evaluation_{timestamp}.json"
 
-        # Serialize report to handle FunctionCall and other non-serializable objects
-        def make_serializable(obj, max_string_length=50000):
-            """Recursively convert objects to JSON-serializable format."""
-            if isinstance(obj, dict):
-                return {k: make_serializable(v, max_string_length) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [make_serializable(item, max_string_length) for item in obj]
-            elif isinstance(obj, str):
-                if len(obj) > max_string_length:
-                    return obj[:max_string_length] + f"\n... [truncated, original length: {len(obj)} characters]"
-                return obj
-            elif isinstance(obj, (int, float, bool, type(None))):
-                return obj
-            else:
-                # Convert non-serializable objects (like FunctionCall) to string
-                return str(obj)
-
-        serializable_report = make_serializable(report)
+        # Long strings repeated across results (e.g. reused judge reasoning) are
+        # written once to an interned_strings table and referenced by {"$ref": key}
+        detailed_results, interned = _intern_repeated_strings(report.get("detailed_results", []))
+        if interned:
+            report = {**report, "detailed_results": detailed_results, "interned_strings": interned}
 
-        try:
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(serializable_report, f, indent=2, ensure_ascii=False)
-        except (TypeError, ValueError) as e:
-            # If serialization still fails, try with more aggressive conversion
-            self.logger.warning(f"JSON serialization issue: {e}, attempting fallback serialization...")
-
-            # Fallback: convert everything to strings if needed
-            def force_serialize(obj):
-                if isinstance(obj, dict):
-                    return {str(k): force_serialize(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [force_serialize(item) for item in obj]
-                elif isinstance(obj, (str, int, float, bool, type(None))):
-                    return obj
-                else:
-                    return str(obj)
-
-            serializable_report = force_serialize(report)
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(serializable_report, f, indent=2, ensure_ascii=False)
+        # Non-serializable objects (like FunctionCall) go through the default
+        # hook, so a single encode always succeeds
+        results_file.write_bytes(_encode_report(report))
 
         self.logger.info(f"Evaluation results saved to {results_file}")
 
-        # Save summary
-        summary_file = output_dir / f"evaluation_summary_{timestamp}.txt"
-        with open(summary_file, 'w') as f:
-            f.write("EVALUATION SUMMARY\n")
-            f.write("=" * 70 + "\n\n")
-
-            summary = report.get("summary", {})
-            f.write(f"Total Queries: {summary.get('total_queries', 0)}\n")
-            f.write(f"Successful: {summary.get('successful', 0)}\n")
-            f.write(f"Failed: {summary.get('failed', 0)}\n")
-            f.write(f"Success Rate: {summary.get('success_rate', 0.0):.2%}\n\n")
+    def _format_summary(self, report: Dict[str, Any]) -> str:
+        """
+        Render the plain-text evaluation summary.
 
-            scores = report.get("scores", {})
-            f.write(f"Overall Average Score: {scores.get('overall_average', 0.0):.3f}\n\n")
+        Args:
+            report: Report from _generate_report
 
-            f.write("Scores by Judge Perspective:\n")
-            for judge_name, score in scores.get("by_judge", {}).items():
-                f.write(f"  {judge_name}: {score:.3f}\n")
-            f.write("\n")
+        Returns:
+            Summary text
+        """
+        summary = report.get("summary", {})
+        scores = report.get("scores", {})
+        lines = [
+            "EVALUATION SUMMARY\n",
+            "=" * 70 + "\n\n",
+            f"Total Queries: {summary.get('total_queries', 0)}\n",
+            f"Successful: {summary.get('successful', 0)}\n",
+            f"Failed: {summary.get('failed', 0)}\n",
+            f"Success Rate: {summary.get('success_rate', 0.0):.2%}\n\n",
+            f"Overall Average Score: {scores.get('overall_average', 0.0):.3f}\n\n",
+            "Scores by Judge Perspective:\n",
+        ]
+        lines.extend(f"  {judge_name}: {score:.3f}\n" for judge_name, score in scores.get("by_judge", {}).items())
+        lines.append("\n")
+        lines.append("Scores by Criterion:\n")
+        lines.extend(f"  {criterion}: {score:.3f}\n" for criterion, score in scores.get("by_criterion", {}).items())
+        return "".join(lines)
+
+    def _write_reports(self, report: Dict[str, Any], output_dir: Path, timestamp: str):
+        """
+        Write the text summary and the markdown report for the technical write-up.
 
-            f.write("Scores by Criterion:\n")
-            for criterion, score in scores.get("by_criterion", {}).items():
-                f.write(f"  {criterion}: {score:.3f}\n")
+        Both are rendered in memory from the same report and written with one
+        call each.
 
+        Args:
+            report: Report from _generate_report
+            output_dir: Existing directory to write into
+            timestamp: Suffix shared by all output files of this run
+        """
+        summary_file = output_dir / f"evaluation_summary_{timestamp}.txt"
+        summary_file.write_text(self._format_summary(report), encoding="utf-8")
         self.logger.info(f"Summary saved to {summary_file}")
 
-    def _generate_markdown_report(self, report: Dict[str, Any]):
-        """
-        Generate markdown report for inclusion in technical write-up.
-        """
         try:
-            from .report_generator import EvaluationReportGenerator
-
-            generator = EvaluationReportGenerator(report)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_file = Path("outputs") / f"evaluation_report_{timestamp}.md"
-            report_file.parent.mkdir(exist_ok=True)
-
-            generator.save_report(str(report_file), format="markdown")
+            report_file = output_dir / f"evaluation_report_{timestamp}.md"
+            report_file.write_text(EvaluationReportGenerator(report).generate_markdown_report(), encoding="utf-8")
             self.logger.info(f"Markdown report saved to {report_file}")
         except Exception as e:
             self.logger.warning(f"Could not generate markdown report: {e}")
@@ -499,24 +985,26 @@ class SystemEvaluator:
             "results": self.results
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        Path(output_path).write_bytes(_encode_report(report_data))
 
         self.logger.info(f"Report data exported to {output_path}")
 
 
-async def example_simple_evaluation():
+async def example_simple_evaluation(judge: Optional[LLMJudge] = None):
     """
     Example 1: Simple evaluation without orchestrator
     Tests the evaluation pipeline with mock responses
 
+    Args:
+        judge: Optional LLMJudge to reuse across examples
+
     Usage:
         import asyncio
         from src.evaluation.evaluator import example_simple_evaluation
         asyncio.run(example_simple_evaluation())
     """
-    import yaml
     from dotenv import load_dotenv
+    from src.config_loader import load_yaml_config
 
     load_dotenv()
 
@@ -525,8 +1013,7 @@ async def example_simple_evaluation():
     print("=" * 70)
 
     # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_config("config.yaml")
 
     # Create test queries in memory (no file needed)
     test_queries = [
@@ -547,13 +1034,16 @@ async def example_simple_evaluation():
         json.dump(test_queries, f, indent=2)
 
     # Initialize evaluator without orchestrator
-    evaluator = SystemEvaluator(config, orchestrator=None)
+    evaluator = SystemEvaluator(config, orchestrator=None, judge=judge)
 
     print("\nRunning evaluation on test queries...")
     print("Note: Using placeholder responses since no orchestrator is connected\n")
 
     # Run evaluation
-    report = await evaluator.evaluate_system(str(test_file))
+    try:
+        report = await evaluator.evaluate_system(str(test_file))
+    finally:
+        await evaluator.aclose()
 
     # Display results
     print("\n" + "=" * 70)
@@ -574,18 +1064,21 @@ async def example_simple_evaluation():
     test_file.unlink()
 
 
-async def example_with_orchestrator():
+async def example_with_orchestrator(judge: Optional[LLMJudge] = None):
     """
     Example 2: Evaluation with orchestrator
     Shows how to connect the evaluator to your multi-agent system
 
+    Args:
+        judge: Optional LLMJudge to reuse across examples
+
     Usage:
         import asyncio
         from src.evaluation.evaluator import example_with_orchestrator
         asyncio.run(example_with_orchestrator())
     """
-    import yaml
     from dotenv import load_dotenv
+    from src.config_loader import load_yaml_config
 
     load_dotenv()
 
@@ -594,8 +1087,7 @@ async def example_with_orchestrator():
     print("=" * 70)
 
     # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_config("config.yaml")
 
     # Initialize orchestrator
     # TODO: YOUR CODE HERE
@@ -623,13 +1115,16 @@ async def example_with_orchestrator():
         json.dump(test_queries, f, indent=2)
 
     # Initialize evaluator with orchestrator
-    evaluator = SystemEvaluator(config, orchestrator=orchestrator)
+    evaluator = SystemEvaluator(config, orchestrator=orchestrator, judge=judge)
 
     print("\nRunning evaluation with real orchestrator...")
     print("This will actually query your multi-agent system\n")
 
     # Run evaluation
-    report = await evaluator.evaluate_system(str(test_file))
+    try:
+        report = await evaluator.evaluate_system(str(test_file))
+    finally:
+        await evaluator.aclose()
 
     # Display results
     print("\n" + "=" * 70)
@@ -658,16 +1153,33 @@ async def example_with_orchestrator():
     test_file.unlink()
 
 
-# For direct execution
-if __name__ == "__main__":
-    import asyncio
+async def run_examples():
+    """
+    Run both examples on one event loop with one shared judge.
 
-    print("Running SystemEvaluator Examples\n")
+    Per-loop resources (the orchestrator's model clients and HTTP pool) and the
+    judge's API client survive from the first example to the second instead of
+    being rebuilt by a second asyncio.run().
+    """
+    from dotenv import load_dotenv
+    from src.config_loader import load_yaml_config
+
+    load_dotenv()
+
+    config = load_yaml_config("config.yaml")
 
-    # Run example 1
-    asyncio.run(example_simple_evaluation())
+    async with LLMJudge(config) as judge:
+        # Run example 1
+        await example_simple_evaluation(judge)
 
-    print("\n\n")
+        print("\n\n")
+
+        # Run example 2 (if orchestrator is available)
+        await example_with_orchestrator(judge)
+
+
+# For direct execution
+if __name__ == "__main__":
+    print("Running SystemEvaluator Examples\n")
 
-    # Run example 2 (if orchestrator is available)
-    asyncio.run(example_with_orchestrator())
+    asyncio.run(run_examples())
@@ -18,12 +18,98 @@ Example usage:
     print(f"Criterion Scores: {result['criterion_scores']}")
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Final, Iterable, List, Optional
+from collections import OrderedDict
+from pathlib import Path
+import asyncio
+import hashlib
 import logging
 import json
+import operator
 import os
 import re
-from groq import Groq
+import httpx
+from groq import AsyncGroq, DefaultAsyncHttpxClient
+
+try:
+    import h2  # noqa: F401 - enables httpx's HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Connection pool for the judge's Groq client; concurrent judge calls reuse
+# keep-alive connections (multiplexed over one connection with HTTP/2)
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Tokenizer used to budget judged responses by tokens (an approximation of the
+# judge model's own tokenizer); loaded on first use
+_TOKEN_ENCODING_NAME = "cl100k_base"
+_token_encoding = None
+
+# Parser for judge output; orjson.JSONDecodeError subclasses json.JSONDecodeError,
+# so callers catch the same exception either way
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+# Judge system instructions per perspective ("default" when none is given)
+_PERSPECTIVES: Final[Dict[str, str]] = {
+    "comprehensive_rubric": """You are an expert evaluator using a comprehensive rubric-based approach. You evaluate research responses systematically across multiple dimensions, providing detailed, structured assessments. Your evaluations are thorough, objective, and based on clear criteria. You consider all aspects of the response and provide balanced feedback.""",
+    "ethical_expert": """You are an expert in Ethical AI in Education with deep knowledge of:
+- AI ethics principles and frameworks
+- Educational technology ethics
+- Student privacy and data protection (FERPA, COPPA)
+- Algorithmic bias and fairness in educational contexts
+- Transparency, accountability, and explainability in educational AI
+- Pedagogical implications of AI systems
+
+You evaluate responses from the perspective of someone who understands both the technical aspects of AI and the ethical considerations specific to educational settings. You pay special attention to:
+- Practical applicability to educational contexts
+- Consideration of multiple stakeholder perspectives (students, educators, parents, institutions)
+- Alignment with established ethical frameworks
+- Real-world implications and potential harms
+- Balance between innovation and ethical safeguards
+
+Your evaluations are informed by both theoretical understanding and practical experience with ethical AI in education.""",
+    "default": """You are an expert evaluator specializing in research quality assessment. You evaluate responses based on established academic and professional standards, considering relevance, evidence quality, accuracy, safety, and clarity.""",
+}
+
+_RUBRIC_BLOCK: Final[str] = """**SCORING RUBRIC:**
+- 0.0-0.3: Poor - Major deficiencies, does not meet criterion
+- 0.4-0.5: Below Average - Significant gaps or issues
+- 0.6-0.7: Average - Meets basic requirements but has notable weaknesses
+- 0.8-0.9: Good - Strong performance with minor areas for improvement
+- 0.9-1.0: Excellent - Outstanding performance, exceeds expectations
+"""
+
+# Fallbacks for pulling a verdict out of truncated judge JSON
+_SCORE_RE = re.compile(r'"score"\s*:\s*([0-9.]+)')
+_REASONING_RE = re.compile(r'"reasoning"\s*:\s*"([^"]*)')
+_CODE_FENCE_RE = re.compile(r'\A```(?:json)?|```\Z')
+
+# Reasoning prefixes of scores that record a failed judgment rather than a verdict
+_ERROR_REASONING_PREFIXES = ("Error during evaluation", "Error parsing judgment")
+
+# Output format for single-criterion judgments
+_OUTPUT_FORMAT_BLOCK: Final[str] = """**REQUIRED OUTPUT FORMAT (JSON only):**
+{
+    "score": <float between 0.0 and 1.0>,
+    "reasoning": "<detailed explanation of your score, including specific examples from the response>"
+}
+
+Provide your evaluation now:
+"""
 
 
 class LLMJudge:
@@ -52,18 +138,82 @@ class LLMJudge:
         # This includes: provider, name, temperature, max_tokens
         self.model_config = config.get("models", {}).get("judge", {})
 
+        # Ask Groq for a guaranteed-valid JSON object on every call (models.judge.json_mode),
+        # which lets judgments be parsed strictly without the truncation recovery
+        self.json_mode = self.model_config.get("json_mode", True)
+
         # Load evaluation criteria from config.yaml (evaluation.criteria)
         # Each criterion has: name, weight, description
         self.criteria = config.get("evaluation", {}).get("criteria", [])
+        # Criteria are fixed after construction: unpack (name, weight, description)
+        # and total the weights once instead of on every evaluation
+        self._criteria_prepared = tuple(
+            (c.get("name", "unknown"), float(c.get("weight", 1.0)), c.get("description", ""))
+            for c in self.criteria
+        )
+        self._criterion_weights = tuple(weight for _, weight, _ in self._criteria_prepared)
+        self._total_weight = sum(self._criterion_weights)
+
+        # Token budget for each judged response (evaluation.response_max_tokens);
+        # 0 or tiktoken missing falls back to the 2000-character cut
+        self.response_max_tokens = int(config.get("evaluation", {}).get("response_max_tokens", 0))
+        if self.response_max_tokens and not TIKTOKEN_AVAILABLE:
+            self.logger.warning("tiktoken not installed, truncating judged responses by characters")
+
+        # Score all criteria in one judge call (per-criterion calls remain the fallback)
+        self.combine_criteria = config.get("evaluation", {}).get("combine_criteria", True)
+
+        # In-memory LRU of judge completions keyed by SHA-256 of the full request
+        # (0 disables it)
+        self.completion_cache_size = int(config.get("evaluation", {}).get("completion_cache_size", 512))
+        self._completion_cache: "OrderedDict[str, str]" = OrderedDict()
+
+        # Upper bound on in-flight Groq requests from this judge, however many
+        # criteria/perspectives/responses are being judged at once. The semaphore is
+        # created on first use so it binds to the running event loop
+        self.request_concurrency = int(config.get("evaluation", {}).get("judge_request_concurrency", 8))
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+
+        # Re-score later responses to an already judged query against the earlier
+        # verdict instead of the full prompt, with a full re-score every k-th time
+        session_config = config.get("evaluation", {}).get("session_delta", {})
+        self.session_delta_enabled = session_config.get("enabled", False)
+        self.session_audit_every = int(session_config.get("audit_every", 5))
+        self._session_prev: Dict[tuple, tuple] = {}
+        self._session_delta_calls = 0
 
         # Initialize Groq client (similar to what we tried in Lab 5)
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             self.logger.warning("GROQ_API_KEY not found in environment")
-        self.client = Groq(api_key=api_key) if api_key else None
+        # Async client, so judge calls don't block the event loop and concurrent
+        # criteria/perspectives/queries actually overlap on the network
+        self._http_client = None
+        self.client = None
+        if api_key:
+            self._http_client = DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+            # Rate limits (429), 5xx responses and connection errors are retried by the
+            # SDK with jittered exponential backoff (0.5s doubling up to 8s, honouring
+            # Retry-After) before a criterion is scored as an error
+            self.client = AsyncGroq(
+                api_key=api_key,
+                http_client=self._http_client,
+                max_retries=int(self.model_config.get("max_retries", 3))
+            )
 
         self.logger.info(f"LLMJudge initialized with {len(self.criteria)} criteria")
 
+    async def close(self):
+        """Close the judge's HTTP connection pool."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
+    async def __aenter__(self) -> "LLMJudge":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
     async def evaluate(
         self,
         query: str,
@@ -83,46 +233,684 @@ class LLMJudge:
             judge_perspective: Optional judge perspective name (e.g., "comprehensive_rubric", "ethical_expert")
 
         Returns:
-            Dictionary with scores for each criterion and overall score
+            Dictionary with scores for each criterion and overall score
+        """
+        self.logger.info(f"Evaluating response for query: {query[:50]}...")
+        if judge_perspective:
+            self.logger.info(f"Using judge perspective: {judge_perspective}")
+
+        results = {
+            "query": query,
+            "judge_perspective": judge_perspective or "default",
+            "overall_score": 0.0,
+            "criterion_scores": {},
+            "feedback": [],
+        }
+
+        session_scores = self._session_delta_scores(query, response, ground_truth, judge_perspective)
+        if session_scores is not None:
+            scores = await session_scores
+        else:
+            scores = await self._score_criteria(
+                query=query,
+                response=response,
+                sources=sources,
+                ground_truth=ground_truth,
+                judge_perspective=judge_perspective
+            )
+
+        for (criterion_name, _, _), score in zip(self._criteria_prepared, scores):
+            results["criterion_scores"][criterion_name] = score
+
+            # Only full-prompt verdicts become the baseline for later delta re-scores,
+            # so delta scores never build on each other
+            if (
+                self.session_delta_enabled
+                and session_scores is None
+                and not score.get("reasoning", "").startswith(_ERROR_REASONING_PREFIXES)
+            ):
+                self._session_prev[(query, criterion_name, judge_perspective)] = (response, score)
+
+        # Calculate overall score
+        results["overall_score"] = self._overall_score(scores)
+
+        return results
+
+    def _overall_score(self, scores: Iterable[Dict[str, Any]]) -> float:
+        """
+        Weighted mean of per-criterion scores.
+
+        Args:
+            scores: Score dicts in the same order as self.criteria
+
+        Returns:
+            Overall score (0.0 when the criterion weights don't sum to a positive total)
+        """
+        if self._total_weight <= 0:
+            return 0.0
+        score_values = [score.get("score", 0.0) for score in scores]
+        return sum(map(operator.mul, score_values, self._criterion_weights)) / self._total_weight
+
+    async def _score_criteria(
+        self,
+        query: str,
+        response: str,
+        sources: Optional[List[Dict[str, Any]]],
+        ground_truth: Optional[str],
+        judge_perspective: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Score the response on every criterion with full judge prompts.
+
+        Args:
+            query: Original query
+            response: System response
+            sources: Sources used
+            ground_truth: Optional ground truth
+            judge_perspective: Optional judge perspective name
+
+        Returns:
+            Score dicts in the same order as self.criteria
+        """
+        if self.combine_criteria and len(self.criteria) > 1:
+            try:
+                combined = await self._judge_all_criteria(
+                    query=query,
+                    response=response,
+                    sources=sources,
+                    ground_truth=ground_truth,
+                    judge_perspective=judge_perspective
+                )
+            except Exception as e:
+                self.logger.warning(f"Combined judgment failed ({e}), judging criteria individually")
+            else:
+                return [combined[criterion.get("name", "unknown")] for criterion in self.criteria]
+
+        # Evaluate all criteria concurrently; each is an independent judge call
+        self.logger.info(f"Evaluating {len(self.criteria)} criteria")
+        scores = await asyncio.gather(
+            *(
+                self._judge_criterion(
+                    criterion=criterion,
+                    query=query,
+                    response=response,
+                    sources=sources,
+                    ground_truth=ground_truth,
+                    judge_perspective=judge_perspective
+                )
+                for criterion in self.criteria
+            ),
+            return_exceptions=True
+        )
+
+        for i, (criterion, score) in enumerate(zip(self.criteria, scores)):
+            if isinstance(score, Exception):
+                criterion_name = criterion.get("name", "unknown")
+                self.logger.error(f"Error judging criterion {criterion_name}: {score}")
+                scores[i] = {
+                    "score": 0.0,
+                    "reasoning": f"Error during evaluation: {str(score)}",
+                    "criterion": criterion_name
+                }
+
+        return scores
+
+    def _session_delta_scores(
+        self,
+        query: str,
+        response: str,
+        ground_truth: Optional[str],
+        judge_perspective: Optional[str]
+    ):
+        """
+        Plan a delta re-score against verdicts from earlier responses to the same query.
+
+        Returns None (take the full path) when session delta judging is off, when
+        any criterion has no previous verdict for this query and perspective, or
+        when this call is due for a full-recompute audit.
+
+        Args:
+            query: Original query
+            response: System response
+            ground_truth: Optional ground truth
+            judge_perspective: Optional judge perspective name
+
+        Returns:
+            Awaitable resolving to score dicts in self.criteria order, or None
+        """
+        if not self.session_delta_enabled or not self.criteria:
+            return None
+
+        previous = [
+            self._session_prev.get((query, criterion.get("name", "unknown"), judge_perspective))
+            for criterion in self.criteria
+        ]
+        if any(entry is None for entry in previous):
+            return None
+
+        self._session_delta_calls += 1
+        if self.session_audit_every > 0 and self._session_delta_calls % self.session_audit_every == 0:
+            self.logger.info("Session delta audit: re-scoring with full prompts")
+            return None
+
+        return asyncio.gather(
+            *(
+                self._judge_criterion_delta(
+                    criterion=criterion,
+                    query=query,
+                    prev_response=prev_response,
+                    new_response=response,
+                    prev_verdict=prev_verdict,
+                    ground_truth=ground_truth,
+                    judge_perspective=judge_perspective
+                )
+                for criterion, (prev_response, prev_verdict) in zip(self.criteria, previous)
+            )
+        )
+
+    async def _judge_criterion_delta(
+        self,
+        criterion: Dict[str, Any],
+        query: str,
+        prev_response: str,
+        new_response: str,
+        prev_verdict: Dict[str, Any],
+        ground_truth: Optional[str] = None,
+        judge_perspective: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Re-score one criterion for a new response, given the verdict on a previous one.
+
+        The sources, scoring rubric and other criteria are not re-sent; the judge
+        sees the previous score and reasoning plus the new response.
+
+        Args:
+            criterion: Criterion configuration
+            query: Original query
+            prev_response: Previously judged response to the same query
+            new_response: Response to score
+            prev_verdict: Score dict returned for prev_response
+            ground_truth: Optional ground truth
+            judge_perspective: Optional judge perspective name
+
+        Returns:
+            Score and feedback for this criterion
+        """
+        if new_response == prev_response:
+            return prev_verdict
+
+        criterion_name = criterion.get("name", "unknown")
+        prompt = self._create_delta_prompt(
+            criterion_name=criterion_name,
+            description=criterion.get("description", ""),
+            query=query,
+            delta=new_response,
+            previous_score=prev_verdict.get("score", 0.0),
+            previous_reasoning=prev_verdict.get("reasoning", ""),
+            ground_truth=ground_truth,
+            judge_perspective=judge_perspective,
+            replaces_response=True
+        )
+        return await self._score_prompt(prompt, criterion_name, judge_perspective, action="delta-judging")
+
+    async def evaluate_batch(
+        self,
+        examples: List[Dict[str, Any]],
+        judge_perspective: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate several responses with one judge call per criterion.
+
+        All responses are packed into a single prompt and the judge returns a
+        JSON array of scores. If a batched judgment can't be parsed, that
+        criterion falls back to judging each response on its own.
+
+        Args:
+            examples: Dicts with query, response and optional sources/ground_truth
+            judge_perspective: Optional judge perspective name
+
+        Returns:
+            One evaluate()-shaped result per example, in the same order
+        """
+        self.logger.info(f"Batch-evaluating {len(examples)} responses")
+
+        results = [
+            {
+                "query": example.get("query", ""),
+                "judge_perspective": judge_perspective or "default",
+                "overall_score": 0.0,
+                "criterion_scores": {},
+                "feedback": [],
+            }
+            for example in examples
+        ]
+        if not examples:
+            return results
+
+        for criterion, (criterion_name, _, description) in zip(self.criteria, self._criteria_prepared):
+            prompt = self._create_batch_prompt(
+                criterion_name=criterion_name,
+                description=description,
+                examples=examples,
+                judge_perspective=judge_perspective
+            )
+
+            try:
+                judgment = await self._call_judge_llm(prompt, judge_perspective)
+                scores = [
+                    {"score": score_value, "reasoning": reasoning, "criterion": criterion_name}
+                    for score_value, reasoning in self._parse_batch_judgment(judgment, len(examples))
+                ]
+            except Exception as e:
+                self.logger.warning(f"Batch judgment for {criterion_name} failed ({e}), judging individually")
+                # The examples are independent, so retry them concurrently (the
+                # request semaphore still caps in-flight calls)
+                scores = await asyncio.gather(
+                    *(
+                        self._judge_criterion(
+                            criterion=criterion,
+                            query=example.get("query", ""),
+                            response=example.get("response", ""),
+                            sources=example.get("sources"),
+                            ground_truth=example.get("ground_truth"),
+                            judge_perspective=judge_perspective
+                        )
+                        for example in examples
+                    )
+                )
+
+            for result, score in zip(results, scores):
+                result["criterion_scores"][criterion_name] = score
+
+        for result in results:
+            result["overall_score"] = self._overall_score(result["criterion_scores"].values())
+
+        return results
+
+    async def evaluate_delta(
+        self,
+        query: str,
+        delta: str,
+        previous_verdict: Dict[str, Any],
+        ground_truth: Optional[str] = None,
+        judge_perspective: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Re-score a response that extends an already judged one.
+
+        Only the appended text and the previous per-criterion verdicts are sent
+        to the judge, which is asked to revise each score in light of the new
+        content.
+
+        Args:
+            query: The original query
+            delta: Text appended to the previously judged response
+            previous_verdict: Result of the earlier evaluate() call
+            ground_truth: Optional ground truth/expected response
+            judge_perspective: Optional judge perspective name
+
+        Returns:
+            Dictionary with scores for each criterion and overall score
+        """
+        self.logger.info(f"Delta-evaluating response for query: {query[:50]}...")
+
+        results = {
+            "query": query,
+            "judge_perspective": judge_perspective or "default",
+            "overall_score": 0.0,
+            "criterion_scores": {},
+            "feedback": [],
+            "delta_evaluation": True,
+        }
+
+        previous_scores = previous_verdict.get("criterion_scores", {})
+
+        for criterion_name, _, description in self._criteria_prepared:
+            previous = previous_scores.get(criterion_name, {})
+
+            prompt = self._create_delta_prompt(
+                criterion_name=criterion_name,
+                description=description,
+                query=query,
+                delta=delta,
+                previous_score=previous.get("score", 0.0),
+                previous_reasoning=previous.get("reasoning", ""),
+                ground_truth=ground_truth,
+                judge_perspective=judge_perspective
+            )
+
+            results["criterion_scores"][criterion_name] = await self._score_prompt(
+                prompt, criterion_name, judge_perspective, action="delta-judging"
+            )
+
+        results["overall_score"] = self._overall_score(results["criterion_scores"].values())
+
+        return results
+
+    def _create_delta_prompt(
+        self,
+        criterion_name: str,
+        description: str,
+        query: str,
+        delta: str,
+        previous_score: float,
+        previous_reasoning: str,
+        ground_truth: Optional[str],
+        judge_perspective: Optional[str] = None,
+        replaces_response: bool = False
+    ) -> str:
+        """
+        Create a prompt asking the judge to revise an earlier score given appended content.
+
+        Args:
+            criterion_name: Name of the criterion
+            description: Detailed description of the criterion
+            query: Original query
+            delta: Text appended to the previously judged response, or the whole
+                new response when replaces_response is set
+            previous_score: Score given to the earlier response
+            previous_reasoning: Reasoning given for the earlier score
+            ground_truth: Optional ground truth/expected response
+            judge_perspective: Judge perspective name
+            replaces_response: Score delta as a different response to the same
+                query, calibrated against the earlier score
+
+        Returns:
+            Formatted prompt string
+        """
+        perspective_instructions = self._get_perspective_instructions(judge_perspective)
+
+        if replaces_response:
+            intro = "You previously evaluated a research response about Ethical AI in Education. A different response to the same query is shown below."
+            content_heading = "NEW RESPONSE TO EVALUATE"
+            task = f'Evaluate the new response on the criterion "{criterion_name}", using your previous evaluation as the calibration point for your score.'
+            reasoning_hint = "explanation of your score, noting how the new response compares with the previous one"
+        else:
+            intro = "You previously evaluated a research response about Ethical AI in Education. The response has since been extended; only the new content is shown below."
+            content_heading = "CONTENT ADDED TO THE RESPONSE"
+            task = f'Revise your evaluation of the full response (the earlier part plus the added content) on the criterion "{criterion_name}". Keep your previous score unless the added content changes it.'
+            reasoning_hint = "explanation of your score, noting what the added content changed"
+
+        prompt = f"""{perspective_instructions}
+
+{intro}
+
+**EVALUATION CRITERION: {criterion_name.upper().replace('_', ' ')}**
+
+**Criterion Description:**
+{description}
+
+**ORIGINAL QUERY:**
+{query}
+
+**YOUR PREVIOUS EVALUATION:**
+Score: {previous_score:.2f}
+Reasoning: {previous_reasoning}
+
+**{content_heading}:**
+{self._truncate_response(delta)}
+"""
+
+        if ground_truth:
+            prompt += f"""
+**EXPECTED/GROUND TRUTH RESPONSE (for reference):**
+{ground_truth}
+"""
+
+        prompt += f"""
+**YOUR TASK:**
+{task}
+
+**REQUIRED OUTPUT FORMAT (JSON only):**
+{{
+    "score": <float between 0.0 and 1.0>,
+    "reasoning": "<{reasoning_hint}>"
+}}
+
+Provide your evaluation now:
+"""
+
+        return prompt
+
+    async def _judge_all_criteria(
+        self,
+        query: str,
+        response: str,
+        sources: Optional[List[Dict[str, Any]]],
+        ground_truth: Optional[str],
+        judge_perspective: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Score every criterion with a single judge call.
+
+        The query, response, sources and ground truth are sent once instead of
+        once per criterion.
+
+        Args:
+            query: Original query
+            response: System response
+            sources: Sources used
+            ground_truth: Optional ground truth
+            judge_perspective: Optional judge perspective name
+
+        Returns:
+            Criterion name -> score dict (same shape as _judge_criterion)
+
+        Raises:
+            ValueError: If the judgment doesn't score every criterion
+        """
+        prompt = self._create_multi_criterion_prompt(
+            query=query,
+            response=response,
+            sources=sources,
+            ground_truth=ground_truth,
+            judge_perspective=judge_perspective
+        )
+        judgment = await self._call_judge_llm(
+            prompt,
+            judge_perspective,
+            response_format={"type": "json_object"}
+        )
+        return self._parse_multi_criterion_judgment(judgment)
+
+    def _create_multi_criterion_prompt(
+        self,
+        query: str,
+        response: str,
+        sources: Optional[List[Dict[str, Any]]],
+        ground_truth: Optional[str],
+        judge_perspective: Optional[str] = None
+    ) -> str:
+        """
+        Create a prompt asking the judge to score the response on every criterion at once.
+
+        Args:
+            query: Original query
+            response: System response to evaluate
+            sources: Sources used in the response
+            ground_truth: Optional ground truth/expected response
+            judge_perspective: Judge perspective name
+
+        Returns:
+            Formatted prompt string
+        """
+        perspective_instructions = self._get_perspective_instructions(judge_perspective)
+
+        parts = [f"""{perspective_instructions}
+
+You are evaluating a research response about Ethical AI in Education. The response was generated by a multi-agent research system.
+
+**EVALUATION CRITERIA:**
+"""]
+        for criterion in self.criteria:
+            criterion_name = criterion.get("name", "unknown")
+            parts.append(f"""
+**{criterion_name.upper().replace('_', ' ')}** (key: "{criterion_name}")
+{criterion.get("description", "")}
+""")
+
+        parts.append(f"""
+**ORIGINAL QUERY:**
+{query}
+
+**SYSTEM RESPONSE TO EVALUATE:**
+{self._truncate_response(response)}
+""")
+
+        if sources:
+            parts.append(f"\n**SOURCES USED:** {len(sources)} sources")
+            parts.append("\nSource types: " + ", ".join(dict.fromkeys(s.get("type", "unknown") for s in sources[:5])))
+
+        if ground_truth:
+            parts.append(f"""
+
+**EXPECTED/GROUND TRUTH RESPONSE (for reference):**
+{ground_truth}
+""")
+
+        example_keys = ",\n".join(
+            f'    "{criterion.get("name", "unknown")}": {{"score": <float between 0.0 and 1.0>, "reasoning": "<explanation>"}}'
+            for criterion in self.criteria
+        )
+        parts.append(f"""
+
+{_RUBRIC_BLOCK}
+**YOUR TASK:**
+Evaluate the system response on each criterion above independently, citing specific examples from the response.
+
+**REQUIRED OUTPUT FORMAT (JSON only):**
+{{
+{example_keys}
+}}
+
+Provide your evaluation now:
+""")
+
+        return "".join(parts)
+
+    def _parse_multi_criterion_judgment(self, judgment: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse a combined judgment into per-criterion score dicts.
+
+        Args:
+            judgment: Raw judge output
+
+        Returns:
+            Criterion name -> score dict
+
+        Raises:
+            ValueError: If the output isn't JSON or a criterion is missing or unscored
+        """
+        result = _json_loads(self._strip_code_fence(judgment))
+        if not isinstance(result, dict):
+            raise ValueError("Expected a JSON object keyed by criterion")
+
+        scores = {}
+        for criterion in self.criteria:
+            criterion_name = criterion.get("name", "unknown")
+            entry = result.get(criterion_name)
+            if not isinstance(entry, dict) or "score" not in entry:
+                raise ValueError(f"No score for criterion {criterion_name}")
+            scores[criterion_name] = {
+                "score": max(0.0, min(1.0, float(entry["score"]))),
+                "reasoning": entry.get("reasoning", ""),
+                "criterion": criterion_name
+            }
+        return scores
+
+    @staticmethod
+    def _strip_code_fence(judgment: str) -> str:
+        """Remove a surrounding ```json ... ``` fence, if any."""
+        return _CODE_FENCE_RE.sub("", judgment.strip()).strip()
+
+    def _create_batch_prompt(
+        self,
+        criterion_name: str,
+        description: str,
+        examples: List[Dict[str, Any]],
+        judge_perspective: Optional[str] = None
+    ) -> str:
+        """
+        Create a prompt asking the judge to score several responses on one criterion.
+
+        Args:
+            criterion_name: Name of the criterion
+            description: Detailed description of the criterion
+            examples: Dicts with query, response and optional sources/ground_truth
+            judge_perspective: Judge perspective name
+
+        Returns:
+            Formatted prompt string
         """
-        self.logger.info(f"Evaluating response for query: {query[:50]}...")
-        if judge_perspective:
-            self.logger.info(f"Using judge perspective: {judge_perspective}")
+        perspective_instructions = self._get_perspective_instructions(judge_perspective)
 
-        results = {
-            "query": query,
-            "judge_perspective": judge_perspective or "default",
-            "overall_score": 0.0,
-            "criterion_scores": {},
-            "feedback": [],
-        }
+        parts = [f"""{perspective_instructions}
 
-        total_weight = sum(c.get("weight", 1.0) for c in self.criteria)
-        weighted_score = 0.0
+You are evaluating {len(examples)} research responses about Ethical AI in Education. Each was generated by a multi-agent research system for its own query. Judge each response independently.
 
-        # Evaluate each criterion
-        for criterion in self.criteria:
-            criterion_name = criterion.get("name", "unknown")
-            weight = criterion.get("weight", 1.0)
+**EVALUATION CRITERION: {criterion_name.upper().replace('_', ' ')}**
 
-            self.logger.info(f"Evaluating criterion: {criterion_name}")
+**Criterion Description:**
+{description}
+"""]
 
-            score = await self._judge_criterion(
-                criterion=criterion,
-                query=query,
-                response=response,
-                sources=sources,
-                ground_truth=ground_truth,
-                judge_perspective=judge_perspective
-            )
+        for i, example in enumerate(examples, 1):
+            part = f"""
+### RESPONSE {i}
 
-            results["criterion_scores"][criterion_name] = score
-            weighted_score += score.get("score", 0.0) * weight
+**QUERY:**
+{example.get("query", "")}
 
-        # Calculate overall score
-        results["overall_score"] = weighted_score / total_weight if total_weight > 0 else 0.0
+**SYSTEM RESPONSE:**
+{self._truncate_response(example.get("response", ""))}
+"""
+            sources = example.get("sources")
+            if sources:
+                part += f"\n**SOURCES USED:** {len(sources)} sources\n"
+            if example.get("ground_truth"):
+                part += f"\n**EXPECTED/GROUND TRUTH RESPONSE (for reference):**\n{example['ground_truth']}\n"
+            parts.append(part)
+
+        parts.append(f"""
+{_RUBRIC_BLOCK}
+**REQUIRED OUTPUT FORMAT (JSON only):**
+A JSON object whose "evaluations" array holds exactly {len(examples)} objects, one per response in order:
+{{
+    "evaluations": [
+        {{"score": <float between 0.0 and 1.0>, "reasoning": "<one or two sentences>"}}
+    ]
+}}
 
-        return results
+Provide your evaluation now:
+""")
+
+        return "".join(parts)
+
+    def _parse_batch_judgment(self, judgment: str, expected: int) -> List[tuple]:
+        """
+        Parse a batched judgment into (score, reasoning) pairs.
+
+        Args:
+            judgment: Raw judge output
+            expected: Number of responses that were judged
+
+        Returns:
+            One (score, reasoning) tuple per response
+
+        Raises:
+            ValueError: If the output doesn't hold a JSON array of the expected length
+        """
+        items = _json_loads(self._strip_code_fence(judgment))
+        if isinstance(items, dict):
+            # The array is requested wrapped in an object (JSON mode only returns objects)
+            items = next((v for v in items.values() if isinstance(v, list)), None)
+        if not isinstance(items, list) or len(items) != expected:
+            raise ValueError(f"Expected a JSON array of {expected} judgments")
+
+        return [
+            (max(0.0, min(1.0, float(item.get("score", 0.0)))), item.get("reasoning", ""))
+            for item in items
+        ]
 
     async def _judge_criterion(
         self,
@@ -162,25 +950,44 @@ class LLMJudge:
         )
 
         # Call LLM API to get judgment
+        return await self._score_prompt(prompt, criterion_name, judge_perspective)
+
+    async def _score_prompt(
+        self,
+        prompt: str,
+        criterion_name: str,
+        judge_perspective: Optional[str] = None,
+        action: str = "judging"
+    ) -> Dict[str, Any]:
+        """
+        Send a single-criterion prompt to the judge and parse the verdict.
+
+        Args:
+            prompt: Judge prompt asking for one score
+            criterion_name: Name of the criterion being scored
+            judge_perspective: Optional judge perspective name
+            action: What the call is doing, for the error log
+
+        Returns:
+            Score and feedback for this criterion (score 0.0 on API errors)
+        """
         try:
             judgment = await self._call_judge_llm(prompt, judge_perspective)
             score_value, reasoning = self._parse_judgment(judgment)
 
-            score = {
+            return {
                 "score": score_value,  # 0-1 scale
                 "reasoning": reasoning,
                 "criterion": criterion_name
             }
         except Exception as e:
-            self.logger.error(f"Error judging criterion {criterion_name}: {e}")
-            score = {
+            self.logger.error(f"Error {action} criterion {criterion_name}: {e}")
+            return {
                 "score": 0.0,
                 "reasoning": f"Error during evaluation: {str(e)}",
                 "criterion": criterion_name
             }
 
-        return score
-
     def _create_judge_prompt(
         self,
         criterion_name: str,
@@ -209,7 +1016,7 @@ class LLMJudge:
         # Get perspective-specific system instructions
         perspective_instructions = self._get_perspective_instructions(judge_perspective)
 
-        prompt = f"""{perspective_instructions}
+        parts = [f"""{perspective_instructions}
 
 You are evaluating a research response about Ethical AI in Education. The response was generated by a multi-agent research system.
 
@@ -223,33 +1030,25 @@ You are evaluating a research response about Ethical AI in Education. The respon
 
 **SYSTEM RESPONSE TO EVALUATE:**
 {self._truncate_response(response)}
-"""
+"""]
 
         # Add sources information if available
         if sources:
-            sources_info = f"\n**SOURCES USED:** {len(sources)} sources"
-            if len(sources) > 0:
-                sources_info += "\nSource types: " + ", ".join(set(s.get("type", "unknown") for s in sources[:5]))
-            prompt += sources_info
+            parts.append(f"\n**SOURCES USED:** {len(sources)} sources")
+            parts.append("\nSource types: " + ", ".join(dict.fromkeys(s.get("type", "unknown") for s in sources[:5])))
 
         # Add ground truth if available
         if ground_truth:
-            prompt += f"""
+            parts.append(f"""
 
 **EXPECTED/GROUND TRUTH RESPONSE (for reference):**
 {ground_truth}
-"""
+""")
 
         # Add scoring rubric
-        prompt += f"""
-
-**SCORING RUBRIC:**
-- 0.0-0.3: Poor - Major deficiencies, does not meet criterion
-- 0.4-0.5: Below Average - Significant gaps or issues
-- 0.6-0.7: Average - Meets basic requirements but has notable weaknesses
-- 0.8-0.9: Good - Strong performance with minor areas for improvement
-- 0.9-1.0: Excellent - Outstanding performance, exceeds expectations
+        parts.append(f"""
 
+{_RUBRIC_BLOCK}
 **YOUR TASK:**
 Evaluate the system response specifically on the criterion "{criterion_name}" for the query about Ethical AI in Education.
 
@@ -258,16 +1057,9 @@ Consider:
 2. Are there strengths or weaknesses specific to this criterion?
 3. How does this relate to Ethical AI in Education contexts?
 
-**REQUIRED OUTPUT FORMAT (JSON only):**
-{{
-    "score": <float between 0.0 and 1.0>,
-    "reasoning": "<detailed explanation of your score, including specific examples from the response>"
-}}
-
-Provide your evaluation now:
-"""
+{_OUTPUT_FORMAT_BLOCK}""")
 
-        return prompt
+        return "".join(parts)
 
     def _truncate_response(self, response: str, max_length: int = 2000) -> str:
         """
@@ -280,60 +1072,76 @@ Provide your evaluation now:
         Returns:
             Truncated response with indicator if truncated
         """
+        if self.response_max_tokens and TIKTOKEN_AVAILABLE:
+            return self._truncate_response_tokens(response, self.response_max_tokens)
+
         if len(response) <= max_length:
             return response
 
-        # Truncate but keep the beginning (most important content)
-        truncated = response[:max_length]
-        # Try to truncate at a sentence boundary if possible
-        last_period = truncated.rfind('.')
-        last_newline = truncated.rfind('\n')
-        cutoff = max(last_period, last_newline)
-
-        if cutoff > max_length * 0.8:  # Only use boundary if it's not too early
-            truncated = truncated[:cutoff + 1]
+        # Truncate but keep the beginning (most important content), at a sentence
+        # boundary if one falls in the last 20% of the kept text (an earlier
+        # boundary would cut too much, so only that window is searched)
+        window_start = int(max_length * 0.8) + 1
+        cutoff = max(
+            response.rfind('.', window_start, max_length),
+            response.rfind('\n', window_start, max_length)
+        )
+        truncated = response[:cutoff + 1] if cutoff >= 0 else response[:max_length]
 
         return truncated + f"\n\n[Response truncated for evaluation - original length: {len(response)} characters]"
 
-    def _get_perspective_instructions(self, judge_perspective: Optional[str]) -> str:
+    def _truncate_response_tokens(self, response: str, max_tokens: int) -> str:
         """
-        Get perspective-specific instructions for the judge.
+        Truncate system response to a token budget (what the judge API bills for).
 
         Args:
-            judge_perspective: Name of the judge perspective
+            response: Full system response
+            max_tokens: Maximum number of tokens to keep
 
         Returns:
-            Instructions string for the judge
+            Truncated response with indicator if truncated
         """
-        if judge_perspective == "comprehensive_rubric":
-            return """You are an expert evaluator using a comprehensive rubric-based approach. You evaluate research responses systematically across multiple dimensions, providing detailed, structured assessments. Your evaluations are thorough, objective, and based on clear criteria. You consider all aspects of the response and provide balanced feedback."""
+        # Every token covers at least one character, so short responses fit without encoding
+        if len(response) <= max_tokens:
+            return response
 
-        elif judge_perspective == "ethical_expert":
-            return """You are an expert in Ethical AI in Education with deep knowledge of:
-- AI ethics principles and frameworks
-- Educational technology ethics
-- Student privacy and data protection (FERPA, COPPA)
-- Algorithmic bias and fairness in educational contexts
-- Transparency, accountability, and explainability in educational AI
-- Pedagogical implications of AI systems
+        global _token_encoding
+        if _token_encoding is None:
+            _token_encoding = tiktoken.get_encoding(_TOKEN_ENCODING_NAME)
 
-You evaluate responses from the perspective of someone who understands both the technical aspects of AI and the ethical considerations specific to educational settings. You pay special attention to:
-- Practical applicability to educational contexts
-- Consideration of multiple stakeholder perspectives (students, educators, parents, institutions)
-- Alignment with established ethical frameworks
-- Real-world implications and potential harms
-- Balance between innovation and ethical safeguards
+        tokens = _token_encoding.encode(response, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return response
 
-Your evaluations are informed by both theoretical understanding and practical experience with ethical AI in education."""
+        return _token_encoding.decode(tokens[:max_tokens]) + f"\n\n[Response truncated for evaluation - original length: {len(response)} characters]"
 
-        else:
-            # Default perspective
-            return """You are an expert evaluator specializing in research quality assessment. You evaluate responses based on established academic and professional standards, considering relevance, evidence quality, accuracy, safety, and clarity."""
+    def _get_perspective_instructions(self, judge_perspective: Optional[str]) -> str:
+        """
+        Get perspective-specific instructions for the judge.
+
+        Args:
+            judge_perspective: Name of the judge perspective
+
+        Returns:
+            Instructions string for the judge
+        """
+        return _PERSPECTIVES.get(judge_perspective or "default", _PERSPECTIVES["default"])
 
-    async def _call_judge_llm(self, prompt: str, judge_perspective: Optional[str] = None) -> str:
+    async def _call_judge_llm(
+        self,
+        prompt: str,
+        judge_perspective: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Call LLM API to get judgment.
         Uses model configuration from config.yaml (models.judge section).
+
+        Args:
+            prompt: Judge prompt
+            judge_perspective: Optional judge perspective name (for logging)
+            response_format: Optional Groq response_format; defaults to
+                {"type": "json_object"} when json_mode is enabled
         """
         if not self.client:
             raise ValueError("Groq client not initialized. Check GROQ_API_KEY environment variable.")
@@ -344,58 +1152,97 @@ Your evaluations are informed by both theoretical understanding and practical ex
             temperature = self.model_config.get("temperature", 0.3)
             max_tokens = self.model_config.get("max_tokens", 1024)
 
+            if response_format is None and self.json_mode:
+                response_format = {"type": "json_object"}
+
             self.logger.debug(f"Calling Groq API with model: {model_name} (perspective: {judge_perspective or 'default'})")
 
             # System message based on perspective
             system_message = "You are an expert evaluator. Provide your evaluations in valid JSON format only. Do not include any text outside the JSON object."
 
+            # Identical requests (same prompt and model settings) reuse the earlier completion
+            cache_key = None
+            if self.completion_cache_size:
+                cache_key = hashlib.sha256(
+                    f"{model_name}|{temperature}|{max_tokens}|{json.dumps(response_format, sort_keys=True)}|"
+                    f"{system_message}|{prompt}".encode("utf-8")
+                ).hexdigest()
+                cached = self._completion_cache.get(cache_key)
+                if cached is not None:
+                    self._completion_cache.move_to_end(cache_key)
+                    self.logger.debug("Judge completion cache hit")
+                    return cached
+
+            if self._request_semaphore is None:
+                self._request_semaphore = asyncio.Semaphore(max(1, self.request_concurrency))
+
             # Call Groq API
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_message
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                model=model_name,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+            async with self._request_semaphore:
+                chat_completion = await self.client.chat.completions.create(
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": system_message
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    model=model_name,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **({"response_format": response_format} if response_format else {}),
+                )
 
             response = chat_completion.choices[0].message.content
             self.logger.debug(f"Received response: {response[:100]}...")
 
+            if cache_key is not None and response:
+                self._completion_cache[cache_key] = response
+                if len(self._completion_cache) > self.completion_cache_size:
+                    self._completion_cache.popitem(last=False)
+
             return response
 
         except Exception as e:
             self.logger.error(f"Error calling Groq API: {e}")
             raise
 
-    def _parse_judgment(self, judgment: str) -> tuple:
+    def _parse_judgment(self, judgment: str, strict: Optional[bool] = None) -> tuple:
         """
         Parse LLM judgment response.
-        Handles truncated JSON by attempting to extract score from partial responses.
+
+        In strict mode (the default when json_mode is on) the judgment must be a
+        JSON object with a score. Otherwise truncated JSON is handled by
+        attempting to extract the score from the partial response.
+
+        Args:
+            judgment: Raw judge output
+            strict: Skip the truncation recovery (defaults to self.json_mode)
+
+        Returns:
+            (score, reasoning) tuple
         """
-        import re
+        if strict is None:
+            strict = self.json_mode
+
+        if strict:
+            try:
+                result = _json_loads(self._strip_code_fence(judgment))
+                score = float(result["score"])
+            except (ValueError, KeyError, TypeError) as e:
+                self.logger.error(f"Error parsing judgment: {e}")
+                return 0.0, f"Error parsing judgment: {str(e)}"
+            return max(0.0, min(1.0, score)), result.get("reasoning", "")
 
         try:
             # Clean up the response - remove markdown code blocks if present
-            judgment_clean = judgment.strip()
-            if judgment_clean.startswith("```json"):
-                judgment_clean = judgment_clean[7:]
-            elif judgment_clean.startswith("```"):
-                judgment_clean = judgment_clean[3:]
-            if judgment_clean.endswith("```"):
-                judgment_clean = judgment_clean[:-3]
-            judgment_clean = judgment_clean.strip()
+            judgment_clean = self._strip_code_fence(judgment)
 
             # Try to parse JSON
             try:
-                result = json.loads(judgment_clean)
+                result = _json_loads(judgment_clean)
                 score = float(result.get("score", 0.0))
                 reasoning = result.get("reasoning", "")
             except json.JSONDecodeError:
@@ -403,11 +1250,11 @@ Your evaluations are informed by both theoretical understanding and practical ex
                 self.logger.warning("JSON parse failed, attempting to extract score from truncated response")
 
                 # Try to extract score using regex pattern: "score":0.95 or "score": 0.95
-                score_match = re.search(r'"score"\s*:\s*([0-9.]+)', judgment_clean)
+                score_match = _SCORE_RE.search(judgment_clean)
                 if score_match:
                     score = float(score_match.group(1))
                     # Try to extract reasoning (may be truncated)
-                    reasoning_match = re.search(r'"reasoning"\s*:\s*"([^"]*)', judgment_clean)
+                    reasoning_match = _REASONING_RE.search(judgment_clean)
                     if reasoning_match:
                         reasoning = reasoning_match.group(1)
                         # If reasoning was truncated, indicate it
@@ -429,7 +1276,7 @@ Your evaluations are informed by both theoretical understanding and practical ex
             self.logger.error(f"Raw judgment: {judgment[:200]}")
             # Try one more time with regex extraction
             try:
-                score_match = re.search(r'"score"\s*:\s*([0-9.]+)', judgment)
+                score_match = _SCORE_RE.search(judgment)
                 if score_match:
                     score = float(score_match.group(1))
                     score = max(0.0, min(1.0, score))
@@ -442,27 +1289,304 @@ Your evaluations are informed by both theoretical understanding and practical ex
             return 0.0, f"Error parsing judgment: {str(e)}"
 
 
+class CachedJudge:
+    """
+    On-disk cache in front of an LLMJudge.
+
+    Verdicts are stored as one JSON file per (query, response, sources,
+    ground truth, perspective) under evaluation.judge_cache.path. The key also
+    covers the judge model, criteria and verdict-affecting judge settings, and
+    evaluation.judge_cache.rubric_version can be bumped to invalidate every
+    cached verdict at once.
+    """
+
+    def __init__(self, judge: LLMJudge, config: Dict[str, Any]):
+        """
+        Initialize the cache.
+
+        Args:
+            judge: The judge to call on cache misses
+            config: Configuration dictionary (from config.yaml)
+        """
+        self.judge = judge
+        self.logger = logging.getLogger("evaluation.judge")
+
+        cache_config = config.get("evaluation", {}).get("judge_cache", {})
+        self.cache_dir = Path(cache_config.get("path", ".judge_cache"))
+        self.rubric_version = str(cache_config.get("rubric_version", "1"))
+        self.model_name = judge.model_config.get("name", "")
+        # Everything that shapes the judge prompt but not the call arguments
+        self.criteria_fingerprint = json.dumps(judge.criteria, sort_keys=True, default=str)
+        # Judge settings that change verdicts for the same inputs
+        self.settings_fingerprint = json.dumps({
+            "temperature": judge.model_config.get("temperature"),
+            "max_tokens": judge.model_config.get("max_tokens"),
+            "json_mode": judge.json_mode,
+            "combine_criteria": judge.combine_criteria,
+            "response_max_tokens": judge.response_max_tokens,
+            "session_delta": [judge.session_delta_enabled, judge.session_audit_every],
+        }, sort_keys=True, default=str)
+
+    def _cache_key(
+        self,
+        query: str,
+        response: str,
+        sources: Optional[List[Dict[str, Any]]],
+        ground_truth: Optional[str],
+        judge_perspective: Optional[str]
+    ) -> str:
+        payload = json.dumps({
+            "query": query,
+            "response": response,
+            "sources": sources or [],
+            "ground_truth": ground_truth,
+            "judge_perspective": judge_perspective or "default",
+            "model": self.model_name,
+            "criteria": self.criteria_fingerprint,
+            "settings": self.settings_fingerprint,
+            "rubric_version": self.rubric_version,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def evaluate(
+        self,
+        query: str,
+        response: str,
+        sources: Optional[List[Dict[str, Any]]] = None,
+        ground_truth: Optional[str] = None,
+        judge_perspective: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the cached verdict for these inputs, or evaluate and cache it.
+
+        Args:
+            query: The original query
+            response: The system's response
+            sources: Sources used in the response
+            ground_truth: Optional ground truth/expected response
+            judge_perspective: Optional judge perspective name
+
+        Returns:
+            Dictionary with scores for each criterion and overall score
+        """
+        key = self._cache_key(query, response, sources, ground_truth, judge_perspective)
+        cache_file = self.cache_dir / f"{key}.json"
+
+        result = await asyncio.to_thread(self._read_cache, cache_file)
+        if result is not None:
+            self.logger.info(f"Judge cache hit for perspective {judge_perspective or 'default'}")
+            return result
+
+        result = await self.judge.evaluate(
+            query=query,
+            response=response,
+            sources=sources,
+            ground_truth=ground_truth,
+            judge_perspective=judge_perspective
+        )
+        await asyncio.to_thread(self._write_cache, cache_file, result)
+
+        return result
+
+    def _read_cache(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Return the cached verdict in cache_file, or None on a miss."""
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable judge cache entry {cache_file}: {e}")
+            return None
+
+    def _write_cache(self, cache_file: Path, result: Dict[str, Any]):
+        """Store a verdict, skipping ones that contain API or parse errors."""
+        # Verdicts that hit an API error or malformed judge output would pin a
+        # zero score, so don't keep them
+        if any(
+            score.get("reasoning", "").startswith(_ERROR_REASONING_PREFIXES)
+            for score in result.get("criterion_scores", {}).values()
+        ):
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not write judge cache entry {cache_file}: {e}")
+
+    async def evaluate_batch(
+        self,
+        examples: List[Dict[str, Any]],
+        judge_perspective: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Batch-evaluate only the examples without a cached verdict.
+
+        Args:
+            examples: Dicts with query, response and optional sources/ground_truth
+            judge_perspective: Optional judge perspective name
+
+        Returns:
+            One evaluate()-shaped result per example, in the same order
+        """
+        cache_files = []
+        for example in examples:
+            key = self._cache_key(
+                example.get("query", ""),
+                example.get("response", ""),
+                example.get("sources"),
+                example.get("ground_truth"),
+                judge_perspective
+            )
+            cache_files.append(self.cache_dir / f"{key}.json")
+
+        # Cache lookups are disk reads, so they run off the event loop
+        results: List[Optional[Dict[str, Any]]] = await asyncio.to_thread(
+            lambda: [self._read_cache(cache_file) for cache_file in cache_files]
+        )
+        misses = [
+            (i, example, cache_file)
+            for i, (example, cache_file, result) in enumerate(zip(examples, cache_files, results))
+            if result is None
+        ]
+
+        if misses:
+            self.logger.info(f"Judge cache: {len(examples) - len(misses)} hits, {len(misses)} misses")
+            fresh = await self.judge.evaluate_batch([example for _, example, _ in misses], judge_perspective)
+            for (i, _, _), result in zip(misses, fresh):
+                results[i] = result
+            await asyncio.to_thread(
+                lambda: [self._write_cache(cache_file, result) for (_, _, cache_file), result in zip(misses, fresh)]
+            )
+
+        return results
+
+    async def evaluate_delta(self, *args, **kwargs) -> Dict[str, Any]:
+        """Delta verdicts depend on the previous verdict, so they bypass the cache."""
+        return await self.judge.evaluate_delta(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        # Expose the wrapped judge's attributes (criteria, model_config, ...)
+        return getattr(self.judge, name)
+
+
+class BlockHashCache:
+    """
+    Remembers the paragraph blocks of previously judged responses.
+
+    Entries are keyed by (judge perspective, query prefix). When a new response
+    overlaps an earlier one by at least the configured Jaccard threshold and
+    only adds paragraphs at the end, lookup() returns that tail and the earlier
+    verdict so only the new content has to be judged.
+    """
+
+    def __init__(self, threshold: float = 0.8, prefix_chars: int = 64):
+        """
+        Initialize the block cache.
+
+        Args:
+            threshold: Minimum Jaccard overlap of block hashes to reuse a verdict
+            prefix_chars: Number of leading query characters used to group queries
+        """
+        self.threshold = threshold
+        self.prefix_chars = prefix_chars
+        self._sessions: Dict[tuple, tuple] = {}
+
+    def _session_key(self, judge_name: str, query: str) -> tuple:
+        return judge_name, " ".join(query.lower().split())[:self.prefix_chars]
+
+    @staticmethod
+    def _split_blocks(response: str) -> List[tuple]:
+        """Return (hash, text) for each non-empty paragraph of the response."""
+        return [
+            (hashlib.sha256(block.encode("utf-8")).hexdigest(), block)
+            for block in (part.strip() for part in response.split("\n\n"))
+            if block
+        ]
+
+    def lookup(self, judge_name: str, query: str, response: str) -> Optional[tuple]:
+        """
+        Find a prior verdict the response can be delta-judged against.
+
+        Args:
+            judge_name: Judge perspective name
+            query: The original query
+            response: The response about to be judged
+
+        Returns:
+            (tail_text, previous_verdict), with an empty tail when the blocks are
+            identical, or None when a full evaluation is needed
+        """
+        entry = self._sessions.get(self._session_key(judge_name, query))
+        if entry is None:
+            return None
+        previous_blocks, previous_verdict = entry
+
+        blocks = self._split_blocks(response)
+        hashes = {block_hash for block_hash, _ in blocks}
+        union = hashes | previous_blocks
+        if not union or len(hashes & previous_blocks) / len(union) < self.threshold:
+            return None
+
+        # Matched blocks must all come first; anything new has to be a contiguous tail
+        split = 0
+        while split < len(blocks) and blocks[split][0] in previous_blocks:
+            split += 1
+        if any(block_hash in previous_blocks for block_hash, _ in blocks[split:]):
+            return None
+
+        return "\n\n".join(text for _, text in blocks[split:]), previous_verdict
+
+    def store(self, judge_name: str, query: str, response: str, verdict: Dict[str, Any]):
+        """
+        Record the verdict for a judged response.
+
+        Args:
+            judge_name: Judge perspective name
+            query: The original query
+            response: The judged response
+            verdict: The judge's result for it
+        """
+        blocks = frozenset(block_hash for block_hash, _ in self._split_blocks(response))
+        self._sessions[self._session_key(judge_name, query)] = (blocks, verdict)
+
+
+_example_configs: Dict[str, Dict[str, Any]] = {}
+
 
-async def example_basic_evaluation():
+def _load_example_config(path: str = "config.yaml") -> Dict[str, Any]:
+    """Parse config.yaml for the examples once per process."""
+    config = _example_configs.get(path)
+    if config is None:
+        from src.config_loader import load_yaml_config
+        config = _example_configs[path] = load_yaml_config(path)
+    return config
+
+
+async def example_basic_evaluation(judge: Optional[LLMJudge] = None):
     """
     Example 1: Basic evaluation with LLMJudge
 
+    Args:
+        judge: Optional LLMJudge to reuse across examples
+
     Usage:
         import asyncio
         from src.evaluation.judge import example_basic_evaluation
         asyncio.run(example_basic_evaluation())
     """
-    import yaml
     from dotenv import load_dotenv
 
     load_dotenv()
 
-    # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
-
-    # Initialize judge
-    judge = LLMJudge(config)
+    # Initialize judge (from config.yaml) unless one was passed in
+    if judge is None:
+        judge = LLMJudge(_load_example_config())
 
     # Test case (similar to Lab 5)
     print("=" * 70)
@@ -493,26 +1617,25 @@ async def example_basic_evaluation():
         print()
 
 
-async def example_compare_responses():
+async def example_compare_responses(judge: Optional[LLMJudge] = None):
     """
     Example 2: Compare multiple responses
 
+    Args:
+        judge: Optional LLMJudge to reuse across examples
+
     Usage:
         import asyncio
         from src.evaluation.judge import example_compare_responses
         asyncio.run(example_compare_responses())
     """
-    import yaml
     from dotenv import load_dotenv
 
     load_dotenv()
 
-    # Load config
-    with open("config.yaml", 'r') as f:
-        config = yaml.safe_load(f)
-
-    # Initialize judge
-    judge = LLMJudge(config)
+    # Initialize judge (from config.yaml) unless one was passed in
+    if judge is None:
+        judge = LLMJudge(_load_example_config())
 
     print("=" * 70)
     print("EXAMPLE 2: Compare Multiple Responses")
@@ -530,22 +1653,25 @@ async def example_compare_responses():
     print(f"\nQuery: {query}\n")
     print(f"Ground Truth: {ground_truth}\n")
 
-    results = []
-    for i, response in enumerate(responses, 1):
+    # Judge all responses concurrently (the judge caps in-flight API requests)
+    results = await asyncio.gather(
+        *(
+            judge.evaluate(
+                query=query,
+                response=response,
+                sources=[],
+                ground_truth=ground_truth
+            )
+            for response in responses
+        )
+    )
+
+    for i, (response, result) in enumerate(zip(responses, results), 1):
         print(f"\n{'='*70}")
         print(f"Response {i}:")
         print(f"{response}")
         print(f"{'='*70}")
 
-        result = await judge.evaluate(
-            query=query,
-            response=response,
-            sources=[],
-            ground_truth=ground_truth
-        )
-
-        results.append(result)
-
         print(f"\nOverall Score: {result['overall_score']:.3f}")
         print("\nCriterion Scores:")
         for criterion, score_data in result['criterion_scores'].items():
@@ -563,16 +1689,27 @@ async def example_compare_responses():
     print(f"\nBest Response: Response {best_idx + 1}")
 
 
-# For direct execution
-if __name__ == "__main__":
-    import asyncio
+async def run_examples():
+    """
+    Run both examples on one event loop with one shared judge, so the second
+    example reuses the first one's pooled connections.
+    """
+    from dotenv import load_dotenv
 
-    print("Running LLMJudge Examples\n")
+    load_dotenv()
+
+    async with LLMJudge(_load_example_config()) as judge:
+        # Run example 1
+        await example_basic_evaluation(judge)
+
+        print("\n\n")
 
-    # Run example 1
-    asyncio.run(example_basic_evaluation())
+        # Run example 2
+        await example_compare_responses(judge)
 
-    print("\n\n")
 
-    # Run example 2
-    asyncio.run(example_compare_responses())
+# For direct execution
+if __name__ == "__main__":
+    print("Running LLMJudge Examples\n")
+
+    asyncio.run(run_examples())
@@ -284,6 +284,26 @@ class EvaluationReportGenerator:
         print(f"Report saved to {output_file}")
 
 
+def resolve_string_refs(obj: Any, table: Dict[str, str]) -> Any:
+    """
+    Replace {"$ref": key} pointers written by SystemEvaluator with their strings.
+
+    Args:
+        obj: Loaded evaluation results (or any part of them)
+        table: The results file's interned_strings table
+
+    Returns:
+        obj with every pointer resolved
+    """
+    if isinstance(obj, dict):
+        if len(obj) == 1 and "$ref" in obj:
+            return table[obj["$ref"]]
+        return {k: resolve_string_refs(v, table) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [resolve_string_refs(item, table) for item in obj]
+    return obj
+
+
 def load_and_generate_report(results_path: str, output_path: str, format: str = "markdown"):
     """
     Load evaluation results and generate a report.
@@ -296,6 +316,10 @@ def load_and_generate_report(results_path: str, output_path: str, format: str =
     with open(results_path, 'r') as f:
         report_data = json.load(f)
 
+    interned = report_data.pop("interned_strings", None)
+    if interned:
+        report_data = resolve_string_refs(report_data, interned)
+
     generator = EvaluationReportGenerator(report_data)
     generator.save_report(output_path, format)
 
@@ -7,6 +7,7 @@ and manages a bibliography for research outputs.
 """
 
 from typing import Dict, Any, List, Optional
+import contextvars
 from datetime import datetime
 import re
 import logging
@@ -62,6 +63,8 @@ class CitationTool:
         self.style = style
         self.citations: List[Dict[str, Any]] = []
         self.citation_counter = 0
+        # Title -> citation number, so deduplication is a hash lookup instead of a list scan
+        self._title_index: Dict[Any, int] = {}
 
     def format_citation(self, source: Dict[str, Any]) -> str:
         """
@@ -337,21 +340,20 @@ class CitationTool:
             Citation number/index (1-based)
         """
         # Check if already exists (deduplication by title)
-        for i, existing in enumerate(self.citations):
-            if existing.get("title") == source.get("title"):
-                return i + 1
+        title = source.get("title")
+        existing_num = self._title_index.get(title)
+        if existing_num is not None:
+            return existing_num
 
         # Add new citation
         self.citations.append(source)
         self.citation_counter += 1
+        self._title_index[title] = self.citation_counter
         return self.citation_counter
 
     def get_citation_number(self, source: Dict[str, Any]) -> int:
         """Get the citation number for a source."""
-        for i, existing in enumerate(self.citations):
-            if existing.get("title") == source.get("title"):
-                return i + 1
-        return 0
+        return self._title_index.get(source.get("title"), 0)
 
     def generate_bibliography(self) -> List[str]:
         """
@@ -363,25 +365,51 @@ class CitationTool:
         Returns:
             List of formatted citation strings, sorted alphabetically
         """
-        bibliography = []
-        for source in self.citations:
-            citation = self.format_citation(source)
-            bibliography.append(citation)
-
         # Sort alphabetically (standard for APA and MLA)
-        bibliography.sort()
-
-        return bibliography
+        return sorted(map(self.format_citation, self.citations))
 
     def clear_citations(self):
         """Clear all citations."""
         self.citations = []
         self.citation_counter = 0
+        self._title_index = {}
 
 
 # Module-level citation tool instance for use across the application
 _citation_tool_instance = CitationTool(style="apa")
 
+# Citation list of the query running in the current context, so concurrent queries on
+# one event loop keep separate citations (see use_citation_tool)
+_CURRENT_CITATION_TOOL: contextvars.ContextVar[Optional[CitationTool]] = contextvars.ContextVar(
+    "citation_tool", default=None
+)
+
+
+def _active_citation_tool() -> CitationTool:
+    """Return the current context's citation tool, or the module-level instance outside one."""
+    tool = _CURRENT_CITATION_TOOL.get()
+    return _citation_tool_instance if tool is None else tool
+
+
+def use_citation_tool(tool: CitationTool) -> contextvars.Token:
+    """
+    Make the wrapper functions below use the given citation tool in the current context.
+
+    Tasks created afterwards inherit it, so a whole query run shares one citation list.
+
+    Args:
+        tool: Citation tool holding the query's citations
+
+    Returns:
+        Token to pass to reset_citation_tool when the query is done
+    """
+    return _CURRENT_CITATION_TOOL.set(tool)
+
+
+def reset_citation_tool(token: contextvars.Token) -> None:
+    """Restore the citation tool that was active before use_citation_tool."""
+    _CURRENT_CITATION_TOOL.reset(token)
+
 
 # Synchronous wrapper functions for use with AutoGen tools
 # Note: Using SourceModel in signature for AutoGen schema generation, but accepts dicts at runtime
@@ -407,7 +435,7 @@ def format_citation(source: SourceModel) -> str:
         else:
             source_dict = source
 
-        return _citation_tool_instance.format_citation(source_dict)
+        return _active_citation_tool().format_citation(source_dict)
     except Exception as e:
         logger.error(f"Error in format_citation: {e}", exc_info=True)
         return f"Error formatting citation: {str(e)}"
@@ -427,7 +455,7 @@ def format_citation(source: SourceModel) -> str:
             source_dict = source
             logger.warning(f"Received unexpected type: {type(source)}")
 
-        result = _citation_tool_instance.format_citation(source_dict)
+        result = _active_citation_tool().format_citation(source_dict)
         logger.info(f"format_citation completed successfully, result length: {len(result)}")
         return result
     except Exception as e:
@@ -475,13 +503,13 @@ def add_citation(source: SourceModel) -> str:
             logger.warning(f"Received unexpected type: {type(source)}")
 
         # Check if citation already exists before adding
-        existing_num = _citation_tool_instance.get_citation_number(source_dict)
+        existing_num = _active_citation_tool().get_citation_number(source_dict)
         if existing_num > 0:
             logger.info(f"Citation already exists with number: {existing_num}")
             return f"Citation already exists. Citation number: {existing_num}"
 
         # Add new citation
-        citation_num = _citation_tool_instance.add_citation(source_dict)
+        citation_num = _active_citation_tool().add_citation(source_dict)
         logger.info(f"Citation added successfully with number: {citation_num}")
         return f"Citation added. Citation number: {citation_num}"
     except Exception as e:
@@ -515,7 +543,7 @@ def get_citation_number(source: SourceModel) -> str:
         else:
             source_dict = source
 
-        citation_num = _citation_tool_instance.get_citation_number(source_dict)
+        citation_num = _active_citation_tool().get_citation_number(source_dict)
         if citation_num > 0:
             logger.info(f"Found citation number: {citation_num}")
             return f"Citation number: {citation_num}"
@@ -540,18 +568,15 @@ def generate_bibliography() -> str:
     logger.info("generate_bibliography called")
 
     try:
-        bibliography = _citation_tool_instance.generate_bibliography()
+        bibliography = _active_citation_tool().generate_bibliography()
 
         if not bibliography:
             logger.info("No citations found in bibliography")
             return "No citations have been added yet."
 
         logger.info(f"Generated bibliography with {len(bibliography)} citations")
-        output = f"Bibliography ({len(bibliography)} citations):\n\n"
-        for i, citation in enumerate(bibliography, 1):
-            output += f"{i}. {citation}\n"
-
-        return output
+        entries = "".join(f"{i}. {citation}\n" for i, citation in enumerate(bibliography, 1))
+        return f"Bibliography ({len(bibliography)} citations):\n\n{entries}"
     except Exception as e:
         logger.error(f"Error in generate_bibliography: {e}", exc_info=True)
         return f"Error generating bibliography: {str(e)}"
@@ -567,7 +592,7 @@ def clear_citations() -> str:
     logger.info("clear_citations called")
 
     try:
-        _citation_tool_instance.clear_citations()
+        _active_citation_tool().clear_citations()
         logger.info("All citations cleared successfully")
         return "All citations have been cleared."
     except Exception as e:
@@ -0,0 +1,51 @@
+"""
+Multi Search Tool
+Runs several web and paper searches concurrently.
+
+When the Researcher needs more than one lookup, issuing them through a single
+multi_search call lets them run in parallel, so the tool phase takes as long as
+the slowest search instead of the sum of all of them.
+"""
+
+from typing import List, Optional
+import asyncio
+import logging
+
+from .web_search import web_search
+from .paper_search import paper_search
+
+# Set up logger for multi search
+logger = logging.getLogger("tools.multi_search")
+
+
+async def multi_search(
+    web_queries: Optional[List[str]] = None,
+    paper_queries: Optional[List[str]] = None,
+) -> str:
+    """
+    Run several web and academic paper searches at the same time (for AutoGen tool integration).
+
+    Args:
+        web_queries: Web search queries (optional)
+        paper_queries: Academic paper search queries (optional)
+
+    Returns:
+        Formatted results of every search, in the order the queries were given
+    """
+    web_queries = web_queries or []
+    paper_queries = paper_queries or []
+    logger.info(f"multi_search called with {len(web_queries)} web and {len(paper_queries)} paper queries")
+
+    if not web_queries and not paper_queries:
+        return "No search queries provided."
+
+    # The search wrappers are synchronous (they drive their own event loop),
+    # so each one runs in a worker thread
+    results = await asyncio.gather(
+        *(asyncio.to_thread(web_search, query) for query in web_queries),
+        *(asyncio.to_thread(paper_search, query) for query in paper_queries),
+    )
+
+    labels = [f"Web search: {query}" for query in web_queries]
+    labels += [f"Paper search: {query}" for query in paper_queries]
+    return "\n".join(f"=== {label} ===\n{result}" for label, result in zip(labels, results))
@@ -12,11 +12,11 @@ sys.path.insert(0, str(project_root))
 
 import asyncio
 from typing import Dict, Any
-import yaml
 import logging
 from dotenv import load_dotenv
 
 from src.autogen_orchestrator import AutoGenOrchestrator
+from src.config_loader import load_yaml_config
 
 # Load environment variables
 load_dotenv()
@@ -42,8 +42,7 @@ class CLI:
             config_path: Path to configuration file
         """
         # Load configuration
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_yaml_config(config_path)
 
         # Setup logging
         self._setup_logging()
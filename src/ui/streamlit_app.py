@@ -14,7 +14,6 @@ sys.path.insert(0, str(project_root))
 
 import streamlit as st
 import asyncio
-import yaml
 import logging
 import os
 from datetime import datetime
@@ -23,6 +22,7 @@ from dotenv import load_dotenv
 from io import StringIO
 
 from src.autogen_orchestrator import AutoGenOrchestrator
+from src.config_loader import load_yaml_config
 from src.guardrails import SafetyManager
 from src.ui.agent_status_display import display_agent_status, update_agent_status, clear_agent_status
 
@@ -34,8 +34,7 @@ def load_config():
     """Load configuration file."""
     config_path = Path("config.yaml")
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_yaml_config(config_path)
     return {}
 
 